@@ -0,0 +1,149 @@
+"""
+Benchmark of grades generation used by seed.py.
+
+Compares the current pure-Python paths (validated ORM `Grade` objects and plain
+row tuples) with the NumPy-backed generator. No database connection is needed.
+
+Arguments:
+    --students <int>    Number of students in a single group (default: 20000).
+    --subjects <int>    Number of subjects of the group (default: 8).
+    --repeat <int>      Number of runs of each generator, best one is reported (default: 3).
+
+Example usage:
+    poetry run python ./benchmarks/bench_grade_generation.py --students 50000
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath("src")))
+
+from database.ids import new_uuid
+from database.models import Group, Student, Subject
+from scripts.seed import (
+    generate_grades,
+    generate_group_grade_arrays,
+    iter_grade_rows,
+    import_numpy,
+    iter_grade_rows_numpy,
+)
+
+try:
+    np = import_numpy()
+except RuntimeError:
+    np = None
+
+MAX_GRADES_PER_STUDENT = 20
+GRADE_MIN = 60
+GRADE_MAX = 100
+
+
+def run_orm_objects(students: int, subjects: int) -> int:
+    """Generate validated Grade ORM objects (seed.py ORM mode)."""
+    random.seed(1)
+    group = Group(name="G1", start_date=datetime.date.today())
+    group.subjects = [Subject(title=f"Subject {i + 1}") for i in range(subjects)]
+    group_students = [Student(group=group) for _ in range(students)]
+    grades = generate_grades(
+        group_students, MAX_GRADES_PER_STUDENT, GRADE_MIN, GRADE_MAX
+    )
+    return len(grades)
+
+
+def run_python_rows(student_rows: list[tuple], group_subject_ids: dict) -> int:
+    """Generate grade row tuples with the standard random module."""
+    rows = iter_grade_rows(
+        student_rows,
+        group_subject_ids,
+        MAX_GRADES_PER_STUDENT,
+        GRADE_MIN,
+        GRADE_MAX,
+        rng=random.Random(1),
+    )
+    return sum(1 for _ in rows)
+
+
+def run_numpy_rows(student_rows: list[tuple], group_subject_ids: dict) -> int:
+    """Generate grade row tuples with NumPy (seed.py --numpy flag)."""
+    rows = iter_grade_rows_numpy(
+        student_rows,
+        group_subject_ids,
+        MAX_GRADES_PER_STUDENT,
+        GRADE_MIN,
+        GRADE_MAX,
+        rng=np.random.default_rng(1),
+    )
+    return sum(1 for _ in rows)
+
+
+def run_numpy_arrays(students: int, subjects: int) -> int:
+    """Generate only NumPy arrays of scores and task numbers (no row tuples)."""
+    *_, grades = generate_group_grade_arrays(
+        students,
+        subjects,
+        MAX_GRADES_PER_STUDENT,
+        GRADE_MIN,
+        GRADE_MAX,
+        rng=np.random.default_rng(1),
+    )
+    return int(grades.size)
+
+
+def measure(name: str, func, repeat: int, *args) -> float:
+    """Run the function several times and print the best result."""
+    best = float("inf")
+    generated = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        generated = func(*args)
+        best = min(best, time.perf_counter() - started)
+
+    rate = generated / best if best > 0 else 0.0
+    print(f"    {name + ':':<24}{generated:>12,} grades in {best:8.3f}s ({rate:,.0f} grades/s)")
+    return best
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark grades generation.")
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--subjects", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    group_id = new_uuid()
+    group_subject_ids = {group_id: [new_uuid() for _ in range(args.subjects)]}
+    student_rows = [(new_uuid(), group_id) for _ in range(args.students)]
+
+    print(
+        f"📊 Grades generation for {args.students:,} students "
+        f"and {args.subjects} subjects (best of {args.repeat}):"
+    )
+    orm_time = measure("ORM Grade objects", run_orm_objects, args.repeat, args.students, args.subjects)
+    python_time = measure(
+        "Python row tuples", run_python_rows, args.repeat, student_rows, group_subject_ids
+    )
+
+    if np is None:
+        print("[INFO] NumPy is not installed, vectorised generator is skipped.")
+        return
+
+    numpy_time = measure(
+        "NumPy row tuples", run_numpy_rows, args.repeat, student_rows, group_subject_ids
+    )
+    measure("NumPy arrays only", run_numpy_arrays, args.repeat, args.students, args.subjects)
+
+    print(f"    NumPy rows speedup vs ORM objects:  x{orm_time / numpy_time:.1f}")
+    print(f"    NumPy rows speedup vs Python rows:  x{python_time / numpy_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
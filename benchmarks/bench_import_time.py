@@ -0,0 +1,121 @@
+"""
+Benchmark of import time of the project modules.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters several
+times and reports the median cumulative import time of each module. With
+`--compare-ref` the same measurement is done for another git revision
+(checked out into a temporary worktree) to show the difference.
+
+Arguments:
+    --modules <name> [<name> ...]   Modules to import (default: database.models scripts.seed).
+    --repeat <int>                  Number of fresh interpreter runs per module (default: 10).
+    --compare-ref <git ref>         Git revision to compare with (e.g. HEAD~1).
+
+Example usage:
+    poetry run python ./benchmarks/bench_import_time.py --compare-ref HEAD~1
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+DEFAULT_MODULES = ["database.models", "scripts.seed"]
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def measure_import(project_dir: Path, module: str) -> float:
+    """Import the module in a fresh interpreter and return cumulative time in ms."""
+    env = dict(os.environ, PYTHONPATH=str(project_dir.joinpath("src")))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import '{module}':\n{result.stderr[-2000:]}")
+
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match and match.group(3) == module:
+            return int(match.group(2)) / 1000
+    raise RuntimeError(f"No import time reported for '{module}'")
+
+
+def measure_all(project_dir: Path, modules: list[str], repeat: int) -> dict[str, float]:
+    """Return median import time in ms for each module."""
+    return {
+        module: statistics.median(
+            measure_import(project_dir, module) for _ in range(repeat)
+        )
+        for module in modules
+    }
+
+
+def measure_ref(ref: str, modules: list[str], repeat: int) -> dict[str, float]:
+    """Measure import times of the given git revision in a temporary worktree."""
+    worktree = Path(tempfile.mkdtemp(prefix="bench-import-"))
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", str(worktree), ref],
+        cwd=PROJECT_DIR,
+        check=True,
+        capture_output=True,
+    )
+    try:
+        # Older revisions may read configuration file at import time
+        config_file = PROJECT_DIR.joinpath("config.ini")
+        if config_file.exists():
+            shutil.copy(config_file, worktree.joinpath("config.ini"))
+        return measure_all(worktree, modules, repeat)
+    finally:
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(worktree)],
+            cwd=PROJECT_DIR,
+            check=False,
+            capture_output=True,
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark import time of modules.")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--compare-ref", default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    current = measure_all(PROJECT_DIR, args.modules, args.repeat)
+    reference = (
+        measure_ref(args.compare_ref, args.modules, args.repeat)
+        if args.compare_ref
+        else None
+    )
+
+    print(f"📊 Median cumulative import time (of {args.repeat} runs):")
+    for module, current_ms in current.items():
+        line = f"    {module + ':':<24}{current_ms:8.1f} ms"
+        if reference:
+            reference_ms = reference[module]
+            line += (
+                f"   ({args.compare_ref}: {reference_ms:.1f} ms, "
+                f"gain {reference_ms - current_ms:+.1f} ms)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
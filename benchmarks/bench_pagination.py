@@ -0,0 +1,117 @@
+"""
+Benchmark of keyset pagination against OFFSET pagination.
+
+Measures latency of reading the first page and a deep page (the 10,000th
+by default) of live rows ordered by `(created_at, id)`, with keyset pagination
+(`database.pagination.paginate`, starting at the cursor of the page) and with
+`OFFSET`. Keyset latency stays flat, while `OFFSET` reads and discards all rows
+of preceding pages. Seed a large dataset first, e.g. with
+`seed.py --mode copy --students 100000`. If a table has fewer rows, its last
+full page is used as the deep page.
+
+Arguments:
+    --models <names>   Models to page through (default: Student Grade).
+    --page <int>       Number of the deep page (default: 10000).
+    --page-size <int>  Rows per page (default: 50).
+    --runs <int>       Number of measured runs of each read (default: 20).
+
+Example usage:
+    poetry run python ./benchmarks/bench_pagination.py --page 10000 --page-size 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath("src")))
+
+from database.loading import REPORTING_PROFILE
+from database.models import Grade, Group, PersonalData, Student, Subject, Teacher
+from database.pagination import default_sort_key, encode_cursor, paginate
+from database.session import session_scope
+
+MODELS = {model.__name__: model for model in (Group, Subject, Teacher, Student, PersonalData, Grade)}
+
+
+def median_ms(call, runs: int) -> float:
+    """Median latency of the call in milliseconds (after one warmup run)."""
+    call()
+    latencies = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+def bench_model(session, model, page: int, page_size: int, runs: int) -> dict[str, float]:
+    """Measure first and deep page latency of keyset and OFFSET pagination."""
+    sort_key = default_sort_key(model)
+    rows = session.scalar(select(func.count()).select_from(model))
+    page = max(1, min(page, rows // page_size))
+    offset = (page - 1) * page_size
+
+    # Cursor of the deep page is the key of the last row of the preceding page
+    cursor = None
+    if offset:
+        last_row = session.execute(
+            select(*sort_key).order_by(*sort_key).offset(offset - 1).limit(1)
+        ).one()
+        cursor = encode_cursor(sort_key, last_row)
+
+    def keyset(page_cursor):
+        return lambda: paginate(session, select(model), page_cursor, page_size)
+
+    def offset_page(page_offset):
+        stmt = select(model).order_by(*sort_key).offset(page_offset).limit(page_size)
+        return lambda: session.scalars(stmt).all()
+
+    # Both ways must read the same rows
+    keyset_ids = [row.id for row in keyset(cursor)().items]
+    offset_ids = [row.id for row in offset_page(offset)()]
+    if keyset_ids != offset_ids:
+        raise RuntimeError(f"Keyset and OFFSET pages of {model.__name__} differ")
+
+    session.expunge_all()
+    return {
+        "rows": rows,
+        "page": page,
+        "keyset_first_ms": median_ms(keyset(None), runs),
+        "keyset_deep_ms": median_ms(keyset(cursor), runs),
+        "offset_first_ms": median_ms(offset_page(0), runs),
+        "offset_deep_ms": median_ms(offset_page(offset), runs),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark keyset vs OFFSET pagination.")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=["Student", "Grade"])
+    parser.add_argument("--page", type=int, default=10000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=20)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    print(f"📊 Page latency, median of {args.runs} runs ({args.page_size} rows per page):")
+    print(f"    {'model':<14}{'rows':>10}{'page':>8}{'keyset p1':>12}{'keyset pN':>12}"
+          f"{'offset p1':>12}{'offset pN':>12}")
+    with session_scope(loader_profile=REPORTING_PROFILE) as session:
+        for name in args.models:
+            result = bench_model(session, MODELS[name], args.page, args.page_size, args.runs)
+            print(
+                f"    {name:<14}{result['rows']:>10,}{result['page']:>8,}"
+                f"{result['keyset_first_ms']:>9.2f} ms{result['keyset_deep_ms']:>9.2f} ms"
+                f"{result['offset_first_ms']:>9.2f} ms{result['offset_deep_ms']:>9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
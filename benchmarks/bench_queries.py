@@ -0,0 +1,93 @@
+"""
+Benchmark harness for the analytics queries of my_select.py.
+
+Runs each of the queries several times against the current database
+(seed a large dataset first, e.g. with `seed.py --mode copy --students 100000`)
+and reports p50 and p95 latency of each query.
+
+Results are not cached (whatever the [REPORT_CACHE] section), unless `--cached`
+is given: then queries return results cached in memory by the warmup runs
+(the write version is read once, as all runs share a transaction).
+
+Arguments:
+    --runs <int>      Number of measured runs of each query (default: 50).
+    --warmup <int>    Number of not measured runs of each query (default: 3).
+    --cached          Measure results cached in memory (see database.report_cache).
+
+Example usage:
+    poetry run python ./benchmarks/bench_queries.py --runs 100
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath("src")))
+
+from database.loading import REPORTING_PROFILE
+from database.report_cache import MemoryBackend, ReportCache, configure_report_cache
+from database.session import session_scope
+from my_select import query_calls, sample_query_params
+
+
+def percentile(latencies: list[float], percent: int) -> float:
+    """Return the given percentile of latencies."""
+    if len(latencies) == 1:
+        return latencies[0]
+    return statistics.quantiles(latencies, n=100, method="inclusive")[percent - 1]
+
+
+def bench_queries(runs: int, warmup: int) -> dict[str, dict[str, float]]:
+    """Measure latency of each query, return p50/p95 in milliseconds by query name."""
+    results = {}
+    with session_scope(loader_profile=REPORTING_PROFILE) as session:
+        params = sample_query_params(session)
+        if params is None:
+            raise RuntimeError("No data found. Please seed the database first.")
+
+        for name, call in query_calls(params).items():
+            for _ in range(warmup):
+                call(session)
+
+            latencies = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                call(session)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            results[name] = {
+                "p50_ms": round(percentile(latencies, 50), 3),
+                "p95_ms": round(percentile(latencies, 95), 3),
+            }
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark analytics queries.")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument(
+        "--cached", action="store_true", help="Measure results cached in memory."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    configure_report_cache(ReportCache(MemoryBackend()) if args.cached else None)
+
+    results = bench_queries(args.runs, args.warmup)
+
+    print(f"📊 Query latency ({args.runs} runs each):")
+    for name, latency in results.items():
+        print(
+            f"    {name + ':':<12} p50 {latency['p50_ms']:9.3f} ms   "
+            f"p95 {latency['p95_ms']:9.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark of loading grades as ORM objects against read-only records.
+
+Loads the same grades (seed a large dataset first, e.g. with
+`seed.py --mode copy --students 100000`) in a few ways:
+
+    orm        select(Grade) into a list of ORM instances (identity map, state
+               tracking and attribute instrumentation of every object).
+    records    select_records(GradeRecord) into a list of named tuples.
+    streamed   Records streamed from a server-side cursor in chunks and not
+               kept (constant memory, e.g. an export).
+
+Each way is run twice: for throughput (rows/s) and under tracemalloc for memory
+(memory allocated by loaded rows and peak memory of loading), as tracing slows
+allocations down.
+
+Arguments:
+    --rows <int>         Number of loaded grades (default: 1000000).
+    --chunk-size <int>   Rows per chunk of the streamed load (default: 10000).
+
+Example usage:
+    poetry run python ./benchmarks/bench_read_models.py --rows 1000000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import select
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath("src")))
+
+from database.loading import REPORTING_PROFILE
+from database.models import Grade
+from database.records import GradeRecord, fetch_records, select_records
+from database.session import session_scope
+
+
+def load_orm(session, rows: int, chunk_size: int) -> list:
+    return session.scalars(select(Grade).limit(rows)).all()
+
+
+def load_records(session, rows: int, chunk_size: int) -> list:
+    return list(fetch_records(session, select_records(GradeRecord).limit(rows), GradeRecord))
+
+
+def stream_records(session, rows: int, chunk_size: int) -> int:
+    stmt = select_records(GradeRecord).limit(rows)
+    return sum(1 for _ in fetch_records(session, stmt, GradeRecord, chunk_size=chunk_size))
+
+
+LOADERS: dict[str, Callable] = {
+    "orm": load_orm,
+    "records": load_records,
+    "streamed": stream_records,
+}
+
+
+def loaded_rows(loaded) -> int:
+    return loaded if isinstance(loaded, int) else len(loaded)
+
+
+def bench_throughput(load: Callable, rows: int, chunk_size: int) -> tuple[int, float]:
+    """Load rows in a new session, return number of rows and seconds."""
+    gc.collect()
+    with session_scope(loader_profile=REPORTING_PROFILE) as session:
+        started = time.perf_counter()
+        loaded = load(session, rows, chunk_size)
+        elapsed = time.perf_counter() - started
+        return loaded_rows(loaded), elapsed
+
+
+def bench_memory(load: Callable, rows: int, chunk_size: int) -> tuple[float, float]:
+    """Load rows in a new session, return MB allocated by loaded rows and peak MB."""
+    gc.collect()
+    with session_scope(loader_profile=REPORTING_PROFILE) as session:
+        tracemalloc.start()
+        try:
+            loaded = load(session, rows, chunk_size)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del loaded
+    return current / 2**20, peak / 2**20
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark loading grades as ORM objects against records."
+    )
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.chunk_size < 1:
+        parser.error("--rows and --chunk-size must be positive numbers")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    print(f"📊 Loading up to {args.rows:,} grades:")
+    for name, load in LOADERS.items():
+        rows, seconds = bench_throughput(load, args.rows, args.chunk_size)
+        if not rows:
+            sys.exit("❌ No grades found. Please seed the database first.")
+        retained_mb, peak_mb = bench_memory(load, args.rows, args.chunk_size)
+        print(
+            f"    {name:<10}{rows:>10,} rows {seconds:>8.2f}s {rows / seconds:>12,.0f} rows/s"
+            f"   retained {retained_mb:8.1f} MB ({retained_mb * 2**20 / rows:6.0f} B/row)"
+            f"   peak {peak_mb:8.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
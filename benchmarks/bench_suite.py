@@ -0,0 +1,396 @@
+"""
+Benchmark suite of the whole project on reproducible datasets.
+
+`run` rebuilds the configured database from scratch (all migrations are
+downgraded and upgraded again, so ALL DATA IS DROPPED), seeds a dataset tier
+with a fixed `--seed` and measures:
+
+    migrations   upgrade of an empty database; downgrade and upgrade of the
+                 latest revision over the seeded data
+    seed         `seed.py --mode copy` of the tier
+    queries      p50/p95 latency of each analytics query (not cached)
+    crud         create, update and remove of records (rolled back)
+    backup       export and import (`--truncate`) of all tables
+
+Steps measured once by their nature (migrations of an empty database, seeding)
+are noisier, the others are repeated `--repeat` times and their median is kept.
+
+All results are in milliseconds (lower is better) and are written as JSON with
+the commit they were measured at. Results of two commits (on the same tier and
+machine) are compared by `compare`, or by `run --baseline`: metrics slower by
+more than `--threshold` percent (and `--min-delta-ms`) are reported as
+regressions and the script exits with an error.
+
+Tiers (students, groups): small (1k, 10), medium (100k, 300), large (1M, 3000).
+
+Arguments:
+    run                         Rebuild the database, seed a tier and measure it.
+        --tier <name>           Dataset tier: small (default), medium or large.
+        --seed <int>            Seed of the generated data (default: 42).
+        --workers <int>         Seeding processes (default: 1).
+        --runs <int>            Measured runs of each query (default: 20).
+        --crud-records <int>    Records of each CRUD operation (default: 1000).
+        --repeat <int>          Runs of CRUD, backup and latest migration (default: 3).
+        --reset                 Allow to drop data of a not empty database.
+        --output <path>         Results file (default: benchmarks/results/<tier>-<commit>.json).
+        --baseline <path>       Results to compare with.
+    compare <baseline> <current>
+                                Compare two results files.
+    Both commands:
+        --threshold <percent>   Slowdown reported as a regression (default: 10).
+        --min-delta-ms <float>  Smaller slowdowns are ignored as noise (default: 1).
+
+Example usage:
+    poetry run python ./benchmarks/bench_suite.py run --tier small --reset
+    git checkout HEAD~1 && poetry run python ./benchmarks/bench_suite.py run --reset \\
+        --output base.json && git checkout -
+    poetry run python ./benchmarks/bench_suite.py run --reset --baseline base.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+# Add src directory to sys.path for imports
+sys.path.append(str(PROJECT_DIR.joinpath("src")))
+
+from sqlalchemy import func, inspect, select
+
+from bench_queries import bench_queries
+from database.backup import BINARY_FORMAT, export_tables, import_tables
+from database.connection import get_engine
+from database.crud import MODEL_SPECS, create_records, parse_record, remove_records, update_records
+from database.models import Grade, Group, Student
+from database.report_cache import configure_report_cache
+from database.session import session_scope
+from my_select import sample_query_params
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_RESULTS_DIR = PROJECT_DIR / "benchmarks" / "results"
+
+
+class Tier(NamedTuple):
+    students: int
+    groups: int
+
+
+TIERS = {
+    "small": Tier(students=1_000, groups=10),
+    "medium": Tier(students=100_000, groups=300),
+    "large": Tier(students=1_000_000, groups=3_000),
+}
+
+
+def elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def run_command(*command: str) -> float:
+    """Run a command in the project directory, return its duration in ms."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        command, cwd=PROJECT_DIR, capture_output=True, text=True, check=False
+    )
+    duration = elapsed_ms(started)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Command failed: {' '.join(command)}\n{(result.stdout + result.stderr)[-2000:]}"
+        )
+    return duration
+
+
+def median_of(repeat: int, measure: Callable[[], dict[str, float]]) -> dict[str, float]:
+    """Run the measurement several times, return the median of each metric."""
+    runs = [measure() for _ in range(repeat)]
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def alembic(*args: str) -> float:
+    return run_command(sys.executable, "-m", "alembic", *args)
+
+
+def git(*args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=PROJECT_DIR, capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip()
+
+
+def database_is_empty() -> bool:
+    """True if the database has no tables of the project or no students."""
+    engine = get_engine()
+    if not inspect(engine).has_table(Student.__tablename__):
+        return True
+    with session_scope() as session:
+        return session.scalar(select(func.count()).select_from(Student)) == 0
+
+
+def bench_seed(tier: Tier, seed: int, workers: int) -> dict[str, float]:
+    return {
+        "seed": run_command(
+            sys.executable,
+            str(PROJECT_DIR / "src" / "scripts" / "seed.py"),
+            "--mode", "copy",
+            "--seed", str(seed),
+            "--students", str(tier.students),
+            "--groups", str(tier.groups),
+            "--workers", str(workers),
+        )
+    }
+
+
+def dataset_size() -> dict[str, int]:
+    """Numbers of rows of the seeded dataset, results are comparable only if they match."""
+    with session_scope() as session:
+        return {
+            model.__tablename__: session.scalar(select(func.count()).select_from(model))
+            for model in (Group, Student, Grade)
+        }
+
+
+def bench_crud(records_number: int) -> dict[str, float]:
+    """Create, update and remove students and grades in a transaction rolled back at the end."""
+    results = {}
+    with session_scope() as session:
+        params = sample_query_params(session)
+        if params is None:
+            raise RuntimeError("No data found. Please seed the database first.")
+        raw_records = {
+            "Student": [
+                {"first_name": "Bench", "last_name": f"Student{i}", "group_id": params["group_id"]}
+                for i in range(records_number)
+            ],
+            # Task numbers far above generated ones, so grades don't conflict
+            "Grade": [
+                {
+                    "student_id": params["student_id"],
+                    "group_id": params["group_id"],
+                    "subject_id": params["subject_id"],
+                    "task_number": 100_000 + i,
+                    "grade": i % 100 + 1,
+                }
+                for i in range(records_number)
+            ],
+        }
+        changes = {"Student": {"last_name": "Updated"}, "Grade": {"grade": 50}}
+
+        for model_name, raw in raw_records.items():
+            spec = MODEL_SPECS[model_name]
+            started = time.perf_counter()
+            records = [parse_record(spec, record, for_create=True) for record in raw]
+            create_records(session, spec, records)
+            results[f"crud.{model_name}.create"] = elapsed_ms(started)
+
+            ids = [record["id"] for record in records]
+            started = time.perf_counter()
+            updates = [
+                parse_record(spec, {"id": id_, **changes[model_name]}) for id_ in ids
+            ]
+            update_records(session, spec, updates)
+            results[f"crud.{model_name}.update"] = elapsed_ms(started)
+
+            started = time.perf_counter()
+            remove_records(session, spec, ids)
+            results[f"crud.{model_name}.remove"] = elapsed_ms(started)
+        session.rollback()
+    return results
+
+
+def bench_backup() -> dict[str, float]:
+    """Export all tables and import them back in place of the current ones."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_suite_") as temp_dir:
+        directory = Path(temp_dir)
+        started = time.perf_counter()
+        with session_scope() as session:
+            export_tables(session, directory, BINARY_FORMAT)
+        results["backup.export"] = elapsed_ms(started)
+
+        started = time.perf_counter()
+        with session_scope() as session:
+            import_tables(session, directory, truncate=True)
+        results["backup.import"] = elapsed_ms(started)
+    return results
+
+
+def run_suite(args) -> dict:
+    """Rebuild the database, seed the tier and measure all steps."""
+    tier = TIERS[args.tier]
+    results = {}
+
+    print("[INFO] Rebuilding database schema...")
+    alembic("downgrade", "base")
+    results["migrations.upgrade_empty"] = alembic("upgrade", "head")
+
+    print(f"[INFO] Seeding '{args.tier}' tier ({tier.students:,} students)...")
+    results.update(bench_seed(tier, args.seed, args.workers))
+    dataset = dataset_size()
+
+    print("[INFO] Measuring queries...")
+    for name, latency in bench_queries(args.runs, warmup=3).items():
+        results[f"queries.{name}.p50"] = latency["p50_ms"]
+        results[f"queries.{name}.p95"] = latency["p95_ms"]
+
+    print("[INFO] Measuring CRUD operations...")
+    results.update(median_of(args.repeat, lambda: bench_crud(args.crud_records)))
+
+    print("[INFO] Measuring export and import...")
+    results.update(median_of(args.repeat, bench_backup))
+
+    print("[INFO] Measuring migration of the latest revision...")
+    results.update(
+        median_of(
+            args.repeat,
+            lambda: {
+                "migrations.downgrade_head": alembic("downgrade", "-1"),
+                "migrations.upgrade_head": alembic("upgrade", "head"),
+            },
+        )
+    )
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "tier": args.tier,
+        "seed": args.seed,
+        "workers": args.workers,
+        "runs": args.runs,
+        "crud_records": args.crud_records,
+        "repeat": args.repeat,
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "measured_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "dataset": dataset,
+        "results_ms": results,
+    }
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float, min_delta_ms: float
+) -> list[str]:
+    """Print differences of metrics, return names of regressed ones."""
+    for key in ("tier", "seed", "dataset"):
+        if baseline.get(key) != current.get(key):
+            print(
+                f"⚠️  Results differ in '{key}': {baseline.get(key)} vs {current.get(key)}, "
+                "they are not comparable."
+            )
+
+    print(
+        f"📊 {baseline['commit'][:10]} -> {current['commit'][:10]} "
+        f"('{current['tier']}' tier, ms):"
+    )
+    regressions = []
+    for name, value in current["results_ms"].items():
+        base = baseline["results_ms"].get(name)
+        if base is None:
+            print(f"    {name + ':':<32}{'':>12} {value:>12.3f}   (new)")
+            continue
+        change = (value - base) / base * 100 if base else 0.0
+        regressed = change > threshold and value - base > min_delta_ms
+        if regressed:
+            regressions.append(name)
+        print(
+            f"    {name + ':':<32}{base:>12.3f} {value:>12.3f} {change:>+8.1f}%"
+            f"{'   ❌ regression' if regressed else ''}"
+        )
+    return regressions
+
+
+def read_results(path: Path) -> dict:
+    try:
+        results = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        sys.exit(f"❌ Can't read results from {path}: {e}")
+    if results.get("format_version") != RESULTS_FORMAT_VERSION:
+        sys.exit(f"❌ Unsupported format of results in {path}")
+    return results
+
+
+def report_regressions(baseline: dict, current: dict, args) -> None:
+    regressions = compare_results(baseline, current, args.threshold, args.min_delta_ms)
+    if regressions:
+        sys.exit(
+            f"❌ {len(regressions)} metrics regressed by more than {args.threshold}%: "
+            f"{', '.join(regressions)}"
+        )
+    print(f"✅ No regressions above {args.threshold}%.")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark suite on dataset tiers.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--threshold", type=float, default=10.0)
+    common.add_argument("--min-delta-ms", type=float, default=1.0)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser(
+        "run", parents=[common], help="Rebuild the database, seed a tier and measure it."
+    )
+    run.add_argument("--tier", choices=TIERS, default="small")
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--runs", type=int, default=20)
+    run.add_argument("--crud-records", type=int, default=1000)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument(
+        "--reset", action="store_true", help="Allow to drop data of a not empty database."
+    )
+    run.add_argument("--output", type=Path, default=None)
+    run.add_argument("--baseline", type=Path, default=None)
+
+    compare = commands.add_parser(
+        "compare", parents=[common], help="Compare two results files."
+    )
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+
+    args = parser.parse_args()
+    if args.threshold < 0 or args.min_delta_ms < 0:
+        parser.error("--threshold and --min-delta-ms must not be negative")
+    if args.command == "run":
+        for name in ("workers", "runs", "crud_records", "repeat"):
+            if getattr(args, name) < 1:
+                parser.error(f"--{name.replace('_', '-')} must be at least 1")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "compare":
+        report_regressions(read_results(args.baseline), read_results(args.current), args)
+        return
+
+    baseline = read_results(args.baseline) if args.baseline else None
+    if not database_is_empty() and not args.reset:
+        sys.exit("❌ Database is not empty, all data will be dropped. Use --reset to proceed.")
+    configure_report_cache(None)
+
+    started = time.perf_counter()
+    try:
+        current = run_suite(args)
+    except RuntimeError as e:
+        sys.exit(f"❌ Benchmark failed: {e}")
+
+    output = args.output or DEFAULT_RESULTS_DIR / f"{args.tier}-{current['commit'][:10]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2))
+    print(f"✅ Suite completed in {time.perf_counter() - started:.1f}s, results: {output}")
+
+    if baseline is not None:
+        report_regressions(baseline, current, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark of concurrent report queries on sync and async session paths.
+
+Runs N copies of a report query (average grade per subject) with the given
+concurrency using:
+    * sync sessions (psycopg2) sequentially,
+    * sync sessions (psycopg2) in a thread pool,
+    * async sessions (asyncpg) with asyncio.gather.
+
+Both engines are created by the project engine factories with a pool sized
+to the concurrency. Requires a seeded database and the 'async' extras.
+
+Arguments:
+    --queries <int>       Number of queries to run on each path (default: 200).
+    --concurrency <int>   Number of queries running at once (default: 20).
+
+Example usage:
+    poetry run python ./benchmarks/bench_sync_vs_async.py --queries 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import func, select
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath("src")))
+
+from database.async_session import AsyncSessionFactory, create_async_db_engine
+from database.connection import create_db_engine
+from database.models import Grade
+from database.session import SessionFactory
+
+REPORT_QUERY = select(Grade.subject_id, func.avg(Grade.grade)).group_by(Grade.subject_id)
+
+
+def run_sync_query(engine) -> float:
+    """Run the report query in its own sync session and return its latency."""
+    started = time.perf_counter()
+    with SessionFactory(bind=engine) as session:
+        session.execute(REPORT_QUERY).all()
+    return time.perf_counter() - started
+
+
+async def run_async_query(engine, semaphore: asyncio.Semaphore) -> float:
+    """Run the report query in its own async session and return its latency."""
+    async with semaphore:
+        started = time.perf_counter()
+        async with AsyncSessionFactory(bind=engine) as session:
+            (await session.execute(REPORT_QUERY)).all()
+        return time.perf_counter() - started
+
+
+def bench_sync_sequential(queries: int, concurrency: int) -> tuple[float, list[float]]:
+    engine = create_db_engine(pool_size=concurrency, max_overflow=0)
+    try:
+        run_sync_query(engine)  # warm up the pool
+        started = time.perf_counter()
+        latencies = [run_sync_query(engine) for _ in range(queries)]
+        return time.perf_counter() - started, latencies
+    finally:
+        engine.dispose()
+
+
+def bench_sync_threads(queries: int, concurrency: int) -> tuple[float, list[float]]:
+    engine = create_db_engine(pool_size=concurrency, max_overflow=0)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(run_sync_query, [engine] * concurrency))  # warm up
+            started = time.perf_counter()
+            latencies = list(executor.map(run_sync_query, [engine] * queries))
+            return time.perf_counter() - started, latencies
+    finally:
+        engine.dispose()
+
+
+async def bench_async(queries: int, concurrency: int) -> tuple[float, list[float]]:
+    engine = create_async_db_engine(pool_size=concurrency, max_overflow=0)
+    semaphore = asyncio.Semaphore(concurrency)
+    try:
+        await asyncio.gather(
+            *(run_async_query(engine, semaphore) for _ in range(concurrency))
+        )  # warm up
+        started = time.perf_counter()
+        latencies = await asyncio.gather(
+            *(run_async_query(engine, semaphore) for _ in range(queries))
+        )
+        return time.perf_counter() - started, list(latencies)
+    finally:
+        await engine.dispose()
+
+
+def print_result(name: str, elapsed: float, latencies: list[float]) -> None:
+    p50 = statistics.median(latencies) * 1000
+    p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else p50
+    print(
+        f"    {name + ':':<22}{elapsed:8.3f}s total, {len(latencies) / elapsed:8.1f} queries/s, "
+        f"p50 {p50:7.2f} ms, p95 {p95:7.2f} ms"
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark concurrent queries on sync and async paths."
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    print(
+        f"📊 {args.queries} report queries with concurrency {args.concurrency}:"
+    )
+    print_result("sync sequential", *bench_sync_sequential(args.queries, args.concurrency))
+    print_result("sync threads", *bench_sync_threads(args.queries, args.concurrency))
+    print_result("async (asyncpg)", *asyncio.run(bench_async(args.queries, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Benchmark of inserts with random UUIDv4 and time-ordered UUIDv7 primary keys.
+
+Rows shaped like grades are inserted into scratch tables (schema `bench_uuid`,
+dropped afterwards) in two ways:
+
+    core   Multi-row INSERT batches with client generated keys (like bulk seeding),
+           v4 against v7 keys, reporting rows/s and the size of the primary key
+           index (random keys split pages all over the index, leaving them half
+           full, time-ordered keys append to the rightmost page).
+    orm    Session.add_all() + flush of ORM objects: keys generated by the database
+           (`gen_random_uuid()`, fetched back by RETURNING) against client
+           generated v4 and v7 keys (known before flush, no keys are fetched).
+
+The difference grows with the size of the table relative to shared buffers,
+as random keys need the whole index in memory to stay fast.
+
+Arguments:
+    --rows <int>         Rows inserted by Core into each table (default: 500000).
+    --orm-rows <int>     Objects inserted by ORM into each table (default: 50000).
+    --batch-size <int>   Rows per batch (transaction) (default: 5000).
+
+Example usage:
+    poetry run python ./benchmarks/bench_uuid_keys.py --rows 1000000
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import DateTime, Integer, MetaData, func, insert, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parents[1].joinpath("src")))
+
+from database.connection import get_engine
+from database.ids import uuid7
+
+SCHEMA = "bench_uuid"
+
+KEY_GENERATORS: dict[str, Callable[[], uuid.UUID]] = {"v4": uuid.uuid4, "v7": uuid7}
+
+
+class BenchBase(DeclarativeBase):
+    metadata = MetaData(schema=SCHEMA)
+
+
+class GradeRowColumns:
+    """Columns of grades besides the primary key."""
+
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    subject_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    task_number: Mapped[int] = mapped_column(Integer)
+    grade: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class ServerKeyRow(GradeRowColumns, BenchBase):
+    __tablename__ = "server_v4"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+
+
+class ClientV4KeyRow(GradeRowColumns, BenchBase):
+    __tablename__ = "client_v4"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+
+
+class ClientV7KeyRow(GradeRowColumns, BenchBase):
+    __tablename__ = "client_v7"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+
+
+ORM_MODELS = {"server v4": ServerKeyRow, "client v4": ClientV4KeyRow, "client v7": ClientV7KeyRow}
+# Core inserts go to tables with client generated keys
+CORE_TABLES = {"v4": ClientV4KeyRow.__table__, "v7": ClientV7KeyRow.__table__}
+
+
+def grade_values(count: int) -> list[dict]:
+    student_ids = [uuid.uuid4() for _ in range(max(1, count // 20))]
+    subject_ids = [uuid.uuid4() for _ in range(8)]
+    return [
+        {
+            "student_id": random.choice(student_ids),
+            "subject_id": random.choice(subject_ids),
+            "task_number": random.randint(1, 20),
+            "grade": random.randint(1, 100),
+        }
+        for _ in range(count)
+    ]
+
+
+def index_size(connection, table) -> int:
+    """Size of the primary key index of the table in bytes."""
+    return connection.execute(
+        text(
+            "SELECT pg_relation_size(indexrelid) FROM pg_index "
+            "WHERE indrelid = CAST(:table AS regclass) AND indisprimary"
+        ),
+        {"table": f"{SCHEMA}.{table.name}"},
+    ).scalar_one()
+
+
+def bench_core(engine, version: str, rows: int, batch_size: int) -> dict[str, float]:
+    """Insert rows with client keys of the version in batches, return rows/s and index size."""
+    table = CORE_TABLES[version]
+    new_key = KEY_GENERATORS[version]
+    values = grade_values(batch_size)
+    elapsed = 0.0
+    for start in range(0, rows, batch_size):
+        batch = [{"id": new_key(), **row} for row in values[: min(batch_size, rows - start)]]
+        started = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(insert(table), batch)
+        elapsed += time.perf_counter() - started
+
+    with engine.connect() as connection:
+        size = index_size(connection, table)
+    return {"rows_per_s": rows / elapsed, "index_mb": size / 2**20}
+
+
+def bench_orm(engine, model, rows: int, batch_size: int) -> float:
+    """Insert ORM objects in batches (a flush and commit each), return objects/s."""
+    values = grade_values(batch_size)
+    elapsed = 0.0
+    for start in range(0, rows, batch_size):
+        objects = [model(**row) for row in values[: min(batch_size, rows - start)]]
+        started = time.perf_counter()
+        with Session(engine) as session, session.begin():
+            session.add_all(objects)
+        elapsed += time.perf_counter() - started
+    return rows / elapsed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark inserts with UUIDv4 and v7 keys.")
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--orm-rows", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    if min(args.rows, args.orm_rows, args.batch_size) < 1:
+        parser.error("--rows, --orm-rows and --batch-size must be positive numbers")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    engine = get_engine()
+
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        BenchBase.metadata.create_all(connection)
+
+    try:
+        print(f"📊 Core inserts ({args.rows:,} rows, {args.batch_size:,} per batch):")
+        for version in KEY_GENERATORS:
+            result = bench_core(engine, version, args.rows, args.batch_size)
+            print(
+                f"    {version:<10}{result['rows_per_s']:>12,.0f} rows/s"
+                f"   primary key index {result['index_mb']:8.1f} MB"
+            )
+
+        with engine.begin() as connection:
+            for table in BenchBase.metadata.sorted_tables:
+                connection.execute(text(f"TRUNCATE {SCHEMA}.{table.name}"))
+
+        print(f"📊 ORM inserts ({args.orm_rows:,} objects, {args.batch_size:,} per flush):")
+        for name, model in ORM_MODELS.items():
+            objects_per_s = bench_orm(engine, model, args.orm_rows, args.batch_size)
+            print(f"    {name:<10}{objects_per_s:>12,.0f} objects/s")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,14 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
 
-# Importing Base and url_to_db from src
+# Importing Base, database URL and engine factory from src
 from database.models import Base
-from database import url_to_db
+from database import create_db_engine, get_url_to_db
+from database.partitions import PARTITION_NAME_PATTERN
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -35,7 +35,14 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 if not config.get_main_option("sqlalchemy.url"):
-    config.set_main_option("sqlalchemy.url", url_to_db)
+    config.set_main_option("sqlalchemy.url", get_url_to_db())
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Skip partitions of grades, which are managed by `database.partitions`."""
+    if type_ == "table":
+        return not PARTITION_NAME_PATTERN.match(name)
+    return True
 
 
 def run_migrations_offline() -> None:
@@ -54,6 +61,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -69,14 +77,21 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
+    # Same engine factory as the app uses, but without pooling as migrations use
+    # a single connection, and without the statement timeout of the app, which
+    # would cancel long data copies and index builds on large tables
+    connectable = create_db_engine(
+        config.get_main_option("sqlalchemy.url"),
         poolclass=pool.NullPool,
+        connect_args={"options": "-c statement_timeout=0"},
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
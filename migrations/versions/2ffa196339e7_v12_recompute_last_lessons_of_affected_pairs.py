@@ -0,0 +1,158 @@
+"""v12 Recompute last lessons only of affected groups in subjects
+
+Revision ID: 2ffa196339e7
+Revises: 581c700d66a7
+Create Date: 2026-10-18 11:37:26.208415
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2ffa196339e7"
+down_revision: Union[str, Sequence[str], None] = "581c700d66a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Recomputes pointers of the given (group_ids[i], subject_ids[i]) pairs from live grades,
+# reading only grades of these pairs (ix_grades_subject_id_group_id_created_at_live)
+REFRESH_PAIRS_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_group_subject_last_lesson_pairs(
+    group_ids uuid[], subject_ids uuid[]
+)
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM group_subject_last_lessons AS last
+    USING unnest(group_ids, subject_ids) AS pair(group_id, subject_id)
+    WHERE last.group_id = pair.group_id AND last.subject_id = pair.subject_id;
+
+    INSERT INTO group_subject_last_lessons AS last (
+        group_id, subject_id, last_task_number, last_graded_at
+    )
+    SELECT grades.group_id, grades.subject_id, max(grades.task_number), max(grades.created_at)
+    FROM (SELECT DISTINCT * FROM unnest(group_ids, subject_ids)) AS pair(group_id, subject_id)
+    JOIN grades ON grades.group_id = pair.group_id AND grades.subject_id = pair.subject_id
+    WHERE grades.is_deleted = false
+    GROUP BY grades.group_id, grades.subject_id
+    -- Rows may be added meanwhile by a concurrent insert of grades
+    ON CONFLICT (group_id, subject_id) DO UPDATE SET
+        last_task_number = EXCLUDED.last_task_number,
+        last_graded_at = EXCLUDED.last_graded_at;
+END;
+$$;
+"""
+
+
+def live_values(table: str) -> str:
+    """Values of live grades of a transition table deciding last lessons."""
+    return (
+        f"SELECT group_id, subject_id, task_number, created_at "
+        f"FROM {table} WHERE is_deleted = false"
+    )
+
+
+def refresh_released_pointers(removed: str) -> str:
+    """
+    Statements recomputing pairs of `removed` values which reach the stored task
+    number or time (ties included): only they may have held the pointer, other
+    pointers stay valid and are not touched.
+    """
+    return f"""
+    SELECT array_agg(affected.group_id), array_agg(affected.subject_id)
+    INTO group_ids, subject_ids
+    FROM (
+        SELECT DISTINCT removed.group_id, removed.subject_id
+        FROM ({removed}) AS removed
+        JOIN group_subject_last_lessons AS last
+          ON last.group_id = removed.group_id AND last.subject_id = removed.subject_id
+        WHERE removed.task_number >= last.last_task_number
+           OR removed.created_at >= last.last_graded_at
+    ) AS affected;
+    IF group_ids IS NOT NULL THEN
+        PERFORM refresh_group_subject_last_lesson_pairs(group_ids, subject_ids);
+    END IF;
+"""
+
+
+# Only live values changed by the statement matter (multiset differences), so
+# updates of scores don't touch pointers: values no longer live may release
+# a pointer, new live values move pointers forward like inserted grades
+UPDATE_TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    group_ids uuid[];
+    subject_ids uuid[];
+BEGIN
+{refresh_released_pointers(
+    live_values('old_grades') + " EXCEPT ALL " + live_values('new_grades')
+)}
+    INSERT INTO group_subject_last_lessons AS last (
+        group_id, subject_id, last_task_number, last_graded_at
+    )
+    SELECT group_id, subject_id, max(task_number), max(created_at)
+    FROM ({live_values('new_grades')} EXCEPT ALL {live_values('old_grades')}) AS added
+    GROUP BY group_id, subject_id
+    ON CONFLICT (group_id, subject_id) DO UPDATE SET
+        last_task_number = GREATEST(last.last_task_number, EXCLUDED.last_task_number),
+        last_graded_at = GREATEST(last.last_graded_at, EXCLUDED.last_graded_at);
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Deleted live grades may release pointers, hard deletes of tombstones (purge) never do
+DELETE_TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_delete()
+RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    group_ids uuid[];
+    subject_ids uuid[];
+BEGIN
+{refresh_released_pointers(live_values('old_grades'))}
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Functions of migration v10, recomputing all pointers of touched groups
+OLD_UPDATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_group_subject_last_lessons(ARRAY(
+        SELECT group_id FROM old_grades
+        UNION
+        SELECT group_id FROM new_grades
+    ));
+    RETURN NULL;
+END;
+$$;
+"""
+
+OLD_DELETE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_delete()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_group_subject_last_lessons(ARRAY(SELECT DISTINCT group_id FROM old_grades));
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(REFRESH_PAIRS_FUNCTION)
+    op.execute(UPDATE_TRIGGER_FUNCTION)
+    op.execute(DELETE_TRIGGER_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(OLD_UPDATE_TRIGGER_FUNCTION)
+    op.execute(OLD_DELETE_TRIGGER_FUNCTION)
+    op.execute("DROP FUNCTION IF EXISTS refresh_group_subject_last_lesson_pairs(uuid[], uuid[])")
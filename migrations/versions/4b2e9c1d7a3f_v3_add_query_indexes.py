@@ -0,0 +1,108 @@
+"""v3 Add covering, foreign key and partial indexes for analytics queries
+
+Revision ID: 4b2e9c1d7a3f
+Revises: 87ecf5e494ae
+Create Date: 2026-10-17 10:12:45.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b2e9c1d7a3f"
+down_revision: Union[str, Sequence[str], None] = "87ecf5e494ae"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partial indexes cover only live rows, so soft-deleted grades don't bloat them
+LIVE_ROWS = sa.text("is_deleted = false")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indexes are built concurrently, so tables stay writable while they are built.
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        # Foreign keys without an index (referenced rows are looked up on delete)
+        op.create_index(
+            "ix_students_group_id",
+            "students",
+            ["group_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_subjects_teacher_id",
+            "subjects",
+            ["teacher_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_group_subject_association_subject_id",
+            "group_subject_association",
+            ["subject_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_grades_group_id",
+            "grades",
+            ["group_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_grades_subject_id",
+            "grades",
+            ["subject_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Covering partial indexes for aggregations over live grades
+        op.create_index(
+            "ix_grades_subject_id_group_id_live",
+            "grades",
+            ["subject_id", "group_id"],
+            postgresql_include=["student_id", "task_number", "grade", "created_at"],
+            postgresql_where=LIVE_ROWS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_grades_student_id_live",
+            "grades",
+            ["student_id"],
+            postgresql_include=["grade"],
+            postgresql_where=LIVE_ROWS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    # Fresh statistics, so the planner can pick index-only scans right away
+    op.execute("ANALYZE grades")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name in (
+            ("ix_grades_student_id_live", "grades"),
+            ("ix_grades_subject_id_group_id_live", "grades"),
+            ("ix_grades_subject_id", "grades"),
+            ("ix_grades_group_id", "grades"),
+            ("ix_group_subject_association_subject_id", "group_subject_association"),
+            ("ix_subjects_teacher_id", "subjects"),
+            ("ix_students_group_id", "students"),
+        ):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
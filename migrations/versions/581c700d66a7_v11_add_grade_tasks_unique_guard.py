@@ -0,0 +1,170 @@
+"""v11 Add grade_tasks guard keeping tasks of grades unique across partitions
+
+Revision ID: 581c700d66a7
+Revises: d928d8363399
+Create Date: 2026-10-18 10:04:12.551930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "581c700d66a7"
+down_revision: Union[str, Sequence[str], None] = "d928d8363399"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TASK_KEY = "student_id, group_id, subject_id, task_number"
+
+# Keys of inserted grades, a duplicate task fails the insert with a unique violation
+INSERT_TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION grade_tasks_on_grades_insert()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO grade_tasks ({TASK_KEY})
+    SELECT {TASK_KEY} FROM new_grades;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Only keys changed by the statement are replaced (multiset differences), so
+# updates of scores, soft deletes and re-keying of ids don't touch the guard
+UPDATE_TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION grade_tasks_on_grades_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM grade_tasks AS task
+    USING (
+        SELECT {TASK_KEY} FROM old_grades
+        EXCEPT ALL
+        SELECT {TASK_KEY} FROM new_grades
+    ) AS removed
+    WHERE (task.student_id, task.group_id, task.subject_id, task.task_number)
+        = (removed.student_id, removed.group_id, removed.subject_id, removed.task_number);
+
+    INSERT INTO grade_tasks ({TASK_KEY})
+    SELECT {TASK_KEY} FROM new_grades
+    EXCEPT ALL
+    SELECT {TASK_KEY} FROM old_grades;
+    RETURN NULL;
+END;
+$$;
+"""
+
+DELETE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION grade_tasks_on_grades_delete()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM grade_tasks AS task
+    USING old_grades AS removed
+    WHERE (task.student_id, task.group_id, task.subject_id, task.task_number)
+        = (removed.student_id, removed.group_id, removed.subject_id, removed.task_number);
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Not TRUNCATE, which fails when grade_tasks is truncated by the same statement
+# (e.g. by an import of all tables)
+TRUNCATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION grade_tasks_on_grades_truncate()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM grade_tasks;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Statement-level triggers, like those of student_subject_stats (migration v4)
+TRIGGERS = """
+CREATE TRIGGER grade_tasks_grades_insert
+    AFTER INSERT ON grades REFERENCING NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION grade_tasks_on_grades_insert();
+CREATE TRIGGER grade_tasks_grades_update
+    AFTER UPDATE ON grades REFERENCING OLD TABLE AS old_grades NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION grade_tasks_on_grades_update();
+CREATE TRIGGER grade_tasks_grades_delete
+    AFTER DELETE ON grades REFERENCING OLD TABLE AS old_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION grade_tasks_on_grades_delete();
+CREATE TRIGGER grade_tasks_grades_truncate
+    AFTER TRUNCATE ON grades
+    FOR EACH STATEMENT EXECUTE FUNCTION grade_tasks_on_grades_truncate();
+"""
+
+# Grades accepted since migration v6 may already repeat a task
+CHECK_DUPLICATES = f"""
+DO $$
+DECLARE
+    duplicates bigint;
+BEGIN
+    SELECT count(*) INTO duplicates FROM (
+        SELECT 1 FROM grades GROUP BY {TASK_KEY} HAVING count(*) > 1
+    ) AS duplicate_tasks;
+    IF duplicates > 0 THEN
+        RAISE EXCEPTION 'Tasks graded more than once: %, remove duplicate grades first', duplicates;
+    END IF;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Unique key of grades includes created_at (partition key), so it doesn't
+    # keep tasks unique; its name is taken by the guard
+    op.drop_constraint("uq_grade_task", "grades", type_="unique")
+    op.create_table(
+        "grade_tasks",
+        sa.Column("student_id", sa.UUID(), nullable=False),
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("subject_id", sa.UUID(), nullable=False),
+        sa.Column("task_number", sa.Integer(), autoincrement=False, nullable=False),
+        sa.PrimaryKeyConstraint(
+            "student_id", "group_id", "subject_id", "task_number", name="uq_grade_task"
+        ),
+    )
+
+    op.execute(INSERT_TRIGGER_FUNCTION)
+    op.execute(UPDATE_TRIGGER_FUNCTION)
+    op.execute(DELETE_TRIGGER_FUNCTION)
+    op.execute(TRUNCATE_TRIGGER_FUNCTION)
+
+    # Writes to grades are blocked until the migration commits,
+    # so keys of existing grades are copied consistently before triggers take over
+    op.execute("LOCK TABLE grades IN SHARE MODE")
+    op.execute(CHECK_DUPLICATES)
+    op.execute(TRIGGERS)
+    op.execute(f"INSERT INTO grade_tasks ({TASK_KEY}) SELECT {TASK_KEY} FROM grades")
+    op.execute("ANALYZE grade_tasks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger_name in (
+        "grade_tasks_grades_truncate",
+        "grade_tasks_grades_delete",
+        "grade_tasks_grades_update",
+        "grade_tasks_grades_insert",
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON grades")
+
+    for function_name in (
+        "grade_tasks_on_grades_truncate()",
+        "grade_tasks_on_grades_delete()",
+        "grade_tasks_on_grades_update()",
+        "grade_tasks_on_grades_insert()",
+    ):
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}")
+
+    op.drop_table("grade_tasks")
+    op.create_unique_constraint(
+        "uq_grade_task",
+        "grades",
+        ["student_id", "group_id", "subject_id", "task_number", "created_at"],
+    )
@@ -0,0 +1,232 @@
+"""v6 Partition grades by created_at (monthly ranges)
+
+Revision ID: 5c8e2f7b1d94
+Revises: e1a7c4b90f26
+Create Date: 2026-10-17 17:26:51.204733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8e2f7b1d94"
+down_revision: Union[str, Sequence[str], None] = "e1a7c4b90f26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months of partitions created ahead of the current one
+MONTHS_AHEAD = 3
+
+GRADE_COLUMNS = (
+    "id, student_id, group_id, subject_id, task_number, grade, "
+    "created_at, updated_at, is_deleted, deleted_at"
+)
+
+# Creates monthly partitions grades_yYYYYmMM for months from start to end (inclusive),
+# skipping existing ones, and returns names of created partitions.
+# Bounds are months in UTC, so they don't depend on the session time zone.
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_grades_partitions(start_month date, end_month date)
+RETURNS SETOF text LANGUAGE plpgsql AS $$
+DECLARE
+    month date;
+    partition_name text;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', start_month), date_trunc('month', end_month), '1 month'
+        )::date
+    LOOP
+        partition_name := format('grades_y%sm%s', to_char(month, 'YYYY'), to_char(month, 'MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF grades FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month::timestamp AT TIME ZONE 'UTC',
+                (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            RETURN NEXT partition_name;
+        END IF;
+    END LOOP;
+END;
+$$;
+"""
+
+SUMMARY_TRIGGERS = """
+CREATE TRIGGER student_subject_stats_grades_insert
+    AFTER INSERT ON grades REFERENCING NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_insert();
+CREATE TRIGGER student_subject_stats_grades_update
+    AFTER UPDATE ON grades REFERENCING OLD TABLE AS old_grades NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_update();
+CREATE TRIGGER student_subject_stats_grades_delete
+    AFTER DELETE ON grades REFERENCING OLD TABLE AS old_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_delete();
+CREATE TRIGGER student_subject_stats_grades_truncate
+    AFTER TRUNCATE ON grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_truncate();
+"""
+
+LIVE_ROWS = sa.text("is_deleted = false")
+TOMBSTONES = sa.text("is_deleted = true")
+
+
+def create_grades_table(
+    primary_key: Sequence[str], unique_key: Sequence[str], **table_options
+) -> None:
+    """Create grades table with constraints of the given primary and unique keys."""
+    op.create_table(
+        "grades",
+        sa.Column("student_id", sa.UUID(), nullable=False),
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("subject_id", sa.UUID(), nullable=False),
+        sa.Column("grade", sa.Integer(), nullable=False),
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("task_number", sa.Integer(), nullable=False),
+        # Named as generated by PostgreSQL, as the old table still holds these names
+        sa.ForeignKeyConstraint(
+            ["group_id"], ["groups.id"], ondelete="CASCADE", name="grades_group_id_fkey"
+        ),
+        sa.ForeignKeyConstraint(
+            ["student_id"],
+            ["students.id"],
+            ondelete="CASCADE",
+            name="grades_student_id_fkey",
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+            ondelete="CASCADE",
+            name="grades_subject_id_fkey",
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name="grades_pkey"),
+        sa.UniqueConstraint(*unique_key, name="uq_grade_task"),
+        **table_options,
+    )
+
+
+def replace_grades_table(create_new_table, migrate_rows) -> None:
+    """
+    Move rows of grades to a new table created by `create_new_table()`.
+
+    Old table is renamed, so the new one takes its name, constraint and index names.
+    Summary triggers are recreated on the new table after rows are copied,
+    so the summary (already up to date) is not touched.
+    """
+    op.execute("LOCK TABLE grades IN ACCESS EXCLUSIVE MODE")
+    op.rename_table("grades", "grades_old")
+    op.execute("ALTER TABLE grades_old RENAME CONSTRAINT grades_pkey TO grades_old_pkey")
+    op.execute("ALTER TABLE grades_old DROP CONSTRAINT uq_grade_task")
+    for index_name in (
+        "ix_grades_deleted_at_tombstones",
+        "ix_grades_group_id",
+        "ix_grades_student_id_live",
+        "ix_grades_subject_id",
+        "ix_grades_subject_id_group_id_live",
+        "ix_grades_subject_id_group_id_created_at_live",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    create_new_table()
+    migrate_rows()
+    op.drop_table("grades_old")
+
+    op.create_index("ix_grades_group_id", "grades", ["group_id"])
+    op.create_index("ix_grades_subject_id", "grades", ["subject_id"])
+    op.create_index(
+        "ix_grades_student_id_live",
+        "grades",
+        ["student_id"],
+        postgresql_include=["grade"],
+        postgresql_where=LIVE_ROWS,
+    )
+    op.create_index(
+        "ix_grades_deleted_at_tombstones",
+        "grades",
+        ["deleted_at"],
+        postgresql_where=TOMBSTONES,
+    )
+    op.execute(SUMMARY_TRIGGERS)
+    op.execute("ANALYZE grades")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    def create_partitioned_table() -> None:
+        # Partition key must be a part of primary and unique keys
+        create_grades_table(
+            primary_key=("id", "created_at"),
+            unique_key=("student_id", "group_id", "subject_id", "task_number", "created_at"),
+            postgresql_partition_by="RANGE (created_at)",
+        )
+        op.execute(CREATE_PARTITIONS_FUNCTION)
+        # Partitions for all existing grades and a few months ahead.
+        # No default partition, as it blocks DETACH PARTITION CONCURRENTLY.
+        op.execute(
+            "SELECT create_grades_partitions("
+            "    coalesce((SELECT min(created_at) FROM grades_old), now())::date,"
+            f"   (now() + interval '{MONTHS_AHEAD} months')::date"
+            ")"
+        )
+
+    def migrate_rows() -> None:
+        op.execute(
+            f"INSERT INTO grades ({GRADE_COLUMNS}) SELECT {GRADE_COLUMNS} FROM grades_old"
+        )
+
+    replace_grades_table(create_partitioned_table, migrate_rows)
+
+    # Last lesson of a group in a subject is found by created_at in the newest partition
+    op.create_index(
+        "ix_grades_subject_id_group_id_created_at_live",
+        "grades",
+        ["subject_id", "group_id", "created_at"],
+        postgresql_include=["student_id", "task_number", "grade"],
+        postgresql_where=LIVE_ROWS,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    def create_plain_table() -> None:
+        create_grades_table(
+            primary_key=("id",),
+            unique_key=("student_id", "group_id", "subject_id", "task_number"),
+        )
+
+    def migrate_rows() -> None:
+        # Detached (archived) partitions are not moved back
+        op.execute(
+            f"INSERT INTO grades ({GRADE_COLUMNS}) SELECT {GRADE_COLUMNS} FROM grades_old"
+        )
+
+    replace_grades_table(create_plain_table, migrate_rows)
+    op.execute("DROP FUNCTION IF EXISTS create_grades_partitions(date, date)")
+
+    op.create_index(
+        "ix_grades_subject_id_group_id_live",
+        "grades",
+        ["subject_id", "group_id"],
+        postgresql_include=["student_id", "task_number", "grade", "created_at"],
+        postgresql_where=LIVE_ROWS,
+    )
@@ -0,0 +1,90 @@
+"""v13 Let concurrent writers of grades create the same partition
+
+Revision ID: 984b7db3442a
+Revises: 2ffa196339e7
+Create Date: 2026-10-18 14:52:08.417305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "984b7db3442a"
+down_revision: Union[str, Sequence[str], None] = "2ffa196339e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Writers of grades create missing partitions on demand, so two transactions
+# may both miss a partition: the later one waits for the lock of grades and then
+# finds the partition created, which is skipped instead of failing the write
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_grades_partitions(start_month date, end_month date)
+RETURNS SETOF text LANGUAGE plpgsql AS $$
+DECLARE
+    month date;
+    partition_name text;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', start_month), date_trunc('month', end_month), '1 month'
+        )::date
+    LOOP
+        partition_name := format('grades_y%sm%s', to_char(month, 'YYYY'), to_char(month, 'MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF grades FOR VALUES FROM (%L) TO (%L)',
+                    partition_name,
+                    month::timestamp AT TIME ZONE 'UTC',
+                    (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+                RETURN NEXT partition_name;
+            EXCEPTION WHEN duplicate_table THEN
+                NULL;
+            END;
+        END IF;
+    END LOOP;
+END;
+$$;
+"""
+
+# Function of migration v6
+OLD_CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_grades_partitions(start_month date, end_month date)
+RETURNS SETOF text LANGUAGE plpgsql AS $$
+DECLARE
+    month date;
+    partition_name text;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', start_month), date_trunc('month', end_month), '1 month'
+        )::date
+    LOOP
+        partition_name := format('grades_y%sm%s', to_char(month, 'YYYY'), to_char(month, 'MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF grades FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month::timestamp AT TIME ZONE 'UTC',
+                (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            RETURN NEXT partition_name;
+        END IF;
+    END LOOP;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(OLD_CREATE_PARTITIONS_FUNCTION)
@@ -0,0 +1,200 @@
+"""v4 Add student_subject_stats summary maintained by triggers on grades
+
+Revision ID: 9d5f3a61c2e8
+Revises: 4b2e9c1d7a3f
+Create Date: 2026-10-17 12:40:03.581772
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d5f3a61c2e8"
+down_revision: Union[str, Sequence[str], None] = "4b2e9c1d7a3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Recomputes stats of the given students from live grades (all students if NULL).
+# Used by UPDATE/DELETE triggers, where min/max can't be adjusted incrementally,
+# and for the full rebuild.
+REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_student_subject_stats(student_ids uuid[] DEFAULT NULL)
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    IF student_ids IS NULL THEN
+        DELETE FROM student_subject_stats;
+    ELSE
+        DELETE FROM student_subject_stats WHERE student_id = ANY(student_ids);
+    END IF;
+
+    INSERT INTO student_subject_stats AS stats (
+        student_id, subject_id, group_id,
+        grades_count, grades_sum, grade_min, grade_max, last_task_number
+    )
+    SELECT student_id, subject_id, group_id,
+           count(*), sum(grade), min(grade), max(grade), max(task_number)
+    FROM grades
+    WHERE is_deleted = false
+      AND (student_ids IS NULL OR student_id = ANY(student_ids))
+    GROUP BY student_id, subject_id, group_id
+    -- Rows may be added meanwhile by a concurrent insert of grades
+    ON CONFLICT (student_id, subject_id, group_id) DO UPDATE SET
+        grades_count = EXCLUDED.grades_count,
+        grades_sum = EXCLUDED.grades_sum,
+        grade_min = EXCLUDED.grade_min,
+        grade_max = EXCLUDED.grade_max,
+        last_task_number = EXCLUDED.last_task_number;
+END;
+$$;
+"""
+
+# Inserted grades are merged into stats incrementally (seeding hot path)
+INSERT_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION student_subject_stats_on_grades_insert()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO student_subject_stats AS stats (
+        student_id, subject_id, group_id,
+        grades_count, grades_sum, grade_min, grade_max, last_task_number
+    )
+    SELECT student_id, subject_id, group_id,
+           count(*), sum(grade), min(grade), max(grade), max(task_number)
+    FROM new_grades
+    WHERE is_deleted = false
+    GROUP BY student_id, subject_id, group_id
+    ON CONFLICT (student_id, subject_id, group_id) DO UPDATE SET
+        grades_count = stats.grades_count + EXCLUDED.grades_count,
+        grades_sum = stats.grades_sum + EXCLUDED.grades_sum,
+        grade_min = LEAST(stats.grade_min, EXCLUDED.grade_min),
+        grade_max = GREATEST(stats.grade_max, EXCLUDED.grade_max),
+        last_task_number = GREATEST(stats.last_task_number, EXCLUDED.last_task_number);
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Updated (including soft-deleted) grades: stats of affected students are recomputed
+UPDATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION student_subject_stats_on_grades_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_student_subject_stats(ARRAY(
+        SELECT student_id FROM old_grades
+        UNION
+        SELECT student_id FROM new_grades
+    ));
+    RETURN NULL;
+END;
+$$;
+"""
+
+DELETE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION student_subject_stats_on_grades_delete()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_student_subject_stats(ARRAY(SELECT DISTINCT student_id FROM old_grades));
+    RETURN NULL;
+END;
+$$;
+"""
+
+TRUNCATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION student_subject_stats_on_grades_truncate()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM student_subject_stats;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Statement-level triggers see all rows changed by a statement at once (transition
+# tables), so a multi-row insert or COPY updates the stats with a single query
+TRIGGERS = """
+CREATE TRIGGER student_subject_stats_grades_insert
+    AFTER INSERT ON grades REFERENCING NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_insert();
+CREATE TRIGGER student_subject_stats_grades_update
+    AFTER UPDATE ON grades REFERENCING OLD TABLE AS old_grades NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_update();
+CREATE TRIGGER student_subject_stats_grades_delete
+    AFTER DELETE ON grades REFERENCING OLD TABLE AS old_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_delete();
+CREATE TRIGGER student_subject_stats_grades_truncate
+    AFTER TRUNCATE ON grades
+    FOR EACH STATEMENT EXECUTE FUNCTION student_subject_stats_on_grades_truncate();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "student_subject_stats",
+        sa.Column("student_id", sa.UUID(), nullable=False),
+        sa.Column("subject_id", sa.UUID(), nullable=False),
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("grades_count", sa.Integer(), nullable=False),
+        sa.Column("grades_sum", sa.Integer(), nullable=False),
+        sa.Column("grade_min", sa.Integer(), nullable=False),
+        sa.Column("grade_max", sa.Integer(), nullable=False),
+        sa.Column("last_task_number", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["student_id"], ["students.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["subject_id"], ["subjects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "student_id",
+            "subject_id",
+            "group_id",
+            name="pk_student_subject_stats",
+            postgresql_include=["grades_count", "grades_sum"],
+        ),
+    )
+    op.create_index(
+        "ix_student_subject_stats_subject_id_group_id",
+        "student_subject_stats",
+        ["subject_id", "group_id"],
+        postgresql_include=["student_id", "grades_count", "grades_sum"],
+    )
+
+    op.execute(REFRESH_FUNCTION)
+    op.execute(INSERT_TRIGGER_FUNCTION)
+    op.execute(UPDATE_TRIGGER_FUNCTION)
+    op.execute(DELETE_TRIGGER_FUNCTION)
+    op.execute(TRUNCATE_TRIGGER_FUNCTION)
+
+    # Writes to grades are blocked until the migration commits,
+    # so existing grades are summarised consistently before triggers take over
+    op.execute("LOCK TABLE grades IN SHARE MODE")
+    op.execute(TRIGGERS)
+    op.execute("SELECT refresh_student_subject_stats()")
+    op.execute("ANALYZE student_subject_stats")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger_name in (
+        "student_subject_stats_grades_truncate",
+        "student_subject_stats_grades_delete",
+        "student_subject_stats_grades_update",
+        "student_subject_stats_grades_insert",
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON grades")
+
+    for function_name in (
+        "student_subject_stats_on_grades_truncate()",
+        "student_subject_stats_on_grades_delete()",
+        "student_subject_stats_on_grades_update()",
+        "student_subject_stats_on_grades_insert()",
+        "refresh_student_subject_stats(uuid[])",
+    ):
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}")
+
+    op.drop_index(
+        "ix_student_subject_stats_subject_id_group_id",
+        table_name="student_subject_stats",
+    )
+    op.drop_table("student_subject_stats")
@@ -0,0 +1,51 @@
+"""v8 Add uuid_v7_at() function generating time-ordered keys
+
+Revision ID: 9db72a7bbc73
+Revises: edbdd5201a95
+Create Date: 2026-10-17 20:41:05.331872
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9db72a7bbc73"
+down_revision: Union[str, Sequence[str], None] = "edbdd5201a95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# UUIDv7 (RFC 9562) of the given time: the first 48 bits of a random UUIDv4
+# are replaced by Unix time in milliseconds and version bits are set to 7 (0111).
+# Used to re-key existing rows by their created_at (see scripts/rekey_grades.py).
+UUID_V7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuid_v7_at(ts timestamptz DEFAULT clock_timestamp())
+RETURNS uuid LANGUAGE sql VOLATILE PARALLEL SAFE AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    PLACING substring(int8send(floor(extract(epoch FROM ts) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid
+$$;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(UUID_V7_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION IF EXISTS uuid_v7_at(timestamptz)")
@@ -0,0 +1,173 @@
+"""v10 Add group_subject_last_lessons pointers maintained by triggers on grades
+
+Revision ID: d928d8363399
+Revises: de26a360cf9d
+Create Date: 2026-10-18 00:21:47.093512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d928d8363399"
+down_revision: Union[str, Sequence[str], None] = "de26a360cf9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Recomputes pointers of the given groups from live grades (all groups if NULL).
+# Used by UPDATE/DELETE triggers, where maximums can't be adjusted incrementally,
+# and for the full rebuild.
+REFRESH_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_group_subject_last_lessons(group_ids uuid[] DEFAULT NULL)
+RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    IF group_ids IS NULL THEN
+        DELETE FROM group_subject_last_lessons;
+    ELSE
+        DELETE FROM group_subject_last_lessons WHERE group_id = ANY(group_ids);
+    END IF;
+
+    INSERT INTO group_subject_last_lessons AS last (
+        group_id, subject_id, last_task_number, last_graded_at
+    )
+    SELECT group_id, subject_id, max(task_number), max(created_at)
+    FROM grades
+    WHERE is_deleted = false
+      AND (group_ids IS NULL OR group_id = ANY(group_ids))
+    GROUP BY group_id, subject_id
+    -- Rows may be added meanwhile by a concurrent insert of grades
+    ON CONFLICT (group_id, subject_id) DO UPDATE SET
+        last_task_number = EXCLUDED.last_task_number,
+        last_graded_at = EXCLUDED.last_graded_at;
+END;
+$$;
+"""
+
+# Inserted grades move pointers forward (seeding hot path)
+INSERT_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_insert()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO group_subject_last_lessons AS last (
+        group_id, subject_id, last_task_number, last_graded_at
+    )
+    SELECT group_id, subject_id, max(task_number), max(created_at)
+    FROM new_grades
+    WHERE is_deleted = false
+    GROUP BY group_id, subject_id
+    ON CONFLICT (group_id, subject_id) DO UPDATE SET
+        last_task_number = GREATEST(last.last_task_number, EXCLUDED.last_task_number),
+        last_graded_at = GREATEST(last.last_graded_at, EXCLUDED.last_graded_at);
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Updated (including soft-deleted) grades: pointers of affected groups are recomputed
+UPDATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_update()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_group_subject_last_lessons(ARRAY(
+        SELECT group_id FROM old_grades
+        UNION
+        SELECT group_id FROM new_grades
+    ));
+    RETURN NULL;
+END;
+$$;
+"""
+
+DELETE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_delete()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_group_subject_last_lessons(ARRAY(SELECT DISTINCT group_id FROM old_grades));
+    RETURN NULL;
+END;
+$$;
+"""
+
+TRUNCATE_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION group_subject_last_lessons_on_grades_truncate()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM group_subject_last_lessons;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Statement-level triggers, like those of student_subject_stats (migration v4)
+TRIGGERS = """
+CREATE TRIGGER group_subject_last_lessons_grades_insert
+    AFTER INSERT ON grades REFERENCING NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION group_subject_last_lessons_on_grades_insert();
+CREATE TRIGGER group_subject_last_lessons_grades_update
+    AFTER UPDATE ON grades REFERENCING OLD TABLE AS old_grades NEW TABLE AS new_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION group_subject_last_lessons_on_grades_update();
+CREATE TRIGGER group_subject_last_lessons_grades_delete
+    AFTER DELETE ON grades REFERENCING OLD TABLE AS old_grades
+    FOR EACH STATEMENT EXECUTE FUNCTION group_subject_last_lessons_on_grades_delete();
+CREATE TRIGGER group_subject_last_lessons_grades_truncate
+    AFTER TRUNCATE ON grades
+    FOR EACH STATEMENT EXECUTE FUNCTION group_subject_last_lessons_on_grades_truncate();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "group_subject_last_lessons",
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("subject_id", sa.UUID(), nullable=False),
+        sa.Column("last_task_number", sa.Integer(), nullable=False),
+        sa.Column("last_graded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["subject_id"], ["subjects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "group_id",
+            "subject_id",
+            name="pk_group_subject_last_lessons",
+            postgresql_include=["last_task_number", "last_graded_at"],
+        ),
+    )
+
+    op.execute(REFRESH_FUNCTION)
+    op.execute(INSERT_TRIGGER_FUNCTION)
+    op.execute(UPDATE_TRIGGER_FUNCTION)
+    op.execute(DELETE_TRIGGER_FUNCTION)
+    op.execute(TRUNCATE_TRIGGER_FUNCTION)
+
+    # Writes to grades are blocked until the migration commits,
+    # so pointers of existing grades are computed consistently before triggers take over
+    op.execute("LOCK TABLE grades IN SHARE MODE")
+    op.execute(TRIGGERS)
+    op.execute("SELECT refresh_group_subject_last_lessons()")
+    op.execute("ANALYZE group_subject_last_lessons")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger_name in (
+        "group_subject_last_lessons_grades_truncate",
+        "group_subject_last_lessons_grades_delete",
+        "group_subject_last_lessons_grades_update",
+        "group_subject_last_lessons_grades_insert",
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON grades")
+
+    for function_name in (
+        "group_subject_last_lessons_on_grades_truncate()",
+        "group_subject_last_lessons_on_grades_delete()",
+        "group_subject_last_lessons_on_grades_update()",
+        "group_subject_last_lessons_on_grades_insert()",
+        "refresh_group_subject_last_lessons(uuid[])",
+    ):
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}")
+
+    op.drop_table("group_subject_last_lessons")
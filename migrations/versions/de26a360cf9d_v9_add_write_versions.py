@@ -0,0 +1,90 @@
+"""v9 Add write_versions counters bumped by writes to report tables
+
+Revision ID: de26a360cf9d
+Revises: 9db72a7bbc73
+Create Date: 2026-10-17 23:12:40.518306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "de26a360cf9d"
+down_revision: Union[str, Sequence[str], None] = "9db72a7bbc73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same as WRITE_VERSION_SLOTS of the model at the time of the migration
+SLOTS = 16
+
+# Tables read by reports. The student_subject_stats summary is left out: it is
+# written by triggers on grades (once per inserted statement) and rebuilt with them.
+VERSIONED_TABLES = (
+    "grades",
+    "students",
+    "personal_data",
+    "groups",
+    "subjects",
+    "teachers",
+    "group_subject_association",
+)
+
+# Also called directly when grades are removed without a statement on grades
+# (detached partitions)
+BUMP_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION bump_write_version()
+RETURNS void LANGUAGE sql AS $$
+    UPDATE write_versions SET version = version + 1
+    WHERE slot = pg_backend_pid() % {SLOTS};
+$$;
+"""
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION write_versions_on_write()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM bump_write_version();
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def trigger_name(table_name: str) -> str:
+    return f"write_versions_{table_name}_write"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "write_versions",
+        sa.Column("slot", sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("slot"),
+    )
+    op.execute(
+        f"INSERT INTO write_versions (slot, version) SELECT generate_series(0, {SLOTS - 1}), 0"
+    )
+
+    op.execute(BUMP_FUNCTION)
+    op.execute(TRIGGER_FUNCTION)
+    # Statement-level triggers: a multi-row insert or COPY bumps the version once
+    for table_name in VERSIONED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {trigger_name(table_name)} "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION write_versions_on_write()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name(table_name)} ON {table_name}")
+    op.execute("DROP FUNCTION IF EXISTS write_versions_on_write()")
+    op.execute("DROP FUNCTION IF EXISTS bump_write_version()")
+    op.drop_table("write_versions")
@@ -0,0 +1,56 @@
+"""v5 Add partial indexes of tombstones (soft-deleted rows)
+
+Revision ID: e1a7c4b90f26
+Revises: 9d5f3a61c2e8
+Create Date: 2026-10-17 15:02:18.904417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a7c4b90f26"
+down_revision: Union[str, Sequence[str], None] = "9d5f3a61c2e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOMBSTONES = sa.text("is_deleted = true")
+
+# Tombstones of large tables are found by the purge job and excluded from
+# summaries with these indexes, they stay small as only deleted rows are indexed
+TOMBSTONE_INDEXES = (
+    ("ix_grades_deleted_at_tombstones", "grades"),
+    ("ix_students_deleted_at_tombstones", "students"),
+    ("ix_personal_data_deleted_at_tombstones", "personal_data"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table_name in TOMBSTONE_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                ["deleted_at"],
+                postgresql_where=TOMBSTONES,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name in TOMBSTONE_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,81 @@
+"""v14 Index live grades of groups in subjects by task number (last lesson)
+
+Revision ID: e3f074534255
+Revises: 984b7db3442a
+Create Date: 2026-10-18 15:31:47.092614
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f074534255"
+down_revision: Union[str, Sequence[str], None] = "984b7db3442a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text("is_deleted = false")
+
+# The last lesson is the highest task number of a group in a subject, so grades
+# of it are found by the task number; queries of all grades of a group in
+# a subject (select_7, recomputing of pointers) use the new index as well
+NEW_INDEX = "ix_grades_subject_id_group_id_task_number_live"
+NEW_COLUMNS = ["subject_id", "group_id", "task_number"]
+NEW_INCLUDE = ["student_id", "grade", "created_at"]
+
+OLD_INDEX = "ix_grades_subject_id_group_id_created_at_live"
+OLD_COLUMNS = ["subject_id", "group_id", "created_at"]
+OLD_INCLUDE = ["student_id", "task_number", "grade"]
+
+PARTITIONS_QUERY = sa.text(
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = 'grades'::regclass "
+    "ORDER BY child.relname"
+)
+
+
+def create_grades_index(
+    index_name: str, columns: list[str], include: list[str], suffix: str
+) -> None:
+    """
+    Create the index of partitioned grades without blocking writes, like migration v7:
+    on the parent only, then concurrently on each partition attached to it.
+    """
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {index_name} ON ONLY grades ({', '.join(columns)}) "
+        f"INCLUDE ({', '.join(include)}) WHERE {LIVE_ROWS}"
+    )
+    partitions = op.get_bind().execute(PARTITIONS_QUERY).scalars().all()
+    for partition in partitions:
+        partition_index = f"{partition}_{suffix}_idx"
+        op.create_index(
+            partition_index,
+            partition,
+            columns,
+            postgresql_include=include,
+            postgresql_where=LIVE_ROWS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute(f"ALTER INDEX {index_name} ATTACH PARTITION {partition_index}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        create_grades_index(NEW_INDEX, NEW_COLUMNS, NEW_INCLUDE, "subject_group_task")
+    # Indexes of partitioned tables can't be dropped concurrently
+    op.drop_index(OLD_INDEX, table_name="grades", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        create_grades_index(OLD_INDEX, OLD_COLUMNS, OLD_INCLUDE, "subject_group_created")
+    op.drop_index(NEW_INDEX, table_name="grades", if_exists=True)
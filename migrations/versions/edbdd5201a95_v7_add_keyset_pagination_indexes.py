@@ -0,0 +1,93 @@
+"""v7 Add (created_at, id) indexes of live rows for keyset pagination
+
+Revision ID: edbdd5201a95
+Revises: 5c8e2f7b1d94
+Create Date: 2026-10-17 19:12:40.518306
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "edbdd5201a95"
+down_revision: Union[str, Sequence[str], None] = "5c8e2f7b1d94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text("is_deleted = false")
+
+PAGINATION_INDEXES = (
+    ("ix_groups_created_at_id_live", "groups"),
+    ("ix_subjects_created_at_id_live", "subjects"),
+    ("ix_teachers_created_at_id_live", "teachers"),
+    ("ix_students_created_at_id_live", "students"),
+    ("ix_personal_data_created_at_id_live", "personal_data"),
+)
+GRADES_INDEX = "ix_grades_created_at_id_live"
+
+PARTITIONS_QUERY = sa.text(
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = 'grades'::regclass "
+    "ORDER BY child.relname"
+)
+
+
+def create_grades_index() -> None:
+    """
+    Create the index of partitioned grades without blocking writes.
+
+    CREATE INDEX CONCURRENTLY isn't supported on partitioned tables, so the
+    index is created on the parent only (invalid until all partitions have it),
+    then concurrently on each partition and attached to the parent.
+    """
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {GRADES_INDEX} ON ONLY grades (created_at, id) "
+        f"WHERE {LIVE_ROWS}"
+    )
+    partitions = op.get_bind().execute(PARTITIONS_QUERY).scalars().all()
+    for partition in partitions:
+        partition_index = f"{partition}_created_at_id_idx"
+        op.create_index(
+            partition_index,
+            partition,
+            ["created_at", "id"],
+            postgresql_where=LIVE_ROWS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute(f"ALTER INDEX {GRADES_INDEX} ATTACH PARTITION {partition_index}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table_name in PAGINATION_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                ["created_at", "id"],
+                postgresql_where=LIVE_ROWS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        create_grades_index()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Indexes of partitioned tables can't be dropped concurrently
+    op.drop_index(GRADES_INDEX, table_name="grades", if_exists=True)
+    with op.get_context().autocommit_block():
+        for index_name, table_name in PAGINATION_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -1,10 +1,24 @@
 """
 Database utilities and ORM models.
-Exposes url_to_db for migrations and configurations.
+Exposes database URL and engine factory for migrations and configurations.
+
+Configuration file is read lazily, so importing this package (e.g. models)
+doesn't require `config.ini`.
 """
 
-from .connection import url_to_db
+from .connection import create_db_engine, get_engine, get_pool_status, get_url_to_db
 
 __all__ = [
+    "create_db_engine",
+    "get_engine",
+    "get_pool_status",
+    "get_url_to_db",
     "url_to_db",
 ]
+
+
+def __getattr__(name: str):
+    # url_to_db is resolved lazily on first access
+    if name == "url_to_db":
+        return get_url_to_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
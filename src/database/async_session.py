@@ -0,0 +1,107 @@
+"""
+Async database session management module.
+
+This module provides an asyncio counterpart of `session_scope` built on
+SQLAlchemy's AsyncEngine/AsyncSession with the asyncpg driver. It uses the same
+models and `config.ini`, with its own connection pool configured in the optional
+[ASYNC_POOL] section. The engine is created lazily on first use.
+Like sync sessions, async sessions hide soft-deleted rows from ORM queries.
+
+Note: asyncpg connections are tied to the event loop they were opened in,
+so `dispose_async_engine()` should be awaited before the loop is closed.
+"""
+
+import functools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from .connection import (
+    get_async_pool_settings,
+    get_async_url_to_db,
+    get_instrumentation_settings,
+)
+from .instrumentation import instrument_engine
+from .soft_delete import SoftDeleteSession
+
+# Loaded objects stay usable after commit, as lazy refresh can't happen implicitly
+AsyncSessionFactory = async_sessionmaker(
+    expire_on_commit=False, sync_session_class=SoftDeleteSession
+)
+
+
+def create_async_db_engine(url: str | None = None, **kwargs) -> AsyncEngine:
+    """
+    Create an async SQLAlchemy engine configured with [ASYNC_POOL] settings.
+
+    Keyword arguments are passed to `create_async_engine` and override defaults.
+    Pool sizing options are skipped when a custom `poolclass` is given.
+    """
+    settings = dict(get_async_pool_settings())
+    statement_timeout = settings.pop("statement_timeout")
+
+    options = {"echo": False}
+    if statement_timeout > 0:
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(statement_timeout)}
+        }
+
+    if "poolclass" not in kwargs:
+        options.update(settings)
+
+    options.update(kwargs)
+    engine = create_async_engine(url or get_async_url_to_db(), **options)
+
+    instrumentation = get_instrumentation_settings()
+    if instrumentation["enabled"]:
+        instrument_engine(engine.sync_engine, top_n=instrumentation["top_n"])
+    return engine
+
+
+@functools.cache
+def get_async_engine() -> AsyncEngine:
+    """Return the application async engine, creating it on the first call."""
+    return create_async_db_engine()
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled connections of the application async engine."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """
+    Provide a transactional scope around a series of async operations.
+
+    Same semantics as `session_scope`: commits when the block completes,
+    rolls back and re-raises on any exception, and always closes the session.
+
+    Usage:
+        async with async_session_scope() as session:
+            session.add(obj)
+            result = await session.execute(select(MyModel))
+
+    Yields:
+        sqlalchemy.ext.asyncio.AsyncSession: The SQLAlchemy async session object.
+
+    Raises:
+        Exception: Re-raises any exception that occurs within the context block
+                   after rolling back the transaction.
+    """
+    session = AsyncSessionFactory(bind=get_async_engine())
+    try:
+        yield session
+        await session.commit()
+    except:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
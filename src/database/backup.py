@@ -0,0 +1,220 @@
+"""
+Bulk export and import of all tables through PostgreSQL COPY.
+
+Every table is streamed by `COPY ... TO STDOUT` / `COPY ... FROM STDIN` into or
+out of its own file (`<table>.csv` or `<table>.bin`, optionally gzip-compressed)
+with psycopg2 `copy_expert`, which moves data in small chunks, so memory use
+doesn't depend on the size of tables. Soft-deleted rows are included.
+
+    export   All tables are read in one REPEATABLE READ transaction (a consistent
+             snapshot) and described in `manifest.json` (columns, rows, schema
+             revision and the time range of grades).
+    import   Tables are loaded in foreign key order in one transaction, so a failed
+             import leaves the database unchanged. Missing partitions of grades are
+             created first. The `student_subject_stats` summary is not exported:
+             its insert trigger is disabled while grades are loaded and the summary
+             is rebuilt once at the end.
+
+The binary format is faster to write and parse, but can only be imported into
+the same schema (column types). CSV files have a header and may be edited.
+"""
+
+import datetime
+import gzip
+import json
+from pathlib import Path
+from typing import IO, NamedTuple
+
+from sqlalchemy import Table, func, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from .models import (
+    Grade,
+    GradeTask,
+    GroupSubjectLastLesson,
+    StudentSubjectStats,
+    WriteVersion,
+)
+from .models.base import Base
+from .partitions import DEFAULT_MONTHS_AHEAD, create_grades_partitions, drop_archive_foreign_keys
+from .soft_delete import INCLUDE_DELETED_OPTION
+from .summary import refresh_student_subject_stats
+
+CSV_FORMAT = "csv"
+BINARY_FORMAT = "binary"
+COPY_FORMATS = (CSV_FORMAT, BINARY_FORMAT)
+
+MANIFEST_FILE = "manifest.json"
+_FILE_SUFFIXES = {CSV_FORMAT: ".csv", BINARY_FORMAT: ".bin"}
+_COPY_OPTIONS = {CSV_FORMAT: "FORMAT csv, HEADER", BINARY_FORMAT: "FORMAT binary"}
+
+# Insert trigger of grades merging them into the summary (see migration v4)
+STATS_INSERT_TRIGGER = "student_subject_stats_grades_insert"
+
+# Tables maintained by triggers, not exported: the summary (rebuilt on import),
+# last lesson pointers and task keys (filled by imported grades) and write
+# version counters (bumped by the import)
+SUMMARY_TABLES = (
+    StudentSubjectStats.__table__,
+    GroupSubjectLastLesson.__table__,
+    GradeTask.__table__,
+)
+DERIVED_TABLES = (*[table.name for table in SUMMARY_TABLES], WriteVersion.__tablename__)
+
+# Tables in foreign key order (referenced tables first), without derived ones
+BACKUP_TABLES: tuple[Table, ...] = tuple(
+    table for table in Base.metadata.sorted_tables if table.name not in DERIVED_TABLES
+)
+
+
+class TableDump(NamedTuple):
+    """Exported table described in the manifest."""
+
+    name: str
+    file: str
+    columns: list[str]
+    rows: int
+
+
+def _open(path: Path, mode: str, compress: bool) -> IO[bytes]:
+    return gzip.open(path, mode, compresslevel=1) if compress else open(path, mode)
+
+
+def _copy_expert(session: Session, statement: str, file: IO[bytes]) -> int:
+    """Run COPY through the raw DBAPI cursor in the transaction of the session."""
+    connection = session.connection()
+    dbapi_error = connection.dialect.loaded_dbapi.Error
+    try:
+        with connection.connection.cursor() as cursor:
+            cursor.copy_expert(statement, file)
+            return cursor.rowcount
+    except dbapi_error as e:
+        # Raw cursor errors are not wrapped by SQLAlchemy
+        raise DBAPIError.instance(statement, None, e, dbapi_error) from e
+
+
+def _column_list(columns: list[str]) -> str:
+    return ", ".join(f'"{column}"' for column in columns)
+
+
+def export_tables(
+    session: Session, directory: Path, fmt: str, compress: bool = False
+) -> list[TableDump]:
+    """
+    Export all tables into files in the directory and write the manifest.
+
+    The session must not be used before, as its transaction is started with
+    REPEATABLE READ isolation to read all tables from the same snapshot.
+    Returns exported tables.
+    """
+    if fmt not in COPY_FORMATS:
+        raise ValueError(f"Unknown COPY format '{fmt}', expected one of {COPY_FORMATS}")
+    session.connection(
+        execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+
+    tables = []
+    for table in BACKUP_TABLES:
+        columns = [column.name for column in table.columns]
+        file_name = table.name + _FILE_SUFFIXES[fmt] + (".gz" if compress else "")
+        # COPY of a query, as partitioned tables (grades) can't be copied directly
+        statement = (
+            f"COPY (SELECT {_column_list(columns)} FROM {table.name}) "
+            f"TO STDOUT WITH ({_COPY_OPTIONS[fmt]})"
+        )
+        with _open(directory / file_name, "wb", compress) as file:
+            rows = _copy_expert(session, statement, file)
+        tables.append(TableDump(table.name, file_name, columns, rows))
+
+    first_grade, last_grade = session.execute(
+        select(func.min(Grade.created_at), func.max(Grade.created_at)),
+        execution_options={INCLUDE_DELETED_OPTION: True},
+    ).one()
+    manifest = {
+        "format": fmt,
+        "compressed": compress,
+        "exported_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "schema_revision": session.scalar(text("SELECT version_num FROM alembic_version")),
+        "grades_created_at": [
+            value.astimezone(datetime.timezone.utc).isoformat() if value else None
+            for value in (first_grade, last_grade)
+        ],
+        "tables": [table._asdict() for table in tables],
+    }
+    (directory / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    return tables
+
+
+def read_manifest(directory: Path) -> dict:
+    """Read and validate the manifest of an export against the current tables."""
+    path = directory / MANIFEST_FILE
+    if not path.exists():
+        raise ValueError(f"Missing {MANIFEST_FILE} in {directory}")
+    manifest = json.loads(path.read_text())
+
+    dumps = {dump["name"]: TableDump(**dump) for dump in manifest["tables"]}
+    for table in BACKUP_TABLES:
+        dump = dumps.get(table.name)
+        if dump is None:
+            raise ValueError(f"Table {table.name} is missing in the export")
+        unknown = set(dump.columns) - set(table.columns.keys())
+        if unknown:
+            raise ValueError(f"Unknown columns of {table.name}: {', '.join(sorted(unknown))}")
+        if not (directory / dump.file).exists():
+            raise ValueError(f"Missing file {dump.file} in {directory}")
+    manifest["tables"] = [dumps[table.name] for table in BACKUP_TABLES]
+    return manifest
+
+
+def import_tables(
+    session: Session, directory: Path, truncate: bool = False
+) -> list[TableDump]:
+    """
+    Import all tables from an export in the directory within the session transaction.
+
+    With `truncate`, all tables (and summaries) are emptied first, otherwise
+    imported rows must not conflict with existing ones. Returns imported tables.
+    """
+    manifest = read_manifest(directory)
+    fmt, compress = manifest["format"], manifest["compressed"]
+
+    if truncate:
+        # Partitions archived before their foreign keys were dropped on archiving
+        # still refer to truncated tables. Archived grades are not exported and
+        # are kept, as live rows they refer to are imported with the same ids.
+        drop_archive_foreign_keys(session)
+        tables = [*BACKUP_TABLES, *SUMMARY_TABLES]
+        session.execute(text(f"TRUNCATE {', '.join(table.name for table in tables)}"))
+
+    first_grade, last_grade = manifest["grades_created_at"]
+    if first_grade:
+        # Partitions from the month of the first grade up to the month of the last one
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        last_month = datetime.datetime.fromisoformat(last_grade).date()
+        months_ahead = (last_month.year - today.year) * 12 + last_month.month - today.month
+        create_grades_partitions(
+            session,
+            months_ahead=max(months_ahead, DEFAULT_MONTHS_AHEAD),
+            start=datetime.datetime.fromisoformat(first_grade).date(),
+        )
+
+    imported = []
+    for table, dump in zip(BACKUP_TABLES, manifest["tables"]):
+        statement = (
+            f"COPY {table.name} ({_column_list(dump.columns)}) "
+            f"FROM STDIN WITH ({_COPY_OPTIONS[fmt]})"
+        )
+        is_grades = table.name == Grade.__tablename__
+        if is_grades:
+            # Merging millions of grades by the trigger is slower than a single rebuild
+            session.execute(text(f"ALTER TABLE grades DISABLE TRIGGER {STATS_INSERT_TRIGGER}"))
+        with _open(directory / dump.file, "rb", compress) as file:
+            rows = _copy_expert(session, statement, file)
+        if is_grades:
+            session.execute(text(f"ALTER TABLE grades ENABLE TRIGGER {STATS_INSERT_TRIGGER}"))
+        imported.append(dump._replace(rows=rows))
+
+    refresh_student_subject_stats(session)
+    return imported
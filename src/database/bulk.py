@@ -0,0 +1,156 @@
+"""
+Bulk write helpers for large data loads.
+
+Rows are plain tuples written through SQLAlchemy Core (multi-row executemany
+batches) or through PostgreSQL COPY, bypassing the ORM unit of work and the
+per-row `RETURNING id` round trips. Primary keys are expected to be generated
+on the client side (see `database.ids.new_uuid`). Missing partitions of written
+grades are created before the write (see `database.partitions`).
+"""
+
+import csv
+import io
+import time
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import Connection, Table
+
+from .models import Grade
+from .partitions import ensure_grades_partitions
+
+INSERT_METHOD = "insert"
+COPY_METHOD = "copy"
+WRITE_METHODS = (INSERT_METHOD, COPY_METHOD)
+
+
+def write_rows(
+    connection: Connection,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    method: str = INSERT_METHOD,
+) -> int:
+    """
+    Write rows (tuples ordered as `columns`) into the table.
+
+    Uses multi-row executemany for the "insert" method and `COPY ... FROM STDIN`
+    for the "copy" method. Runs within the transaction of the given connection.
+
+    Returns:
+        int: Number of written rows.
+    """
+    if method not in WRITE_METHODS:
+        raise ValueError(f"Unknown write method '{method}', expected one of {WRITE_METHODS}")
+
+    rows = rows if isinstance(rows, list) else list(rows)
+    if not rows:
+        return 0
+
+    if table.name == Grade.__tablename__:
+        _ensure_grades_partitions(connection, columns, rows)
+
+    if method == COPY_METHOD:
+        _copy_rows(connection, table, columns, rows)
+    else:
+        connection.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+
+    return len(rows)
+
+
+def _ensure_grades_partitions(
+    connection: Connection, columns: Sequence[str], rows: list[Sequence]
+) -> None:
+    """Create partitions of months of grade rows (of now if not given)."""
+    created_at = []
+    if "created_at" in columns:
+        index = list(columns).index("created_at")
+        created_at = [row[index] for row in rows if row[index] is not None]
+    if len(created_at) < len(rows):
+        # Defaults to now()
+        ensure_grades_partitions(connection)
+    if created_at:
+        ensure_grades_partitions(connection, min(created_at), max(created_at))
+
+
+def _copy_rows(
+    connection: Connection, table: Table, columns: Sequence[str], rows: list[Sequence]
+) -> None:
+    """Stream rows into the table using PostgreSQL COPY in CSV format."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+
+    preparer = connection.dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(column) for column in columns)
+    statement = (
+        f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+    )
+
+    # Raw DBAPI cursor shares the transaction of the SQLAlchemy connection
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(statement, buffer)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most `size` items."""
+    if size < 1:
+        raise ValueError("Chunk size should be a positive integer number")
+
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class WriteStats:
+    """Collects number of written rows and time spent per table."""
+
+    def __init__(self) -> None:
+        self._tables: dict[str, list[float]] = {}
+
+    def record(self, table_name: str, rows: int, seconds: float) -> None:
+        """Add written rows and elapsed time for the table."""
+        totals = self._tables.setdefault(table_name, [0, 0.0])
+        totals[0] += rows
+        totals[1] += seconds
+
+    def timed_write(
+        self,
+        connection: Connection,
+        table: Table,
+        columns: Sequence[str],
+        rows: Iterable[Sequence],
+        method: str = INSERT_METHOD,
+    ) -> int:
+        """Write rows using `write_rows` and record its throughput."""
+        started = time.perf_counter()
+        written = write_rows(connection, table, columns, rows, method=method)
+        self.record(table.name, written, time.perf_counter() - started)
+        return written
+
+    def merge(self, other: "WriteStats") -> None:
+        """Add statistics collected by another instance (e.g. by a worker process)."""
+        for table_name, (rows, seconds) in other._tables.items():
+            self.record(table_name, rows, seconds)
+
+    def tables(self) -> list[str]:
+        """Return names of written tables in order of writing."""
+        return list(self._tables)
+
+    def rows(self, table_name: str) -> int:
+        """Return number of rows written into the table so far."""
+        return int(self._tables.get(table_name, [0, 0.0])[0])
+
+    def print_report(self) -> None:
+        """Print rows per second for each written table."""
+        print("📊 Bulk write throughput:")
+        for table_name, (rows, seconds) in self._tables.items():
+            rate = rows / seconds if seconds > 0 else 0.0
+            print(
+                f"    {table_name + ':':<27}{int(rows):>12,} rows in {seconds:8.2f}s "
+                f"({rate:,.0f} rows/s)"
+            )
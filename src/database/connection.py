@@ -3,47 +3,236 @@ Database connection configuration module.
 
 This module reads database connection settings from `config.ini`
 and constructs a SQLAlchemy-compatible database URL and engine.
+
+Configuration is read and the engine is created lazily on first use
+(see `get_url_to_db` and `get_engine`) and then cached, so importing models
+does not require `config.ini` and does not open any database resources.
+
+Connection pool can be tuned in the optional [POOL] section of `config.ini`.
+All engines should be created with `create_db_engine` factory, so they share
+the same pool settings and statistics of connection checkouts, and are
+instrumented when SQL instrumentation is enabled (see `instrumentation` module).
 """
 
+import os
 import sys
 import configparser
+import functools
+import threading
+import time
 from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.pool import QueuePool
 
-from sqlalchemy import create_engine
+from .instrumentation import DEFAULT_TOP_N, ENV_VARIABLE, instrument_engine
 
-# Read database configuration from config file
 db_config_file = Path(__file__).parent.parent.parent.joinpath("config.ini").resolve()
-config = configparser.ConfigParser()
-if not db_config_file.exists():
-    sys.exit(
-        f"❌ Missing configuration file: {db_config_file}\n"
-        "Please copy 'config.ini.example' to 'config.ini' and update the values."
-    )
-config.read(db_config_file)
-
-if "DB" not in config:
-    sys.exit(
-        f"❌ Missing [DB] section in {db_config_file}\n"
-        "Please ensure it has the following format:\n\n"
-        "[DB]\nUSER=your_user\nPASSWORD=your_password\nHOST=localhost\nPORT=5432\nDB_NAME=your_db\n"
-    )
-
-try:
-    db_user = config.get("DB", "USER")
-    db_password = config.get("DB", "PASSWORD")
-    db_host = config.get("DB", "HOST")
-    db_port = config.get("DB", "PORT")
-    db_name = config.get("DB", "DB_NAME")
-except configparser.NoOptionError as e:
-    sys.exit(f"❌ Missing required option in [DB] section: {e}")
-# db_user = config.get("DB", "user")
-# db_password = config.get("DB", "password")
-# db_host = config.get("DB", "host")
-# db_port = config.get("DB", "port")
-# db_name = config.get("DB", "db_name")
-
-url_to_db = (
-    f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-)
-
-engine = create_engine(url_to_db, echo=False)
+
+
+@functools.cache
+def load_config() -> configparser.ConfigParser:
+    """Read and validate configuration file (only once)."""
+    config = configparser.ConfigParser()
+    if not db_config_file.exists():
+        sys.exit(
+            f"❌ Missing configuration file: {db_config_file}\n"
+            "Please copy 'config.ini.example' to 'config.ini' and update the values."
+        )
+    config.read(db_config_file)
+
+    if "DB" not in config:
+        sys.exit(
+            f"❌ Missing [DB] section in {db_config_file}\n"
+            "Please ensure it has the following format:\n\n"
+            "[DB]\nUSER=your_user\nPASSWORD=your_password\nHOST=localhost\nPORT=5432\nDB_NAME=your_db\n"
+        )
+
+    return config
+
+
+@functools.cache
+def get_url_to_db() -> str:
+    """Construct database URL from the [DB] section of configuration file."""
+    config = load_config()
+    try:
+        db_user = config.get("DB", "USER")
+        db_password = config.get("DB", "PASSWORD")
+        db_host = config.get("DB", "HOST")
+        db_port = config.get("DB", "PORT")
+        db_name = config.get("DB", "DB_NAME")
+    except configparser.NoOptionError as e:
+        sys.exit(f"❌ Missing required option in [DB] section: {e}")
+
+    return f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+
+
+@functools.cache
+def get_async_url_to_db() -> str:
+    """Construct database URL for the asyncpg driver (used by async sessions)."""
+    return get_url_to_db().replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+
+
+def read_pool_settings(section: str) -> dict:
+    """Read connection pool settings, all options of the section are optional."""
+    config = load_config()
+    try:
+        return {
+            "pool_size": config.getint(section, "SIZE", fallback=5),
+            "max_overflow": config.getint(section, "MAX_OVERFLOW", fallback=10),
+            "pool_timeout": config.getfloat(section, "POOL_TIMEOUT", fallback=30.0),
+            "pool_recycle": config.getint(section, "POOL_RECYCLE", fallback=1800),
+            "pool_pre_ping": config.getboolean(section, "PRE_PING", fallback=True),
+            # Maximum execution time of a statement in milliseconds, 0 disables the limit
+            "statement_timeout": config.getint(section, "STATEMENT_TIMEOUT", fallback=0),
+        }
+    except ValueError as e:
+        sys.exit(f"❌ Invalid option value in [{section}] section: {e}")
+
+
+@functools.cache
+def get_pool_settings() -> dict:
+    """Read settings of the connection pool from [POOL] section."""
+    return read_pool_settings("POOL")
+
+
+@functools.cache
+def get_async_pool_settings() -> dict:
+    """Read settings of the async connection pool from [ASYNC_POOL] section."""
+    return read_pool_settings("ASYNC_POOL")
+
+
+@functools.cache
+def get_instrumentation_settings() -> dict:
+    """
+    Read SQL instrumentation settings from the optional [INSTRUMENTATION] section.
+
+    `SQL_INSTRUMENTATION` environment variable overrides the ENABLED option.
+    """
+    config = load_config()
+    try:
+        enabled = config.getboolean("INSTRUMENTATION", "ENABLED", fallback=False)
+        top_n = config.getint("INSTRUMENTATION", "TOP_N", fallback=DEFAULT_TOP_N)
+        value = os.environ.get(ENV_VARIABLE, "").lower()
+        if value:
+            if value not in config.BOOLEAN_STATES:
+                raise ValueError(f"{ENV_VARIABLE}={value} is not a boolean")
+            enabled = config.BOOLEAN_STATES[value]
+    except ValueError as e:
+        sys.exit(f"❌ Invalid SQL instrumentation setting: {e}")
+    return {"enabled": enabled, "top_n": top_n}
+
+
+class CheckoutStats:
+    """Thread-safe statistics of time spent to check out connections from a pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        # Called with every checkout time, set by SQL instrumentation
+        self.observer: Callable[[float], None] | None = None
+
+    def record(self, seconds: float) -> None:
+        """Register a single checkout and time it took."""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+        if self.observer is not None:
+            self.observer(seconds)
+
+    def as_dict(self) -> dict:
+        """Return statistics as a dictionary (times in milliseconds)."""
+        with self._lock:
+            average = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "checkout_wait_total_ms": round(self.total_wait * 1000, 3),
+                "checkout_wait_avg_ms": round(average * 1000, 3),
+                "checkout_wait_max_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool which measures time spent waiting for a connection.
+
+    The measured time includes waiting for a free connection and opening
+    a new one when the pool has not reached its size yet.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        connection = super().connect()
+        self.checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+def create_db_engine(url: str | None = None, **kwargs) -> Engine:
+    """
+    Create a SQLAlchemy engine configured with [POOL] settings.
+
+    Keyword arguments are passed to `create_engine` and override defaults.
+    Pool sizing options are skipped when a custom `poolclass` is given
+    (e.g. `NullPool` for migrations), as they may not be supported by it.
+    """
+    settings = dict(get_pool_settings())
+    statement_timeout = settings.pop("statement_timeout")
+
+    options = {"echo": False}
+    if statement_timeout > 0:
+        options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+
+    if "poolclass" not in kwargs:
+        options.update(poolclass=TimedQueuePool, **settings)
+
+    options.update(kwargs)
+    engine = create_engine(url or get_url_to_db(), **options)
+
+    instrumentation = get_instrumentation_settings()
+    if instrumentation["enabled"]:
+        instrument_engine(engine, top_n=instrumentation["top_n"])
+    return engine
+
+
+@functools.cache
+def get_engine() -> Engine:
+    """Return the application engine, creating it on the first call."""
+    return create_db_engine()
+
+
+def get_pool_status(db_engine: Engine | None = None) -> dict:
+    """
+    Return current state of the engine connection pool.
+
+    Includes number of connections in use (checked out) and idle in the pool,
+    and checkout wait time statistics collected by `TimedQueuePool`.
+    """
+    pool = (db_engine or get_engine()).pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, TimedQueuePool):
+        status.update(pool.checkout_stats.as_dict())
+    return status
+
+
+def __getattr__(name: str):
+    # Lazy module attributes kept for backward compatibility
+    if name == "url_to_db":
+        return get_url_to_db()
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,409 @@
+"""
+Batched create, update and remove of model rows and their keyset listing.
+
+Used by the CRUD command line interface (`src/main.py`). Records are plain
+dictionaries of field values (e.g. parsed from NDJSON or CSV), converted and
+validated by `parse_record`, and written by a few statements per batch
+through SQLAlchemy Core, bypassing the ORM unit of work:
+
+    create   INSERT ... ON CONFLICT DO UPDATE: records with an id of an existing
+             row update it (and restore it if soft-deleted), so imports may be
+             repeated. Records without an id get a client generated one.
+    update   UPDATE ... FROM (VALUES ...) of live rows by id.
+    remove   Soft-delete by id, tombstones are hard-deleted later by
+             `scripts/purge_deleted.py`.
+
+Missing partitions of months of created and updated grades are created before
+the write (see `partitions.ensure_grades_partitions`), so historical grades are
+accepted as well.
+
+Teachers and students carry `first_name` and `last_name` of their personal data,
+written in the same transaction. Students and grades may refer to groups and
+subjects by their natural keys (`group_name`, `subject_title`) instead of ids,
+resolved through the lookup cache, so records of an import don't query them
+again. Listing pages by id (keyset pagination) and streams rows of a page with
+a server-side cursor, so memory use doesn't depend on the number of listed rows.
+"""
+
+import datetime
+import functools
+import uuid
+from typing import Any, Callable, Iterator, NamedTuple
+
+from sqlalchemy import Row, String, column, false, func, select, true, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from utils.constants import (
+    MAX_NAME_LEN,
+    MAX_PERSON_NAME_LEN,
+    MAX_SUBJECT_TITLE_LEN,
+    MIN_NAME_LEN,
+    MIN_SUBJECT_TITLE_LEN,
+)
+from utils.validators import validate_date, validate_positive_number, validate_text_field
+
+from .ids import new_uuid
+from .lookup_cache import get_group_by_name, get_subject_by_title
+from .models import Grade, Group, PersonalData, Student, Subject, Teacher
+from .models.base_model import BaseModel
+from .partitions import ensure_grades_partitions
+
+PERSON_FIELDS = ("first_name", "last_name")
+
+Converter = Callable[[str, Any], Any]
+
+
+def to_uuid(key: str, value) -> uuid.UUID:
+    """Convert value to UUID."""
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise ValueError(f"Field '{key}' must be a valid UUID, got '{value}'") from None
+
+
+def to_date(key: str, value) -> datetime.date:
+    """Convert ISO formatted string to date."""
+    if isinstance(value, str):
+        try:
+            value = datetime.date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Field '{key}' must be a valid date, got '{value}'") from None
+    return validate_date(key, value)
+
+
+def to_datetime(key: str, value) -> datetime.datetime:
+    """Convert ISO formatted string to timezone aware datetime (UTC if not given)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(
+                f"Field '{key}' must be a valid datetime, got '{value}'"
+            ) from None
+    if not isinstance(value, datetime.datetime):
+        raise ValueError(f"Field '{key}' must be a valid datetime object")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+person_name = functools.partial(
+    validate_text_field, min_len=MIN_NAME_LEN, max_len=MAX_PERSON_NAME_LEN
+)
+group_name = functools.partial(validate_text_field, min_len=MIN_NAME_LEN, max_len=MAX_NAME_LEN)
+subject_title = functools.partial(
+    validate_text_field, min_len=MIN_SUBJECT_TITLE_LEN, max_len=MAX_SUBJECT_TITLE_LEN
+)
+
+
+class ModelSpec(NamedTuple):
+    """Fields of a model accepted by CRUD operations."""
+
+    model: type[BaseModel]
+    # Converters (validators) of fields by name, `id` is accepted by all models
+    fields: dict[str, Converter]
+    # Fields required to create a row
+    required: tuple[str, ...]
+    # Fields which may be set to None (null)
+    nullable: tuple[str, ...] = ()
+    # Factories of values of fields not given on create
+    defaults: dict[str, Callable[[], Any]] = {}
+    # Names are stored in personal data
+    has_personal_data: bool = False
+    # Columns of the primary key besides id (partition key)
+    key_columns: tuple[str, ...] = ()
+    # Natural keys accepted instead of id fields (natural key: id field)
+    natural_keys: dict[str, str] = {}
+    # Called with rows before they are written (e.g. to create their partitions)
+    prepare_rows: Callable[[Session, list[dict]], None] | None = None
+
+
+class NaturalKey(NamedTuple):
+    """Field referring to a row by its natural key instead of id."""
+
+    convert: Converter
+    lookup: Callable[[Session, str], Any]
+
+
+def ensure_partitions_of_grades(session: Session, rows: list[dict]) -> None:
+    """Create missing partitions of months of grades created at given times."""
+    created_at = [row["created_at"] for row in rows if row.get("created_at")]
+    if created_at:
+        ensure_grades_partitions(session, min(created_at), max(created_at))
+
+
+NATURAL_KEYS = {
+    "group_name": NaturalKey(group_name, get_group_by_name),
+    "subject_title": NaturalKey(subject_title, get_subject_by_title),
+}
+
+
+MODEL_SPECS = {
+    "Group": ModelSpec(
+        model=Group,
+        fields={
+            "name": group_name,
+            "start_date": to_date,
+        },
+        required=("name",),
+        defaults={"start_date": datetime.date.today},
+    ),
+    "Subject": ModelSpec(
+        model=Subject,
+        fields={
+            "title": subject_title,
+            "teacher_id": to_uuid,
+        },
+        required=("title", "teacher_id"),
+    ),
+    "Teacher": ModelSpec(
+        model=Teacher,
+        fields={"first_name": person_name, "last_name": person_name},
+        required=PERSON_FIELDS,
+        has_personal_data=True,
+    ),
+    "Student": ModelSpec(
+        model=Student,
+        fields={"first_name": person_name, "last_name": person_name, "group_id": to_uuid},
+        required=PERSON_FIELDS,
+        nullable=("group_id",),
+        has_personal_data=True,
+        natural_keys={"group_name": "group_id"},
+    ),
+    "Grade": ModelSpec(
+        model=Grade,
+        fields={
+            "student_id": to_uuid,
+            "group_id": to_uuid,
+            "subject_id": to_uuid,
+            "task_number": validate_positive_number,
+            "grade": validate_positive_number,
+            "created_at": to_datetime,
+        },
+        required=("student_id", "group_id", "subject_id", "task_number", "grade"),
+        defaults={"created_at": lambda: datetime.datetime.now(datetime.timezone.utc)},
+        key_columns=("created_at",),
+        natural_keys={"group_name": "group_id", "subject_title": "subject_id"},
+        prepare_rows=ensure_partitions_of_grades,
+    ),
+}
+
+
+def parse_record(spec: ModelSpec, raw: dict, for_create: bool = False) -> dict:
+    """
+    Convert and validate fields of a raw record.
+
+    Empty strings (e.g. empty CSV cells) mean the field is not given.
+    Records to create get all fields, with defaults and a new id if not given.
+    Other records must have an id. Natural keys are kept, to be resolved into ids
+    by `resolve_natural_keys`.
+    """
+    record = {}
+    for key, value in raw.items():
+        if key in spec.natural_keys:
+            if value != "":
+                record[key] = NATURAL_KEYS[key].convert(key, value)
+            continue
+        if key != "id" and key not in spec.fields:
+            raise ValueError(f"Unknown field '{key}' of {spec.model.__name__}")
+        if value == "":
+            continue
+        if value is None:
+            if key not in spec.nullable:
+                raise ValueError(f"Field '{key}' cannot be None")
+            record[key] = None
+            continue
+        convert = to_uuid if key == "id" else spec.fields[key]
+        record[key] = convert(key, value)
+
+    if not for_create:
+        if "id" not in record:
+            raise ValueError("Field 'id' is required")
+        return record
+
+    given = {*record, *(spec.natural_keys[key] for key in record if key in spec.natural_keys)}
+    missing = [key for key in spec.required if key not in given]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    record.setdefault("id", new_uuid())
+    for key in spec.fields:
+        if key not in record:
+            default = spec.defaults.get(key)
+            record[key] = default() if default else None
+    return record
+
+
+def resolve_natural_keys(session: Session, spec: ModelSpec, records: list[dict]) -> None:
+    """Replace natural keys of parsed records with ids of the rows they refer to."""
+    for record in records:
+        for key in spec.natural_keys.keys() & record.keys():
+            value = record.pop(key)
+            row = NATURAL_KEYS[key].lookup(session, value)
+            if row is None:
+                raise ValueError(f"No {key.replace('_', ' ')} '{value}' found")
+            record[spec.natural_keys[key]] = row.id
+
+
+def _upsert(session: Session, table, rows: list[dict], key_columns: list[str]) -> None:
+    """Insert rows, updating (and restoring) existing rows with the same key."""
+    stmt = insert(table)
+    updated = {
+        name: stmt.excluded[name] for name in rows[0] if name not in key_columns
+    }
+    stmt = stmt.on_conflict_do_update(
+        index_elements=key_columns, set_={**updated, "updated_at": func.now()}
+    )
+    session.execute(stmt, rows)
+
+
+def create_records(session: Session, spec: ModelSpec, records: list[dict]) -> int:
+    """Create (or update existing) rows of records parsed with `for_create=True`."""
+    if not records:
+        return 0
+    resolve_natural_keys(session, spec, records)
+    table = spec.model.__table__
+    # A row can't be upserted twice by one statement, the last record wins
+    records = list({record["id"]: record for record in records}.values())
+    ids = [record["id"] for record in records]
+    rows = [{**record, "is_deleted": False, "deleted_at": None} for record in records]
+
+    if spec.key_columns:
+        # Existing rows are matched by their full primary key (incl. partition key)
+        existing_keys = {
+            row.id: row
+            for row in session.execute(
+                select(table.c.id, *[table.c[name] for name in spec.key_columns])
+                .where(table.c.id.in_(ids))
+            )
+        }
+        for row in rows:
+            if row["id"] in existing_keys:
+                row.update(existing_keys[row["id"]]._mapping)
+
+    if spec.has_personal_data:
+        personal_data_ids = {
+            id_: personal_data_id
+            for id_, personal_data_id in session.execute(
+                select(table.c.id, table.c.personal_data_id).where(table.c.id.in_(ids))
+            )
+        }
+        personal_data_rows = []
+        for row in rows:
+            personal_data_id = personal_data_ids.get(row["id"]) or new_uuid()
+            personal_data_rows.append(
+                {
+                    "id": personal_data_id,
+                    **{name: row.pop(name) for name in PERSON_FIELDS},
+                    "is_deleted": False,
+                    "deleted_at": None,
+                }
+            )
+            row["personal_data_id"] = personal_data_id
+        _upsert(session, PersonalData.__table__, personal_data_rows, ["id"])
+
+    if spec.prepare_rows:
+        spec.prepare_rows(session, rows)
+    _upsert(session, table, rows, ["id", *spec.key_columns])
+    return len(rows)
+
+
+def _values_of(records: list[dict], names: list[str], table_types: dict) -> Any:
+    """VALUES construct of the records fields, usable in UPDATE ... FROM."""
+    columns = [column(name, table_types[name]) for name in names]
+    return values(*columns, name="data").data(
+        [tuple(record[name] for name in names) for record in records]
+    )
+
+
+def update_records(session: Session, spec: ModelSpec, records: list[dict]) -> int:
+    """Update given fields of live rows by id, return number of updated rows."""
+    resolve_natural_keys(session, spec, records)
+    if spec.prepare_rows:
+        spec.prepare_rows(session, records)
+    table = spec.model.__table__
+    column_types = {name: table.c[name].type for name in ("id", *spec.fields) if name in table.c}
+    column_types.update({name: String() for name in PERSON_FIELDS})
+
+    # Records with the same set of fields are updated by a single statement
+    groups: dict[tuple[str, ...], list[dict]] = {}
+    for record in records:
+        groups.setdefault(tuple(sorted(record)), []).append(record)
+
+    updated = 0
+    for names, group in groups.items():
+        person_names = [name for name in names if name in PERSON_FIELDS]
+        own_names = [name for name in names if name != "id" and name not in PERSON_FIELDS]
+
+        if person_names:
+            personal_data = PersonalData.__table__
+            data = _values_of(group, ["id", *person_names], column_types)
+            result = session.execute(
+                update(personal_data)
+                .where(
+                    personal_data.c.id == table.c.personal_data_id,
+                    table.c.id == data.c.id,
+                    table.c.is_deleted == false(),
+                )
+                .values(
+                    {**{name: data.c[name] for name in person_names}, "updated_at": func.now()}
+                )
+            )
+            if not own_names:
+                updated += result.rowcount
+
+        if own_names:
+            data = _values_of(group, ["id", *own_names], column_types)
+            result = session.execute(
+                update(table)
+                .where(table.c.id == data.c.id, table.c.is_deleted == false())
+                .values({**{name: data.c[name] for name in own_names}, "updated_at": func.now()})
+            )
+            updated += result.rowcount
+    return updated
+
+
+def remove_records(session: Session, spec: ModelSpec, ids: list[uuid.UUID]) -> int:
+    """Soft-delete live rows by id, return number of removed rows."""
+    table = spec.model.__table__
+    result = session.execute(
+        update(table)
+        .where(table.c.id.in_(ids), table.c.is_deleted == false())
+        .values(is_deleted=true(), deleted_at=func.now())
+    )
+    return result.rowcount
+
+
+def list_columns(spec: ModelSpec) -> list[str]:
+    """Names of columns of listed rows."""
+    names = ["id", *spec.fields]
+    return names + [name for name in ("created_at", "updated_at") if name not in names]
+
+
+def iter_page(
+    session: Session,
+    spec: ModelSpec,
+    after: uuid.UUID | None,
+    page_size: int,
+    chunk_size: int,
+) -> Iterator[Row]:
+    """
+    Yield up to `page_size` live rows ordered by id, following the `after` id.
+
+    Rows are fetched from a server-side cursor in chunks of `chunk_size` rows.
+    """
+    model = spec.model
+    columns = []
+    for name in list_columns(spec):
+        source = PersonalData if name in PERSON_FIELDS else model
+        columns.append(getattr(source, name))
+
+    stmt = select(*columns).order_by(model.id).limit(page_size)
+    if spec.has_personal_data:
+        stmt = stmt.join(PersonalData, PersonalData.id == model.personal_data_id)
+    if after is not None:
+        stmt = stmt.where(model.id > after)
+
+    yield from session.execute(stmt, execution_options={"yield_per": chunk_size})
@@ -0,0 +1,214 @@
+"""
+SQL instrumentation module.
+
+When enabled, every engine created by `create_db_engine` (and the async engine)
+gets `before_cursor_execute`/`after_cursor_execute` listeners, which record for
+each normalised SQL statement (literals and bound parameters replaced by `?`,
+`IN` and `VALUES` lists collapsed) the number of calls, a histogram of execution
+times and rows returned (or affected). Time spent checking out connections
+from the pool is recorded as well.
+
+Instrumentation is disabled by default. It is enabled in the optional
+[INSTRUMENTATION] section of `config.ini`:
+
+    [INSTRUMENTATION]
+    ENABLED=true
+    TOP_N=10
+
+or by the `SQL_INSTRUMENTATION` environment variable (`1`/`0`), which overrides
+the configuration file. Scripts call `report_at_exit()` to print the top-N
+slowest statements when they exit.
+
+Note: only statements of the current process are recorded (e.g. not of seeding
+worker processes), and `COPY` run on raw DBAPI cursors is not seen by listeners.
+"""
+
+import atexit
+import bisect
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+
+ENV_VARIABLE = "SQL_INSTRUMENTATION"
+DEFAULT_TOP_N = 10
+
+# Upper bounds of histogram buckets in milliseconds, the last bucket is unbounded
+HISTOGRAM_BOUNDS_MS = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+MAX_STATEMENT_LENGTH = 100
+
+_VALUES_ROW = r"\((?:\?(?:::\w+)?, )*\?(?:::\w+)?\)"
+
+_normalise_patterns = [
+    (re.compile(r"%\(\w+\)s|%s|\$\d+"), "?"),  # bound parameters
+    (re.compile(r"'(?:[^']|'')*'"), "?"),  # string literals
+    (re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b"), "?"),  # numeric literals
+    (re.compile(r"\s+"), " "),
+    (re.compile(r"\bIN \(\?(?:, \?)*\)", re.IGNORECASE), "IN (...)"),
+    # Rows of multi-row VALUES, e.g. "(?::UUID, ?), (?::UUID, ?)"
+    (re.compile(rf"({_VALUES_ROW})(?:, {_VALUES_ROW})+"), r"\1, ..."),
+]
+
+
+def normalise_sql(statement: str) -> str:
+    """Return statement with literals and parameters replaced, to group similar statements."""
+    for pattern, replacement in _normalise_patterns:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of durations with fixed buckets (see `HISTOGRAM_BOUNDS_MS`)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BOUNDS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, milliseconds: float) -> None:
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    @property
+    def average_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, percent: float) -> float:
+        """Upper bound of the bucket holding the percentile (max for the last bucket)."""
+        rank = self.count * percent / 100
+        cumulative = 0
+        for bound, bucket_count in zip(HISTOGRAM_BOUNDS_MS, self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+
+@dataclass
+class StatementStats:
+    """Timing and row statistics of a normalised statement."""
+
+    statement: str
+    timing: LatencyHistogram = field(default_factory=LatencyHistogram)
+    rows: int = 0
+
+
+class SQLStats:
+    """Thread-safe statistics of executed statements and pool checkouts."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.statements: dict[str, StatementStats] = {}
+        self.checkout_wait = LatencyHistogram()
+
+    def record_statement(self, statement: str, seconds: float, rows: int) -> None:
+        key = normalise_sql(statement)
+        with self._lock:
+            stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = StatementStats(key)
+            stats.timing.record(seconds * 1000)
+            stats.rows += rows
+
+    def record_checkout(self, seconds: float) -> None:
+        with self._lock:
+            self.checkout_wait.record(seconds * 1000)
+
+    def top_statements(self, n: int | None = None) -> list[StatementStats]:
+        """Statements with the highest total execution time (all if `n` is not given)."""
+        with self._lock:
+            ranked = sorted(
+                self.statements.values(), key=lambda stats: stats.timing.total_ms, reverse=True
+            )
+        return ranked[:n]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.statements.clear()
+            self.checkout_wait = LatencyHistogram()
+
+
+sql_stats = SQLStats()
+
+_report_settings = {"enabled": False, "top_n": DEFAULT_TOP_N}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, so a failed statement leaves nothing behind
+    if context is not None:
+        context.instrumentation_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "instrumentation_started", None)
+    if started is None:
+        return
+    # Rows fetched by (buffered) SELECT or affected by DML, -1 if unknown
+    rows = max(getattr(cursor, "rowcount", -1) or 0, 0)
+    sql_stats.record_statement(statement, time.perf_counter() - started, rows)
+
+
+def instrument_engine(engine: Engine, top_n: int = DEFAULT_TOP_N) -> None:
+    """Attach statement listeners to the engine and record its pool checkout time."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    # Checkout time is measured by pools with checkout statistics (TimedQueuePool)
+    checkout_stats = getattr(engine.pool, "checkout_stats", None)
+    if checkout_stats is not None:
+        checkout_stats.observer = sql_stats.record_checkout
+
+    _report_settings.update(enabled=True, top_n=top_n)
+
+
+def print_report(top_n: int | None = None) -> None:
+    """Print statements with the highest total time, if instrumentation is enabled."""
+    if not _report_settings["enabled"]:
+        return
+    top_n = top_n or _report_settings["top_n"]
+
+    statements = sql_stats.top_statements()
+    calls = sum(stats.timing.count for stats in statements)
+    total_ms = sum(stats.timing.total_ms for stats in statements)
+    print(
+        f"📊 SQL statements: {calls:,} executed in {total_ms:,.1f} ms, "
+        f"{len(statements)} distinct, top {min(top_n, len(statements))} by total time:"
+    )
+    print(
+        f"    {'calls':>8}{'total ms':>12}{'avg ms':>10}{'p95 ms':>10}{'max ms':>10}"
+        f"{'rows':>12}  statement"
+    )
+    for stats in statements[:top_n]:
+        timing = stats.timing
+        statement = stats.statement
+        if len(statement) > MAX_STATEMENT_LENGTH:
+            statement = statement[: MAX_STATEMENT_LENGTH - 3] + "..."
+        print(
+            f"    {timing.count:>8,}{timing.total_ms:>12,.1f}{timing.average_ms:>10.2f}"
+            f"{timing.percentile_ms(95):>10.2f}{timing.max_ms:>10.2f}{stats.rows:>12,}"
+            f"  {statement}"
+        )
+
+    checkout_wait = sql_stats.checkout_wait
+    if checkout_wait.count:
+        print(
+            f"🔌 Pool checkouts: {checkout_wait.count:,}, "
+            f"avg {checkout_wait.average_ms:.2f} ms, "
+            f"p95 {checkout_wait.percentile_ms(95):.2f} ms, "
+            f"max {checkout_wait.max_ms:.2f} ms"
+        )
+
+
+def report_at_exit() -> None:
+    """Print the report when the process exits (nothing is printed if disabled)."""
+    atexit.register(print_report)
@@ -0,0 +1,99 @@
+"""
+Named loader profiles of ORM relationships.
+
+Relationships of models are loaded lazily by default: touching a relationship of
+N loaded objects (e.g. `grade.subject` in a loop) emits N more statements.
+Queries loading entities pick a profile per use case instead:
+
+    selectin   Listed relationships are loaded by one extra `SELECT ... IN (...)`
+               statement each, suited for collections (e.g. `Group.students`).
+    joined     Listed relationships are loaded by `LEFT OUTER JOIN` in the same
+               statement, suited for many-to-one references (e.g. `Grade.subject`).
+    raise      No relationships are loaded.
+
+With every profile, relationships that are not listed raise an error on access
+instead of emitting a query, so a missing eager load fails fast:
+
+    stmt = select(Grade).options(*loader_options(JOINED, Grade.subject, Grade.group))
+    stmt = select(Group).options(*loader_options(SELECTIN, (Group.subjects, Subject.teacher)))
+
+Reporting code uses the `raise` profile by default for all statements of its
+session (`session_scope(loader_profile=REPORTING_PROFILE)`), options of a statement
+still load relationships it lists.
+"""
+
+from typing import Sequence
+
+from sqlalchemy import event
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    QueryableAttribute,
+    Session,
+    joinedload,
+    raiseload,
+    selectinload,
+)
+from sqlalchemy.orm.interfaces import ORMOption
+
+from .soft_delete import SoftDeleteSession
+
+SELECTIN = "selectin"
+JOINED = "joined"
+RAISE = "raise"
+
+LOADER_PROFILES = (SELECTIN, JOINED, RAISE)
+REPORTING_PROFILE = RAISE
+
+# Session.info key of the loader profile applied to all statements of a session
+SESSION_LOADER_PROFILE_KEY = "loader_profile"
+
+_loaders = {SELECTIN: selectinload, JOINED: joinedload}
+
+RelationshipPath = QueryableAttribute | Sequence[QueryableAttribute]
+
+
+def loader_options(profile: str, *relationships: RelationshipPath) -> list[ORMOption]:
+    """
+    Loader options of the profile, eagerly loading the listed relationships.
+
+    A relationship may be given as a path, e.g. `(Group.subjects, Subject.teacher)`.
+    All other relationships raise on access.
+    """
+    if profile not in LOADER_PROFILES:
+        raise ValueError(f"Unknown loader profile: {profile}")
+    if profile == RAISE and relationships:
+        raise ValueError(f"Loader profile '{RAISE}' doesn't load relationships")
+
+    loader = _loaders.get(profile)
+    options = []
+    for path in relationships:
+        attributes = (path,) if isinstance(path, QueryableAttribute) else tuple(path)
+        option = loader(attributes[0])
+        for attribute in attributes[1:]:
+            option = getattr(option, loader.__name__)(attribute)
+        options.append(option)
+
+    options.append(raiseload("*"))
+    return options
+
+
+def set_session_loader_profile(session: Session, profile: str | None) -> None:
+    """Apply the profile to all ORM SELECT statements of the session (None resets it)."""
+    if profile is not None and profile not in LOADER_PROFILES:
+        raise ValueError(f"Unknown loader profile: {profile}")
+    session.info[SESSION_LOADER_PROFILE_KEY] = profile
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def apply_session_loader_profile(execute_state: ORMExecuteState) -> None:
+    """Add options of the session loader profile to ORM SELECT statements."""
+    profile = execute_state.session.info.get(SESSION_LOADER_PROFILE_KEY)
+    if (
+        profile is None
+        or not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+    ):
+        return
+
+    execute_state.statement = execute_state.statement.options(*loader_options(profile))
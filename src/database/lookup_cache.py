@@ -0,0 +1,279 @@
+"""
+In-process read-through cache of rarely changing lookup entities.
+
+Subjects, teachers, groups and group-subject associations are read by id
+(and subjects and groups by their natural keys, `Subject.title` and `Group.name`)
+through the cache, which keeps immutable records (see `database.records`,
+not ORM objects, so they may be shared by sessions):
+
+    subject = get_subject_by_title(session, "Mathematics")
+    group_ids = get_subject_group_ids(session, subject.id)
+
+Every entity type has its own cache with LRU eviction of entries above
+`max_size` and expiration of entries older than `ttl_seconds`. Only found
+entities are cached, so inserts don't need invalidation.
+
+Caches of changed entity types are cleared when the session transaction commits:
+changes are collected by `after_flush` (ORM objects, including relationship
+collections) and `do_orm_execute` (UPDATE/DELETE/INSERT statements executed by
+the session) events and applied by the `after_commit` event. Changes made by
+other processes or by textual SQL are not seen and expire after the TTL.
+
+Hit and miss counters of each cache are returned by `cache_stats()`.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Hashable, NamedTuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from .models import Group, PersonalData, Subject, Teacher, group_subject_association_table
+from .records import GroupRecord, SubjectRecord, fetch_records, select_records
+from .soft_delete import SoftDeleteSession
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL_SECONDS = 300
+
+# Session.info key of names of changed tables, caches of which are cleared on commit
+CHANGED_TABLES_KEY = "lookup_cache_changed_tables"
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    """Counters of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Thread-safe mapping with LRU eviction above `max_size` entries and TTL expiration."""
+
+    def __init__(
+        self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """Value of the key, `default` if not cached or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._entries))
+
+
+class TeacherName(NamedTuple):
+    id: uuid.UUID
+    first_name: str
+    last_name: str
+
+
+subjects_cache = LRUCache()
+groups_cache = LRUCache()
+teachers_cache = LRUCache()
+associations_cache = LRUCache()
+
+CACHES = {
+    "subjects": subjects_cache,
+    "groups": groups_cache,
+    "teachers": teachers_cache,
+    "group_subject_association": associations_cache,
+}
+
+# Caches cleared on changes of a table. Teacher names are stored in personal data,
+# groups and subjects may change their associations through relationships.
+_INVALIDATED_CACHES = {
+    Subject.__tablename__: (subjects_cache, associations_cache),
+    Group.__tablename__: (groups_cache, associations_cache),
+    Teacher.__tablename__: (teachers_cache,),
+    PersonalData.__tablename__: (teachers_cache,),
+    group_subject_association_table.name: (associations_cache,),
+}
+
+
+def configure_caches(max_size: int | None = None, ttl_seconds: float | None = None) -> None:
+    """Change size and TTL of all caches, applied to entries cached from now on."""
+    for cache in CACHES.values():
+        if max_size is not None:
+            cache.max_size = max_size
+        if ttl_seconds is not None:
+            cache.ttl_seconds = ttl_seconds
+
+
+def clear_caches() -> None:
+    for cache in CACHES.values():
+        cache.clear()
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Counters of caches by table name."""
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+
+def _read_through(cache: LRUCache, key: Hashable, load: Callable[[], Any]) -> Any:
+    value = cache.get(key)
+    if value is _MISSING:
+        value = load()
+        if value is not None:
+            cache.put(key, value)
+    return value
+
+
+def _single(records: list, description: str):
+    if len(records) > 1:
+        raise ValueError(f"Ambiguous {description}: {len(records)} rows found")
+    return records[0] if records else None
+
+
+def _load_subjects(session: Session, *criteria) -> list[SubjectRecord]:
+    stmt = select_records(SubjectRecord).where(*criteria)
+    return list(fetch_records(session, stmt, SubjectRecord))
+
+
+def _load_groups(session: Session, *criteria) -> list[GroupRecord]:
+    stmt = select_records(GroupRecord).where(*criteria)
+    return list(fetch_records(session, stmt, GroupRecord))
+
+
+def get_subject(session: Session, subject_id: uuid.UUID) -> SubjectRecord | None:
+    return _read_through(
+        subjects_cache,
+        ("id", subject_id),
+        lambda: _single(_load_subjects(session, Subject.id == subject_id), "subject id"),
+    )
+
+
+def get_subject_by_title(session: Session, title: str) -> SubjectRecord | None:
+    """Subject with the title, `ValueError` if several subjects have it."""
+    return _read_through(
+        subjects_cache,
+        ("title", title),
+        lambda: _single(_load_subjects(session, Subject.title == title), f"subject '{title}'"),
+    )
+
+
+def get_group(session: Session, group_id: uuid.UUID) -> GroupRecord | None:
+    return _read_through(
+        groups_cache,
+        ("id", group_id),
+        lambda: _single(_load_groups(session, Group.id == group_id), "group id"),
+    )
+
+
+def get_group_by_name(session: Session, name: str) -> GroupRecord | None:
+    """Group with the name, `ValueError` if several groups have it."""
+    return _read_through(
+        groups_cache,
+        ("name", name),
+        lambda: _single(_load_groups(session, Group.name == name), f"group '{name}'"),
+    )
+
+
+def get_teacher(session: Session, teacher_id: uuid.UUID) -> TeacherName | None:
+    def load():
+        stmt = (
+            select(Teacher.id, PersonalData.first_name, PersonalData.last_name)
+            .join(PersonalData, PersonalData.id == Teacher.personal_data_id)
+            .where(Teacher.id == teacher_id)
+        )
+        row = session.execute(stmt).one_or_none()
+        return TeacherName(*row) if row else None
+
+    return _read_through(teachers_cache, ("id", teacher_id), load)
+
+
+def get_group_subject_ids(session: Session, group_id: uuid.UUID) -> frozenset[uuid.UUID]:
+    """Ids of live subjects studied by the group."""
+    association = group_subject_association_table
+    stmt = (
+        select(Subject.id)
+        .join(association, association.c.subject_id == Subject.id)
+        .where(association.c.group_id == group_id)
+    )
+    return _read_through(
+        associations_cache, ("group", group_id), lambda: frozenset(session.scalars(stmt))
+    )
+
+
+def get_subject_group_ids(session: Session, subject_id: uuid.UUID) -> frozenset[uuid.UUID]:
+    """Ids of live groups studying the subject."""
+    association = group_subject_association_table
+    stmt = (
+        select(Group.id)
+        .join(association, association.c.group_id == Group.id)
+        .where(association.c.subject_id == subject_id)
+    )
+    return _read_through(
+        associations_cache, ("subject", subject_id), lambda: frozenset(session.scalars(stmt))
+    )
+
+
+def _mark_changed(session: Session, table_names) -> None:
+    changed = session.info.setdefault(CHANGED_TABLES_KEY, set())
+    changed.update(name for name in table_names if name in _INVALIDATED_CACHES)
+
+
+@event.listens_for(SoftDeleteSession, "after_flush")
+def collect_flushed_changes(session: Session, flush_context) -> None:
+    """Collect tables of flushed new, changed and deleted objects."""
+    objects = chain(session.new, session.dirty, session.deleted)
+    _mark_changed(session, {obj.__table__.name for obj in objects})
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def collect_executed_changes(execute_state: ORMExecuteState) -> None:
+    """Collect tables changed by UPDATE, DELETE and INSERT statements of the session."""
+    if execute_state.is_update or execute_state.is_delete or execute_state.is_insert:
+        _mark_changed(execute_state.session, {execute_state.statement.table.name})
+
+
+@event.listens_for(SoftDeleteSession, "after_commit")
+def invalidate_changed(session: Session) -> None:
+    """Clear caches of tables changed by the committed transaction."""
+    for table_name in session.info.pop(CHANGED_TABLES_KEY, ()):
+        for cache in _INVALIDATED_CACHES[table_name]:
+            cache.clear()
+
+
+@event.listens_for(SoftDeleteSession, "after_rollback")
+def discard_changes(session: Session) -> None:
+    session.info.pop(CHANGED_TABLES_KEY, None)
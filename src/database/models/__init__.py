@@ -8,21 +8,29 @@ Exposes Base for metadata management and migrations.
 from .base import Base
 
 from .grade import Grade
+from .grade_task import GradeTask
 from .group import Group
+from .group_subject_last_lesson import GroupSubjectLastLesson
 from .personal_data import PersonalData
 from .student import Student
+from .student_subject_stats import StudentSubjectStats
 from .subject import Subject
 from .teacher import Teacher
+from .write_version import WriteVersion
 
 from .associations import group_subject_association_table
 
 __all__ = [
     "Base",
     "Grade",
+    "GradeTask",
     "Group",
+    "GroupSubjectLastLesson",
     "PersonalData",
     "Student",
+    "StudentSubjectStats",
     "Subject",
     "Teacher",
+    "WriteVersion",
     "group_subject_association_table",
 ]
@@ -2,7 +2,7 @@
 SQLAlchemy association tables for many-to-many relationships.
 """
 
-from sqlalchemy import Table, Column, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy import Table, Column, ForeignKey, Index, PrimaryKeyConstraint
 from sqlalchemy.dialects.postgresql import UUID
 
 from .base import Base
@@ -24,4 +24,6 @@ group_subject_association_table = Table(
         nullable=False,
     ),
     PrimaryKeyConstraint("group_id", "subject_id", name="pk_group_subject_association"),
+    # Primary key covers lookups by group_id, this one covers lookups by subject_id
+    Index("ix_group_subject_association_subject_id", "subject_id"),
 )
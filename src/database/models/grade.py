@@ -3,9 +3,10 @@ ORM model for Grade entity.
 """
 
 from typing import TYPE_CHECKING
+import datetime
 import uuid
 
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, func, inspect, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
@@ -24,13 +25,56 @@ class Grade(BaseModel):
     """
     Represents a grade for a student, tied to a group, subject, and specific task.
     Allows multiple grades per subject if tied to different tasks.
+
+    The table is range partitioned by `created_at` into monthly partitions
+    (see `database.partitions`). The partition key is a part of the primary key
+    in the database, while `id` alone identifies a grade in the ORM.
+    Unique keys of partitioned tables must include the partition key, so
+    a task is kept graded once by the `GradeTask` guard table instead.
     """
 
     __tablename__ = "grades"
     __table_args__ = (
-        UniqueConstraint(
-            "student_id", "group_id", "subject_id", "task_number", name="uq_grade_task"
+        # Keyset pagination of live rows (see `database.pagination`)
+        Index(
+            "ix_grades_created_at_id_live",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Covering index for per-subject/per-group analytics of live (not deleted) grades,
+        # ordered by task_number to find grades of the last lesson
+        Index(
+            "ix_grades_subject_id_group_id_task_number_live",
+            "subject_id",
+            "group_id",
+            "task_number",
+            postgresql_include=["student_id", "grade", "created_at"],
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Covering index for per-student averages of live grades
+        Index(
+            "ix_grades_student_id_live",
+            "student_id",
+            postgresql_include=["grade"],
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Tombstones only, used to find soft-deleted rows to purge
+        Index(
+            "ix_grades_deleted_at_tombstones",
+            "deleted_at",
+            postgresql_where=text("is_deleted = true"),
         ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    __mapper_args__ = {"primary_key": ["id"]}
+
+    # Partition key, a part of the primary key (id, created_at)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+        sort_order=1,
     )
 
     task_number: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -42,12 +86,16 @@ class Grade(BaseModel):
         nullable=False,
     )
     group_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     subject_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("subjects.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     # TODO: Make task a separate table or enum (repetitive or standardized (e.g. Quiz, Exam, Project))
@@ -58,8 +106,18 @@ class Grade(BaseModel):
     subject: Mapped["Subject"] = relationship(back_populates="grades")
 
     def __repr__(self) -> str:
-        subject_name = self.subject.title if self.subject else "Unknown Subject"
-        group_name = self.group.name if self.group else "Unknown Group"
+        # Not loaded relationships of stored grades are shown by id,
+        # so repr never emits queries
+        state = inspect(self)
+        unloaded = state.unloaded if state.has_identity else set()
+        if "subject" in unloaded:
+            subject_name = self.subject_id
+        else:
+            subject_name = self.subject.title if self.subject else "Unknown Subject"
+        if "group" in unloaded:
+            group_name = self.group_id
+        else:
+            group_name = self.group.name if self.group else "Unknown Group"
 
         return (
             f"<Grade(task='{self.task_number}', grade={self.grade}, "
@@ -0,0 +1,49 @@
+"""
+ORM model for GradeTask uniqueness guard.
+"""
+
+import uuid
+
+from sqlalchemy import Integer, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class GradeTask(Base):
+    """
+    Represents a task graded for a student of a group in a subject: the key
+    of every grade (live or soft-deleted) in `grades`.
+
+    Unique keys of the partitioned `grades` table must include the partition
+    key (`created_at`), so they can't keep a task graded only once. This table
+    is not partitioned and its primary key enforces it instead: rows are
+    inserted, updated and deleted with grades by database triggers (see
+    migration v11), a duplicate task fails the statement writing grades with
+    a unique violation of `uq_grade_task`. Tasks of archived partitions are
+    removed. Rows must not be modified by the application.
+    """
+
+    __tablename__ = "grade_tasks"
+    __table_args__ = (
+        # Named as the unique constraint of grades before partitioning (migration v6),
+        # so violations are reported the same way
+        PrimaryKeyConstraint(
+            "student_id", "group_id", "subject_id", "task_number", name="uq_grade_task"
+        ),
+    )
+
+    student_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    group_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    subject_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    task_number: Mapped[int] = mapped_column(Integer, autoincrement=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"GradeTask("
+            f"student_id={self.student_id!r}, "
+            f"group_id={self.group_id!r}, "
+            f"subject_id={self.subject_id!r}, "
+            f"task_number={self.task_number!r})"
+        )
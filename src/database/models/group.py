@@ -5,7 +5,7 @@ ORM model for Group entity.
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Date
+from sqlalchemy import Date, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from utils.constants import MIN_NAME_LEN, MAX_NAME_LEN
@@ -30,6 +30,15 @@ class Group(BaseModel):
     """
 
     __tablename__ = "groups"
+    __table_args__ = (
+        # Keyset pagination of live rows (see `database.pagination`)
+        Index(
+            "ix_groups_created_at_id_live",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(MAX_NAME_LEN), nullable=False)
     start_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
@@ -0,0 +1,57 @@
+"""
+ORM model for GroupSubjectLastLesson pointer.
+"""
+
+import datetime
+import uuid
+
+from sqlalchemy import DateTime, ForeignKey, Integer, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class GroupSubjectLastLesson(Base):
+    """
+    Represents the last lesson of a group in a subject: the highest task number
+    and the latest creation time of its live (not deleted) grades.
+
+    Rows are maintained by database triggers on `grades` (see migration v10):
+    inserted grades move the pointer forward, updated and deleted grades make
+    pointers of affected groups to be recomputed. The last lesson is found by
+    a primary key lookup instead of the newest grade of every partition.
+    Rows must not be modified by the application.
+    """
+
+    __tablename__ = "group_subject_last_lessons"
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "group_id",
+            "subject_id",
+            name="pk_group_subject_last_lessons",
+            # Pointers are read by index-only scans
+            postgresql_include=["last_task_number", "last_graded_at"],
+        ),
+    )
+
+    group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE")
+    )
+    subject_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("subjects.id", ondelete="CASCADE")
+    )
+
+    last_task_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_graded_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"GroupSubjectLastLesson("
+            f"group_id={self.group_id!r}, "
+            f"subject_id={self.subject_id!r}, "
+            f"last_task_number={self.last_task_number!r}, "
+            f"last_graded_at={self.last_graded_at!r})"
+        )
@@ -8,13 +8,20 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
+from ..ids import new_uuid
+
 
 class UUIDMixin:
-    """Adds a UUID primary key id field, generated by the database."""
+    """
+    Adds a UUID primary key id field, generated on the client (UUIDv7 or v4,
+    see `database.ids`), so inserted objects don't fetch their keys back.
+    The database default covers rows inserted by SQL without an id.
+    """
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
+        default=new_uuid,
         server_default=text("gen_random_uuid()"),
         autoincrement=False,
         nullable=False,
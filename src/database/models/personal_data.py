@@ -2,7 +2,7 @@
 ORM abstract model for general person-related fields.
 """
 
-from sqlalchemy import String
+from sqlalchemy import Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from utils.constants import MIN_NAME_LEN, MAX_PERSON_NAME_LEN
@@ -18,6 +18,21 @@ class PersonalData(BaseModel):
     """
 
     __tablename__ = "personal_data"
+    __table_args__ = (
+        # Keyset pagination of live rows (see `database.pagination`)
+        Index(
+            "ix_personal_data_created_at_id_live",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Tombstones only, used to find soft-deleted rows to purge
+        Index(
+            "ix_personal_data_deleted_at_tombstones",
+            "deleted_at",
+            postgresql_where=text("is_deleted = true"),
+        ),
+    )
 
     first_name: Mapped[str] = mapped_column(String(MAX_PERSON_NAME_LEN), nullable=False)
     last_name: Mapped[str] = mapped_column(String(MAX_PERSON_NAME_LEN), nullable=False)
@@ -5,7 +5,7 @@ ORM model for Student entity.
 from typing import TYPE_CHECKING
 import uuid
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,9 +24,27 @@ class Student(BaseModel):
     """
 
     __tablename__ = "students"
+    __table_args__ = (
+        # Keyset pagination of live rows (see `database.pagination`)
+        Index(
+            "ix_students_created_at_id_live",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Tombstones only, used to find soft-deleted rows to purge
+        Index(
+            "ix_students_deleted_at_tombstones",
+            "deleted_at",
+            postgresql_where=text("is_deleted = true"),
+        ),
+    )
 
     group_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("groups.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=True),
+        ForeignKey("groups.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
 
     personal_data_id: Mapped[uuid.UUID] = mapped_column(
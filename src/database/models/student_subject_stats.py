@@ -0,0 +1,66 @@
+"""
+ORM model for StudentSubjectStats summary.
+"""
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class StudentSubjectStats(Base):
+    """
+    Represents aggregated live (not deleted) grades of a student in a subject and group.
+
+    Rows are maintained by database triggers on `grades` (see migration v4),
+    so they stay in sync with ORM, bulk and COPY writes alike and must not be
+    modified by the application. Averages are computed as sum / count, so they
+    can be combined across subjects and groups.
+    """
+
+    __tablename__ = "student_subject_stats"
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "student_id",
+            "subject_id",
+            "group_id",
+            name="pk_student_subject_stats",
+            # Per-student aggregations are served by index-only scans
+            postgresql_include=["grades_count", "grades_sum"],
+        ),
+        # Covering index for per-subject/per-group aggregations
+        Index(
+            "ix_student_subject_stats_subject_id_group_id",
+            "subject_id",
+            "group_id",
+            postgresql_include=["student_id", "grades_count", "grades_sum"],
+        ),
+    )
+
+    student_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE")
+    )
+    subject_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("subjects.id", ondelete="CASCADE")
+    )
+    group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE")
+    )
+
+    grades_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    grades_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    grade_min: Mapped[int] = mapped_column(Integer, nullable=False)
+    grade_max: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_task_number: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"StudentSubjectStats("
+            f"student_id={self.student_id!r}, "
+            f"subject_id={self.subject_id!r}, "
+            f"group_id={self.group_id!r}, "
+            f"grades_count={self.grades_count!r})"
+        )
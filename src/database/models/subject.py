@@ -5,7 +5,7 @@ ORM model for Subject entity.
 from typing import TYPE_CHECKING
 import uuid
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
@@ -31,6 +31,15 @@ class Subject(BaseModel):
     """
 
     __tablename__ = "subjects"
+    __table_args__ = (
+        # Keyset pagination of live rows (see `database.pagination`)
+        Index(
+            "ix_subjects_created_at_id_live",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     # TODO: Evaluate unique=True constraint for the subject title
     title: Mapped[str] = mapped_column(String(MAX_SUBJECT_TITLE_LEN), nullable=False)
@@ -38,6 +47,7 @@ class Subject(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("teachers.id"),
         nullable=False,
+        index=True,
     )
 
     teacher: Mapped["Teacher"] = relationship(back_populates="subjects")
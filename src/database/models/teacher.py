@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 import uuid
 
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,6 +24,15 @@ class Teacher(BaseModel):
     """
 
     __tablename__ = "teachers"
+    __table_args__ = (
+        # Keyset pagination of live rows (see `database.pagination`)
+        Index(
+            "ix_teachers_created_at_id_live",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     # TODO: ADD hire_date
 
@@ -0,0 +1,32 @@
+"""
+ORM model for WriteVersion counters.
+"""
+
+from sqlalchemy import BigInteger, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# Number of counter rows, see WriteVersion
+WRITE_VERSION_SLOTS = 16
+
+
+class WriteVersion(Base):
+    """
+    Represents a counter of writes to grades and other tables read by reports.
+
+    Every INSERT, UPDATE, DELETE or TRUNCATE statement on these tables increments
+    the counter of a slot chosen by the backend process id, by statement-level
+    triggers (see migration v9), so concurrent writers rarely wait for each other.
+    The sum of all slots is the current write version: it changes (only after
+    commit, as counters are transactional) whenever data of reports change.
+    Rows must not be modified by the application.
+    """
+
+    __tablename__ = "write_versions"
+
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"WriteVersion(slot={self.slot!r}, version={self.version!r})"
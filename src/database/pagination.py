@@ -0,0 +1,152 @@
+"""
+Keyset (cursor) pagination of model rows.
+
+Primary keys are random UUIDs, so rows are paged by a stable sort key,
+`(created_at, id)` by default: `id` breaks ties of rows created at the same time.
+Instead of skipping `OFFSET` rows (reading and discarding all of them, so each
+next page is slower), a page starts right after the key of the last row of the
+previous page:
+
+    WHERE (created_at, id) > (:created_at, :id) ORDER BY created_at, id LIMIT :n
+
+which is a range scan of the `ix_<table>_created_at_id_live` index of live rows
+(migration v7), taking the same time for the first and the ten-thousandth page.
+
+    page = paginate(session, select(Student).where(Student.group_id == group_id))
+    next_page = paginate(session, stmt, cursor=page.next_cursor)
+
+Cursors are opaque URL-safe strings holding the key values of the last row,
+bound to the table and sort key they were created for.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from typing import Any, NamedTuple, Sequence
+
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from .models.base_model import BaseModel
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor is malformed or was created for another sort key."""
+
+
+class Page(NamedTuple):
+    """Rows of a page and the cursor of the next page (None if it's the last one)."""
+
+    items: list[Any]
+    next_cursor: str | None
+
+
+def default_sort_key(model: type[BaseModel]) -> tuple[InstrumentedAttribute, ...]:
+    """Stable sort key of rows of a model: creation time, then id."""
+    return (model.created_at, model.id)
+
+
+def _key_name(sort_key: Sequence[InstrumentedAttribute], descending: bool) -> str:
+    table_name = sort_key[0].class_.__tablename__
+    columns = ",".join(attribute.key for attribute in sort_key)
+    return f"{table_name}:{columns}:{'desc' if descending else 'asc'}"
+
+
+def _encode_value(value) -> Any:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(attribute: InstrumentedAttribute, value) -> Any:
+    python_type = attribute.type.python_type
+    if value is None or isinstance(value, python_type):
+        return value
+    if python_type in (datetime.date, datetime.datetime):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(
+    sort_key: Sequence[InstrumentedAttribute], values: Sequence, descending: bool = False
+) -> str:
+    """Opaque cursor pointing after the row with the given sort key values."""
+    payload = {"k": _key_name(sort_key, descending), "v": [_encode_value(v) for v in values]}
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    sort_key: Sequence[InstrumentedAttribute], cursor: str, descending: bool = False
+) -> tuple:
+    """Sort key values of a cursor, `InvalidCursor` if it doesn't match the sort key."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        key_name, values = payload["k"], payload["v"]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError):
+        raise InvalidCursor(f"Malformed cursor: {cursor!r}") from None
+
+    if key_name != _key_name(sort_key, descending) or len(values) != len(sort_key):
+        raise InvalidCursor("Cursor doesn't belong to this sort key")
+    try:
+        return tuple(
+            _decode_value(attribute, value) for attribute, value in zip(sort_key, values)
+        )
+    except (ValueError, TypeError):
+        raise InvalidCursor(f"Malformed cursor: {cursor!r}") from None
+
+
+def paginate(
+    session: Session,
+    stmt: Select,
+    cursor: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    sort_key: Sequence[InstrumentedAttribute] | None = None,
+    descending: bool = False,
+) -> Page:
+    """
+    Return a page of rows of a statement selecting a model (e.g. `select(Grade)`),
+    starting after the cursor (the first page if not given).
+
+    The sort key defaults to `(created_at, id)` of the selected model, any other
+    key must be unique (end with `id`) and not null. Statements selecting columns
+    must select the columns of the sort key too. Soft-deleted rows are hidden by
+    the session as usual, matching the partial indexes of live rows.
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}")
+
+    entity = stmt.column_descriptions[0]["entity"]
+    if sort_key is None:
+        sort_key = default_sort_key(entity)
+    is_entity_select = [description["type"] for description in stmt.column_descriptions] == [
+        entity
+    ]
+
+    key = tuple_(*sort_key)
+    if cursor is not None:
+        values = decode_cursor(sort_key, cursor, descending)
+        after = tuple_(
+            *[literal(value, attribute.type) for attribute, value in zip(sort_key, values)]
+        )
+        stmt = stmt.where(key < after if descending else key > after)
+    order_by = [attribute.desc() if descending else attribute for attribute in sort_key]
+    # One more row tells whether there's a next page
+    stmt = stmt.order_by(*order_by).limit(page_size + 1)
+
+    result = session.execute(stmt)
+    items = list(result.scalars() if is_entity_select else result)
+    if len(items) <= page_size:
+        return Page(items, None)
+
+    items = items[:page_size]
+    last = items[-1]
+    values = [getattr(last, attribute.key) for attribute in sort_key]
+    return Page(items, encode_cursor(sort_key, values, descending))
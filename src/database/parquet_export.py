@@ -0,0 +1,190 @@
+"""
+Export of denormalised grade facts into partitioned Parquet files.
+
+Each fact is a live grade with its student, group, subject and teacher
+(ids and names), task number, grade and creation time. Facts are read one
+partition of grades (month) at a time by a server-side cursor in chunks of
+`fetchmany`, as plain Core rows (no ORM objects or ORM result processing),
+converted into Arrow record batches and appended to Parquet files in a Hive-style
+layout:
+
+    <directory>/created_month=2026-10/part-00000.parquet
+
+so analytics tools (pandas, Polars, DuckDB, Spark) read only months they need.
+Memory use is bounded by the chunk size, whatever the number of grades.
+
+Requires the optional PyArrow dependency (`poetry install --extras analytics`).
+"""
+
+import datetime
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, NamedTuple
+
+from sqlalchemy import BigInteger, Select, String, cast, extract, false, select
+from sqlalchemy.orm import Session, aliased
+
+from .models import Grade, Group, PersonalData, Student, Subject, Teacher
+from .partitions import list_grades_partitions
+
+# Used for type hints only; PyArrow is an optional dependency imported on demand
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_ROWS_PER_FILE = 1_000_000
+DEFAULT_COMPRESSION = "zstd"
+PARTITION_KEY = "created_month"
+
+StudentData = aliased(PersonalData, name="student_data")
+TeacherData = aliased(PersonalData, name="teacher_data")
+
+# Name and selected expression of each fact column. Values are converted by the
+# database into types cheap to parse: UUIDs into text and creation time into
+# microseconds since the Unix epoch (converted into timestamps by Arrow).
+FACT_COLUMNS = {
+    "grade_id": cast(Grade.id, String),
+    "student_id": cast(Grade.student_id, String),
+    "student_first_name": StudentData.first_name,
+    "student_last_name": StudentData.last_name,
+    "group_id": cast(Grade.group_id, String),
+    "group_name": Group.name,
+    "subject_id": cast(Grade.subject_id, String),
+    "subject_title": Subject.title,
+    "teacher_id": cast(Subject.teacher_id, String),
+    "teacher_first_name": TeacherData.first_name,
+    "teacher_last_name": TeacherData.last_name,
+    "task_number": Grade.task_number,
+    "grade": Grade.grade,
+    "created_at": cast(extract("epoch", Grade.created_at) * 1_000_000, BigInteger),
+}
+
+
+def import_pyarrow():
+    """Import optional PyArrow dependency on demand, as it is slow to import."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError(
+            "PyArrow is required for Parquet export. "
+            "Install it with 'poetry install --extras analytics'."
+        ) from e
+    return pyarrow
+
+
+def fact_schema(pa) -> "pa.Schema":
+    """Arrow schema of grade facts, columns not listed are strings."""
+    types = {
+        "task_number": pa.int32(),
+        "grade": pa.int32(),
+        "created_at": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(name, types.get(name, pa.string())) for name in FACT_COLUMNS])
+
+
+def grade_facts_query(start: datetime.datetime, end: datetime.datetime) -> Select:
+    """Facts of live grades created in [start, end), a single partition of grades."""
+    return (
+        select(*[column.label(name) for name, column in FACT_COLUMNS.items()])
+        .join(Student, Student.id == Grade.student_id)
+        .join(StudentData, StudentData.id == Student.personal_data_id)
+        .join(Group, Group.id == Grade.group_id)
+        .join(Subject, Subject.id == Grade.subject_id)
+        .join(Teacher, Teacher.id == Subject.teacher_id)
+        .join(TeacherData, TeacherData.id == Teacher.personal_data_id)
+        .where(Grade.created_at >= start, Grade.created_at < end)
+        # Executed as a Core statement, so soft-deleted rows are filtered explicitly
+        .where(
+            *[
+                entity.is_deleted == false()
+                for entity in (Grade, Student, StudentData, Group, Subject, Teacher, TeacherData)
+            ]
+        )
+    )
+
+
+def iter_fact_chunks(
+    session: Session, start: datetime.datetime, end: datetime.datetime, chunk_size: int
+) -> Iterator[list[tuple]]:
+    """Yield chunks of fact rows fetched from a server-side cursor."""
+    connection = session.connection()
+    result = connection.execution_options(
+        stream_results=True, max_row_buffer=chunk_size
+    ).execute(grade_facts_query(start, end))
+    try:
+        while chunk := result.fetchmany(chunk_size):
+            yield chunk
+    finally:
+        result.close()
+
+
+class ExportStats(NamedTuple):
+    """Rows, files and bytes written by an export and its duration."""
+
+    rows: int
+    files: int
+    bytes: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def export_grade_facts(
+    session: Session,
+    directory: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rows_per_file: int = DEFAULT_ROWS_PER_FILE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> ExportStats:
+    """
+    Write facts of all live grades into Parquet files partitioned by month.
+
+    The directory must be empty or not exist, so files of former exports are not mixed in.
+    """
+    if directory.exists() and any(directory.iterdir()):
+        raise ValueError(f"Directory {directory} is not empty")
+    pa = import_pyarrow()
+    schema = fact_schema(pa)
+    started = time.perf_counter()
+    rows = files = size = 0
+
+    for partition in list_grades_partitions(session):
+        month = partition.start.astimezone(datetime.timezone.utc)
+        month_directory = directory / f"{PARTITION_KEY}={month:%Y-%m}"
+        writer = None
+        month_files = file_rows = 0
+        try:
+            for chunk in iter_fact_chunks(session, partition.start, partition.end, chunk_size):
+                if writer is None or file_rows >= rows_per_file:
+                    if writer is not None:
+                        writer.close()
+                    month_directory.mkdir(parents=True, exist_ok=True)
+                    path = month_directory / f"part-{month_files:05d}.parquet"
+                    writer = pa.parquet.ParquetWriter(path, schema, compression=compression)
+                    month_files += 1
+                    file_rows = 0
+
+                # Rows are transposed into columns, each converted by Arrow at once
+                columns = list(zip(*chunk))
+                arrays = [
+                    pa.array(values, type=pa.int64()).cast(field.type)
+                    if field.name == "created_at"
+                    else pa.array(values, type=field.type)
+                    for values, field in zip(columns, schema)
+                ]
+                batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+                writer.write_batch(batch)
+                file_rows += len(chunk)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        files += month_files
+        if month_files:
+            size += sum(path.stat().st_size for path in month_directory.glob("*.parquet"))
+
+    return ExportStats(rows, files, size, time.perf_counter() - started)
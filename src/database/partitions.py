@@ -0,0 +1,240 @@
+"""
+Grades partition maintenance module.
+
+`grades` is range partitioned by `created_at` into monthly partitions named
+`grades_yYYYYmMM` with month bounds in UTC (see migration v6). Partitions are
+created ahead of time by the `create_grades_partitions` database function.
+There is no default partition (it would block concurrent detaching), so a grade
+outside existing partitions would be rejected: keep partitions created a few
+months ahead, e.g. by a scheduled `scripts/manage_partitions.py create`.
+CRUD and bulk writes of grades (`database.crud`, `database.bulk`) also create
+missing partitions of written grades on demand (`ensure_grades_partitions`),
+so grades are accepted when the scheduled job doesn't run or for historical months.
+
+Partitions of past terms are detached with `DETACH PARTITION ... CONCURRENTLY`,
+which doesn't block reads and writes of `grades`, and then moved to the
+`archive` schema or dropped. Detaching doesn't fire triggers on grades,
+so the summary of students and last lessons of groups with grades in the
+partition are refreshed after it.
+
+Archived partitions keep no foreign keys: inherited `ON DELETE CASCADE`
+constraints would delete archived history with students, groups or subjects
+(e.g. purged ones) and block truncating those tables.
+"""
+
+import datetime
+import re
+from typing import NamedTuple
+
+from sqlalchemy import Connection, Date, bindparam, cast, func, select, text
+from sqlalchemy.orm import Session
+
+from .summary import refresh_group_subject_last_lessons, refresh_student_subject_stats
+
+DEFAULT_MONTHS_AHEAD = 3
+ARCHIVE_SCHEMA = "archive"
+
+# Names of partitions created by `create_grades_partitions`
+PARTITION_NAME_PATTERN = re.compile(r"^grades_y\d{4}m\d{2}$")
+
+PARTITION_BOUNDS_PATTERN = re.compile(r"FROM \('(?P<start>[^']+)'\) TO \('(?P<end>[^']+)'\)")
+
+create_partitions_query = select(
+    func.create_grades_partitions(bindparam("start_month"), bindparam("end_month"))
+)
+
+list_partitions_query = text(
+    """
+    SELECT child.relname AS name,
+           pg_get_expr(child.relpartbound, child.oid) AS bounds,
+           greatest(child.reltuples, 0)::bigint AS estimated_rows,
+           inherits.inhdetachpending AS detach_pending
+    FROM pg_inherits AS inherits
+    JOIN pg_class AS child ON child.oid = inherits.inhrelid
+    WHERE inherits.inhparent = 'grades'::regclass
+    ORDER BY child.relname
+    """
+)
+
+# Tables named as partitions of grades, which are no longer partitions, but
+# were not moved to the archive schema (archiving of a detached one failed)
+list_detached_partitions_query = text(
+    r"""
+    SELECT relation.relname
+    FROM pg_class AS relation
+    JOIN pg_namespace AS namespace ON namespace.oid = relation.relnamespace
+    WHERE namespace.nspname = current_schema()
+      AND relation.relkind = 'r'
+      AND NOT relation.relispartition
+      AND relation.relname ~ '^grades_y\d{4}m\d{2}$'
+    ORDER BY relation.relname
+    """
+)
+
+# Foreign keys of tables in the schema, of a single table if its name is given
+foreign_keys_query = text(
+    """
+    SELECT format('%I.%I', namespace.nspname, relation.relname) AS table_name,
+           constraint_.conname AS name
+    FROM pg_constraint AS constraint_
+    JOIN pg_class AS relation ON relation.oid = constraint_.conrelid
+    JOIN pg_namespace AS namespace ON namespace.oid = relation.relnamespace
+    WHERE constraint_.contype = 'f'
+      AND namespace.nspname = :schema
+      AND (CAST(:table_name AS text) IS NULL OR relation.relname = :table_name)
+    """
+)
+
+
+class GradesPartition(NamedTuple):
+    """Partition of grades holding grades created in [start, end)."""
+
+    name: str
+    start: datetime.datetime
+    end: datetime.datetime
+    estimated_rows: int
+    detach_pending: bool
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    """First day of the month `months` after the month of the given date."""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def create_grades_partitions(
+    session: Session,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    start: datetime.date | None = None,
+) -> list[str]:
+    """
+    Create missing monthly partitions from the month of `start` (default: current
+    month) to `months_ahead` months after the current month.
+
+    Returns names of created partitions.
+    """
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    params = {
+        "start_month": start or today,
+        "end_month": add_months(today, months_ahead),
+    }
+    return list(session.scalars(create_partitions_query, params))
+
+
+def ensure_grades_partitions(
+    connection: Connection | Session,
+    first: datetime.datetime | None = None,
+    last: datetime.datetime | None = None,
+) -> list[str]:
+    """
+    Create missing partitions for grades created from `first` to `last`
+    (default: `first`, or now of the transaction if neither is given).
+
+    Existing partitions are only looked up, so grades are not locked when
+    all of them exist. Returns names of created partitions.
+    """
+    if first is None:
+        # Month of now() in UTC, as the server default of created_at
+        start = end = cast(func.timezone("UTC", func.now()), Date)
+    else:
+        start = _utc_date(first)
+        end = _utc_date(last or first)
+    return list(connection.scalars(select(func.create_grades_partitions(start, end))))
+
+
+def _utc_date(value: datetime.datetime) -> datetime.date:
+    """Date of the value in UTC (partition bounds), naive values are in UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc)
+    return value.date()
+
+
+def list_grades_partitions(session: Session) -> list[GradesPartition]:
+    """Partitions attached to grades, ordered by their bounds."""
+    partitions = []
+    for row in session.execute(list_partitions_query):
+        bounds = PARTITION_BOUNDS_PATTERN.search(row.bounds)
+        partitions.append(
+            GradesPartition(
+                name=row.name,
+                start=datetime.datetime.fromisoformat(bounds["start"]),
+                end=datetime.datetime.fromisoformat(bounds["end"]),
+                estimated_rows=row.estimated_rows,
+                detach_pending=row.detach_pending,
+            )
+        )
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+def list_detached_partitions(session: Session) -> list[str]:
+    """
+    Names of partitions detached from grades, but not archived yet: their grades
+    are not in grades anymore, but are still counted by summaries until
+    `archive_detached_partition` finishes the job.
+    """
+    return list(session.scalars(list_detached_partitions_query))
+
+
+def partitions_before(
+    partitions: list[GradesPartition], cutoff: datetime.datetime
+) -> list[GradesPartition]:
+    """Partitions holding only grades created before `cutoff`."""
+    return [partition for partition in partitions if partition.end <= cutoff]
+
+
+def detach_grades_partition(connection: Connection, partition: GradesPartition) -> None:
+    """
+    Detach the partition from grades without blocking queries on grades.
+
+    `DETACH PARTITION CONCURRENTLY` can't run in a transaction block, so the
+    connection must be in autocommit mode. A detach interrupted earlier is finalized.
+    """
+    mode = "FINALIZE" if partition.detach_pending else "CONCURRENTLY"
+    connection.exec_driver_sql(f'ALTER TABLE grades DETACH PARTITION "{partition.name}" {mode}')
+
+
+def drop_archive_foreign_keys(session: Session, table_name: str | None = None) -> int:
+    """
+    Drop foreign keys of archived partitions (of all of them if no name is given),
+    so archived grades don't depend on live rows. Returns number of dropped keys.
+    """
+    foreign_keys = session.execute(
+        foreign_keys_query, {"schema": ARCHIVE_SCHEMA, "table_name": table_name}
+    ).all()
+    for foreign_key in foreign_keys:
+        session.execute(
+            text(f'ALTER TABLE {foreign_key.table_name} DROP CONSTRAINT "{foreign_key.name}"')
+        )
+    return len(foreign_keys)
+
+
+def archive_detached_partition(session: Session, name: str, drop: bool = False) -> None:
+    """
+    Move a detached partition to the archive schema without foreign keys
+    (or drop it), refresh the summary of students and last lessons of groups
+    having grades in it and bump the write version (no statement on grades
+    removed them, see migration v9). Tasks of its grades may be graded again
+    (they are removed from the `grade_tasks` guard, see migration v11).
+    """
+    student_ids = session.scalars(
+        text(f'SELECT DISTINCT student_id FROM "{name}"')
+    ).all()
+    group_ids = session.scalars(text(f'SELECT DISTINCT group_id FROM "{name}"')).all()
+    session.execute(
+        text(
+            f'DELETE FROM grade_tasks AS task USING "{name}" AS archived '
+            "WHERE (task.student_id, task.group_id, task.subject_id, task.task_number) = "
+            "(archived.student_id, archived.group_id, archived.subject_id, archived.task_number)"
+        )
+    )
+    if drop:
+        session.execute(text(f'DROP TABLE "{name}"'))
+    else:
+        session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        session.execute(text(f'ALTER TABLE "{name}" SET SCHEMA {ARCHIVE_SCHEMA}'))
+        drop_archive_foreign_keys(session, name)
+    if student_ids:
+        refresh_student_subject_stats(session, student_ids)
+    if group_ids:
+        refresh_group_subject_last_lessons(session, group_ids)
+    session.execute(text("SELECT bump_write_version()"))
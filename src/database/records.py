@@ -0,0 +1,139 @@
+"""
+Read-only records of model rows for reporting.
+
+ORM instances carry identity map tracking, attribute history and relationship
+proxies, which read-only code (reports, exports, caches) has no use for.
+Records are named tuples of column values, mapped from result rows without
+the ORM unit of work, several times smaller and faster to build:
+
+    stmt = select_records(GradeRecord).where(Grade.grade >= 90)
+    for grade in fetch_records(session, stmt, GradeRecord):
+        print(grade.student_id, grade.grade)
+
+Fields of a record are columns of its model with the same names (soft-delete
+columns are left out, as only live rows are loaded), so a statement of
+`select_records` may be filtered, ordered and joined by model attributes.
+Statements run through the session, so soft-deleted rows are filtered as usual.
+"""
+
+import datetime
+import uuid
+from typing import Iterator, NamedTuple, TypeVar
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from .models import (
+    Grade,
+    Group,
+    GroupSubjectLastLesson,
+    PersonalData,
+    Student,
+    StudentSubjectStats,
+    Subject,
+    Teacher,
+)
+from .models.base import Base
+
+
+class PersonalDataRecord(NamedTuple):
+    id: uuid.UUID
+    first_name: str
+    last_name: str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
+
+
+class GroupRecord(NamedTuple):
+    id: uuid.UUID
+    name: str
+    start_date: datetime.date
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
+
+
+class SubjectRecord(NamedTuple):
+    id: uuid.UUID
+    title: str
+    teacher_id: uuid.UUID
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
+
+
+class TeacherRecord(NamedTuple):
+    id: uuid.UUID
+    personal_data_id: uuid.UUID
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
+
+
+class StudentRecord(NamedTuple):
+    id: uuid.UUID
+    group_id: uuid.UUID | None
+    personal_data_id: uuid.UUID
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
+
+
+class GradeRecord(NamedTuple):
+    id: uuid.UUID
+    student_id: uuid.UUID
+    group_id: uuid.UUID
+    subject_id: uuid.UUID
+    task_number: int
+    grade: int
+    created_at: datetime.datetime
+    updated_at: datetime.datetime | None
+
+
+class StudentSubjectStatsRecord(NamedTuple):
+    student_id: uuid.UUID
+    subject_id: uuid.UUID
+    group_id: uuid.UUID
+    grades_count: int
+    grades_sum: int
+    grade_min: int
+    grade_max: int
+    last_task_number: int
+
+
+class GroupSubjectLastLessonRecord(NamedTuple):
+    group_id: uuid.UUID
+    subject_id: uuid.UUID
+    last_task_number: int
+    last_graded_at: datetime.datetime
+
+
+# Model of each record type
+RECORD_MODELS: dict[type, type[Base]] = {
+    PersonalDataRecord: PersonalData,
+    GroupRecord: Group,
+    SubjectRecord: Subject,
+    TeacherRecord: Teacher,
+    StudentRecord: Student,
+    GradeRecord: Grade,
+    StudentSubjectStatsRecord: StudentSubjectStats,
+    GroupSubjectLastLessonRecord: GroupSubjectLastLesson,
+}
+
+R = TypeVar("R", bound=tuple)
+
+
+def select_records(record_type: type[R]) -> Select:
+    """Select of columns of the record fields from its model."""
+    model = RECORD_MODELS[record_type]
+    return select(*[getattr(model, name) for name in record_type._fields])
+
+
+def fetch_records(
+    session: Session, stmt: Select, record_type: type[R], chunk_size: int | None = None
+) -> Iterator[R]:
+    """
+    Yield records of rows selected by the statement, its columns in order of the fields.
+
+    With `chunk_size`, rows are streamed from a server-side cursor in chunks
+    of that size instead of being fetched at once.
+    """
+    options = {"yield_per": chunk_size} if chunk_size else {}
+    result = session.execute(stmt, execution_options=options)
+    yield from map(record_type._make, result)
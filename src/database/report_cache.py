@@ -0,0 +1,289 @@
+"""
+Cache of report query results, invalidated by the write version of the database.
+
+Results of report queries (`my_select.select_N()`, decorated with `cached_report`)
+are cached by query name and parameters. Every entry keeps the write version
+(see `WriteVersion`, migration v9) it was computed at. The version is bumped by
+triggers on every statement writing grades or other tables read by reports, so
+an entry is returned only while nothing has changed since, otherwise the query
+runs again:
+
+    [REPORT_CACHE]
+    BACKEND=memory
+
+    with session_scope() as session:
+        select_3(session, subject_id)   # query, cached
+        select_3(session, subject_id)   # cached result
+
+The version is read once per transaction of a session (a single short query),
+so a report run of several queries costs one round trip when results are cached.
+The version is read before a query runs, so a result is never cached under a
+version newer than data it was computed from. Transactions which have written
+(ORM flushes, UPDATE/DELETE/INSERT statements) bypass the cache until they end.
+
+Backends:
+    memory   LRU cache of the process (`MAX_SIZE` entries, `TTL_SECONDS`).
+    sqlite   SQLite file (`PATH`, relative to the directory of `config.ini`)
+             shared by processes, e.g. repeated script runs. Results are pickled;
+             least recently used entries above `MAX_SIZE` are evicted on writes.
+    none     Caching is disabled (default).
+"""
+
+import functools
+import inspect
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from .lookup_cache import CacheStats, LRUCache
+from .models import WriteVersion
+from .soft_delete import SoftDeleteSession
+
+MEMORY_BACKEND = "memory"
+SQLITE_BACKEND = "sqlite"
+NO_BACKEND = "none"
+BACKENDS = (MEMORY_BACKEND, SQLITE_BACKEND, NO_BACKEND)
+
+DEFAULT_MAX_SIZE = 256
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_SQLITE_PATH = ".report_cache.sqlite3"
+
+# Session.info keys of the write version read in the current transaction
+# and of writes made by the transaction
+SESSION_WRITE_VERSION_KEY = "report_cache_write_version"
+SESSION_WRITES_KEY = "report_cache_writes"
+
+
+def read_write_version(session: Session) -> int:
+    """Current write version of report tables (sum of all counters)."""
+    # Sum of bigint is numeric, returned as Decimal
+    return int(session.scalar(select(func.coalesce(func.sum(WriteVersion.version), 0))))
+
+
+def current_write_version(session: Session) -> int | None:
+    """
+    Write version read once per transaction of the session, None if the transaction
+    has written: its own uncommitted writes bump the version, which may be reached
+    by other writes if it rolls back, so results it reads must not be cached.
+    """
+    if session.info.get(SESSION_WRITES_KEY):
+        return None
+    version = session.info.get(SESSION_WRITE_VERSION_KEY)
+    if version is None:
+        version = session.info[SESSION_WRITE_VERSION_KEY] = read_write_version(session)
+    return version
+
+
+def _mark_writes(session: Session) -> None:
+    session.info[SESSION_WRITES_KEY] = True
+
+
+@event.listens_for(SoftDeleteSession, "after_flush")
+def mark_flushed_writes(session: Session, flush_context) -> None:
+    _mark_writes(session)
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def mark_executed_writes(execute_state: ORMExecuteState) -> None:
+    if execute_state.is_update or execute_state.is_delete or execute_state.is_insert:
+        _mark_writes(execute_state.session)
+
+
+@event.listens_for(SoftDeleteSession, "after_transaction_end")
+def forget_transaction_version(session: Session, transaction) -> None:
+    # Savepoints end within the outer transaction
+    if transaction.parent is None:
+        session.info.pop(SESSION_WRITE_VERSION_KEY, None)
+        session.info.pop(SESSION_WRITES_KEY, None)
+
+
+class MemoryBackend:
+    """Entries (version, result) in an LRU cache of the process."""
+
+    def __init__(
+        self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        self._cache = LRUCache(max_size, ttl_seconds)
+
+    def get(self, key: str) -> tuple[int, Any] | None:
+        return self._cache.get(key, None)
+
+    def put(self, key: str, version: int, value: Any) -> None:
+        self._cache.put(key, (version, value))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def evictions(self) -> int:
+        return self._cache.stats().evictions
+
+    def size(self) -> int:
+        return self._cache.stats().size
+
+
+class SQLiteBackend:
+    """Entries (version, pickled result) in a SQLite file shared by processes."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_SQLITE_PATH,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._evictions = 0
+        self._lock = threading.Lock()
+        # Autocommit mode, every statement is its own transaction
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS report_cache ("
+            "key TEXT PRIMARY KEY, version INTEGER NOT NULL, value BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> tuple[int, Any] | None:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT version, value FROM report_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE report_cache SET used_at = ? WHERE key = ?", (now, key))
+        return row[0], pickle.loads(row[1])
+
+    def put(self, key: str, version: int, value: Any) -> None:
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO report_cache VALUES (?, ?, ?, ?, ?)",
+                (key, version, blob, now + self.ttl_seconds, now),
+            )
+            self._db.execute("DELETE FROM report_cache WHERE expires_at <= ?", (now,))
+            evicted = self._db.execute(
+                "DELETE FROM report_cache WHERE key IN ("
+                "SELECT key FROM report_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            ).rowcount
+            self._evictions += evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM report_cache")
+
+    def evictions(self) -> int:
+        return self._evictions
+
+    def size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM report_cache").fetchone()[0]
+
+
+class ReportCache:
+    """Results of report queries by query name and parameters, valid for a write version."""
+
+    def __init__(self, backend: MemoryBackend | SQLiteBackend) -> None:
+        self.backend = backend
+        self.hits = self.misses = 0
+
+    def get_or_compute(
+        self, session: Session, name: str, params: tuple[Hashable, ...], compute: Callable
+    ) -> Any:
+        """Cached result of the query with the parameters, computed if missing or outdated."""
+        # Read before computing, so the result is at least as new as the version
+        version = current_write_version(session)
+        if version is None:
+            self.misses += 1
+            return compute()
+        key = cache_key(name, params)
+        entry = self.backend.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = compute()
+        self.backend.put(key, version, value)
+        return value
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.backend.evictions(), self.backend.size())
+
+
+def cache_key(name: str, params: tuple[Hashable, ...]) -> str:
+    """Key of a query result, parameters (ids, numbers) by their string form."""
+    return ":".join([name, *map(str, params)])
+
+
+_report_cache: ReportCache | None = None
+_configured = False
+
+
+def configure_report_cache(cache: ReportCache | None) -> None:
+    """Use the cache for reports (None disables caching) instead of the configured one."""
+    global _report_cache, _configured
+    _report_cache, _configured = cache, True
+
+
+def get_report_cache() -> ReportCache | None:
+    """Report cache of the optional [REPORT_CACHE] section (created only once)."""
+    if not _configured:
+        configure_report_cache(_cache_from_config())
+    return _report_cache
+
+
+def _cache_from_config() -> ReportCache | None:
+    # Imported here, as models (imported by this module) must not require config.ini
+    from .connection import db_config_file, load_config
+
+    config = load_config()
+    backend = config.get("REPORT_CACHE", "BACKEND", fallback=NO_BACKEND)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown report cache backend '{backend}', expected one of {BACKENDS}")
+    if backend == NO_BACKEND:
+        return None
+
+    max_size = config.getint("REPORT_CACHE", "MAX_SIZE", fallback=DEFAULT_MAX_SIZE)
+    ttl_seconds = config.getfloat("REPORT_CACHE", "TTL_SECONDS", fallback=DEFAULT_TTL_SECONDS)
+    if backend == MEMORY_BACKEND:
+        return ReportCache(MemoryBackend(max_size, ttl_seconds))
+    # The same file whatever the working directory, like config.ini itself
+    path = config.get("REPORT_CACHE", "PATH", fallback=DEFAULT_SQLITE_PATH)
+    return ReportCache(SQLiteBackend(db_config_file.parent / path, max_size, ttl_seconds))
+
+
+def cached_report(query: Callable) -> Callable:
+    """
+    Decorate a report query `query(session, *params)` to return cached results.
+
+    Parameters are bound to the signature of the query with defaults applied, so
+    positional, keyword and omitted default parameters share a cache entry.
+    """
+    signature = inspect.signature(query)
+
+    @functools.wraps(query)
+    def wrapper(session: Session, *params, **named_params):
+        cache = get_report_cache()
+        if cache is None:
+            return query(session, *params, **named_params)
+        bound = signature.bind(session, *params, **named_params)
+        bound.apply_defaults()
+        key_params = tuple(bound.arguments.values())[1:]
+        return cache.get_or_compute(
+            session,
+            query.__name__,
+            key_params,
+            lambda: query(*bound.args, **bound.kwargs),
+        )
+
+    return wrapper
@@ -2,18 +2,23 @@
 Database session management module.
 
 This module provides a SQLAlchemy session factory and a context manager for safe session handling.
+The engine is bound to sessions lazily, on the first `session_scope()` use.
+Sessions hide soft-deleted rows from ORM queries (see `soft_delete` module)
+and may apply a loader profile to all their queries (see `loading` module).
 """
 
 from contextlib import contextmanager
 from sqlalchemy.orm import sessionmaker
 
-from .connection import engine
+from .connection import get_engine
+from .loading import set_session_loader_profile
+from .soft_delete import SoftDeleteSession
 
-SessionFactory = sessionmaker(bind=engine)
+SessionFactory = sessionmaker(class_=SoftDeleteSession)
 
 
 @contextmanager
-def session_scope():
+def session_scope(loader_profile: str | None = None):
     """
     Provide a transactional scope around a series of operations.
 
@@ -21,6 +26,9 @@ def session_scope():
     and ensures proper commit or rollback at the end. It also closes the session
     to release database resources.
 
+    With `loader_profile` (e.g. `loading.REPORTING_PROFILE`) relationships not
+    loaded by options of a query raise on access instead of being lazy loaded.
+
     Usage:
         with session_scope() as session:
             session.add(obj)
@@ -33,7 +41,9 @@ def session_scope():
         Exception: Re-raises any exception that occurs within the context block
                    after rolling back the transaction.
     """
-    session = SessionFactory()
+    session = SessionFactory(bind=get_engine())
+    if loader_profile is not None:
+        set_session_loader_profile(session, loader_profile)
     try:
         yield session
         session.commit()
@@ -0,0 +1,106 @@
+"""
+Soft-delete aware query layer.
+
+All models share `SoftDeleteMixin` (`is_deleted`, `deleted_at` columns).
+Sessions created by `SessionFactory` and `AsyncSessionFactory` are
+`SoftDeleteSession` instances, which add `is_deleted = false` criteria for every
+soft-deletable entity of an ORM SELECT: joined entities, relationship loads and
+`Session.get()` included. The criteria match the predicate of partial indexes
+(`WHERE is_deleted = false`), so live-row queries don't touch tombstones.
+
+Soft-deleted rows are still available with the `include_deleted` execution option:
+
+    session.execute(select(Student).execution_options(include_deleted=True))
+
+Tombstones older than a retention period are hard-deleted in batches
+by `purge_deleted_batch()` (see `scripts/purge_deleted.py`).
+"""
+
+import datetime
+
+from sqlalchemy import ColumnElement, and_, delete, event, exists, false, select, true
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from .models import Grade, Group, PersonalData, Student, Subject, Teacher
+from .models.mixins import SoftDeleteMixin
+
+INCLUDE_DELETED_OPTION = "include_deleted"
+
+# Tables are purged in foreign key order, rows referencing a tombstone go first
+PURGE_ORDER = (Grade, Student, Teacher, Subject, Group, PersonalData)
+
+
+class SoftDeleteSession(Session):
+    """Session hiding soft-deleted rows from ORM SELECT statements."""
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def filter_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """Add `is_deleted = false` criteria to SELECT statements of soft-deletable entities."""
+    if (
+        not execute_state.is_select
+        # Criteria of the parent statement are propagated to these loads
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get(INCLUDE_DELETED_OPTION, False)
+    ):
+        return
+
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            # Written so to match predicate of partial indexes
+            lambda cls: cls.is_deleted == false(),
+            include_aliases=True,
+        )
+    )
+
+
+def exclude_deleted(model: type[SoftDeleteMixin], id_column) -> ColumnElement[bool]:
+    """
+    Criterion excluding rows referencing a soft-deleted row of the model by `id_column`.
+
+    Used for tables without soft-delete (e.g. summaries), to skip rows of deleted
+    entities without joining them. Built on the model table rather than the entity,
+    so the session criteria don't apply to it.
+    """
+    table = model.__table__
+    return ~exists().where(table.c.id == id_column, table.c.is_deleted == true())
+
+
+def purge_criteria(model: type[SoftDeleteMixin], cutoff: datetime.datetime) -> list:
+    """Criteria selecting tombstones of the model, which may be hard-deleted."""
+    criteria = [model.is_deleted == true(), model.deleted_at < cutoff]
+
+    # Rows still referenced without ON DELETE action must stay
+    if model is Teacher:
+        criteria.append(~exists().where(Subject.teacher_id == Teacher.id))
+    if model is PersonalData:
+        criteria.append(~exists().where(Student.personal_data_id == PersonalData.id))
+        criteria.append(~exists().where(Teacher.personal_data_id == PersonalData.id))
+    return criteria
+
+
+def purge_deleted_batch(
+    session: Session,
+    model: type[SoftDeleteMixin],
+    cutoff: datetime.datetime,
+    batch_size: int,
+) -> int:
+    """
+    Hard-delete up to `batch_size` tombstones of the model deleted before `cutoff`.
+
+    Rows locked by concurrent transactions are skipped. Returns number of deleted rows.
+    """
+    batch = (
+        select(model.id)
+        .where(and_(*purge_criteria(model, cutoff)))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = session.execute(
+        delete(model).where(model.id.in_(batch.scalar_subquery())),
+        execution_options={INCLUDE_DELETED_OPTION: True, "synchronize_session": False},
+    )
+    return result.rowcount
+
@@ -0,0 +1,58 @@
+"""
+SQL statement counting utilities.
+
+Used to check that a code path doesn't emit more statements than expected,
+e.g. that a report doesn't load relationships one object at a time (N+1 queries):
+
+    with statement_budget(session, 2):
+        grades = session.scalars(select(Grade).options(*loader_options(JOINED, Grade.subject)))
+        print([repr(grade) for grade in grades])
+
+Statements are counted on the connection of the session, so the session must be
+bound to a single connection (the default).
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class StatementBudgetExceeded(AssertionError):
+    """Raised when a code path emits more SQL statements than its budget."""
+
+
+@contextmanager
+def capture_statements(session: Session) -> Iterator[list[tuple[str, object]]]:
+    """Collect SQL statements (with parameters) executed by the session connection."""
+    captured = []
+    connection = session.connection()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def statement_budget(
+    session: Session, max_statements: int
+) -> Iterator[list[tuple[str, object]]]:
+    """
+    Fail with `StatementBudgetExceeded` if the block executes more than
+    `max_statements` SQL statements (an `executemany` call counts as one).
+    """
+    with capture_statements(session) as captured:
+        yield captured
+
+    if len(captured) > max_statements:
+        statements = "\n".join(f"    {statement}" for statement, _ in captured)
+        raise StatementBudgetExceeded(
+            f"Expected at most {max_statements} SQL statements, "
+            f"{len(captured)} executed:\n{statements}"
+        )
@@ -0,0 +1,51 @@
+"""
+Grade summary maintenance module.
+
+The `student_subject_stats` summary is kept in sync with grades by database
+triggers (see migration v4): inserted grades are merged incrementally,
+updated and deleted grades make stats of affected students to be recomputed.
+Last lesson pointers of groups in subjects (`group_subject_last_lessons`,
+migration v10) are maintained the same way, but updated and deleted grades make
+only pointers they may have held to be recomputed (migration v12).
+
+Operations not firing triggers on grades (e.g. detaching a partition or writes with
+triggers disabled) should be followed by `refresh_student_subject_stats` and
+`refresh_group_subject_last_lessons`.
+"""
+
+import uuid
+from typing import Iterable
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Session
+
+refresh_stats_query = select(
+    func.refresh_student_subject_stats(
+        bindparam("student_ids", type_=ARRAY(UUID(as_uuid=True)))
+    )
+)
+
+refresh_last_lessons_query = select(
+    func.refresh_group_subject_last_lessons(
+        bindparam("group_ids", type_=ARRAY(UUID(as_uuid=True)))
+    )
+)
+
+
+def refresh_student_subject_stats(
+    session: Session, student_ids: Iterable[uuid.UUID] | None = None
+) -> None:
+    """Recompute summary of the given students, or the whole summary if not given."""
+    if student_ids is not None:
+        student_ids = list(student_ids)
+    session.execute(refresh_stats_query, {"student_ids": student_ids})
+
+
+def refresh_group_subject_last_lessons(
+    session: Session, group_ids: Iterable[uuid.UUID] | None = None
+) -> None:
+    """Recompute last lesson pointers of the given groups, or of all groups if not given."""
+    if group_ids is not None:
+        group_ids = list(group_ids)
+    session.execute(refresh_last_lessons_query, {"group_ids": group_ids})
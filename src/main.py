@@ -0,0 +1,279 @@
+"""
+Command line interface for CRUD operations on all models.
+
+A single row is given by options (e.g. `--id`, `--name`), many rows are read
+from stdin as NDJSON (one JSON object per line) or CSV (with a header) records
+with field names of the model, and written in batches, each in its own transaction.
+`create` upserts rows by id (rows given without id are created), `update` changes
+given fields of rows by id and `remove` soft-deletes rows by id.
+
+`list` writes rows to stdout as CSV or NDJSON. Rows are read page by page,
+ordered by id (keyset pagination, each page in its own short transaction),
+and streamed from a server-side cursor, so memory use stays constant
+even when listing millions of grades.
+
+Arguments:
+    -a, --action <action>   Action: create, list, update or remove.
+    -m, --model <model>     Model: Teacher, Student, Group, Subject or Grade.
+    --id <uuid>             Id of the row to update or remove (or to create).
+    -n, --name <name>       Full name of a teacher or student, name of a group
+                            or title of a subject.
+    --<field> <value>       Other fields, e.g. --group-id, --start-date, --grade.
+                            Groups and subjects of students and grades may be given
+                            by --group-name and --subject-title instead of ids.
+    -f, --format <format>   Format of stdin and stdout records: csv (default) or ndjson.
+    --batch-size <n>        Records written in one transaction (default: 1000).
+    --page-size <n>         Rows listed in one transaction (default: 10000).
+    --after <uuid>          List rows following the given id (continue listing).
+    --limit <n>             Maximum number of listed rows.
+
+Example usage:
+    poetry run python ./src/main.py -a create -m Teacher -n 'Boris Jonson'
+    poetry run python ./src/main.py -a list -m Teacher
+    poetry run python ./src/main.py -a update -m Teacher --id <uuid> -n 'Andry Bezos'
+    poetry run python ./src/main.py -a remove -m Teacher --id <uuid>
+    poetry run python ./src/main.py -a list -m Grade -f ndjson > grades.ndjson
+    poetry run python ./src/main.py -a create -m Grade -f ndjson < grades.ndjson
+    poetry run python ./src/main.py -a update -m Student --id <uuid> --group-name 'Group 1'
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import sys
+import time
+import uuid
+from typing import IO, Iterable, Iterator
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.bulk import chunked
+from database.crud import (
+    MODEL_SPECS,
+    ModelSpec,
+    create_records,
+    iter_page,
+    list_columns,
+    parse_record,
+    remove_records,
+    to_uuid,
+    update_records,
+)
+from database.instrumentation import report_at_exit
+from database.loading import REPORTING_PROFILE
+from database.lookup_cache import cache_stats
+from database.session import session_scope
+
+CREATE_ACTION = "create"
+LIST_ACTION = "list"
+UPDATE_ACTION = "update"
+REMOVE_ACTION = "remove"
+ACTIONS = (CREATE_ACTION, LIST_ACTION, UPDATE_ACTION, REMOVE_ACTION)
+
+CSV_FORMAT = "csv"
+NDJSON_FORMAT = "ndjson"
+FORMATS = (CSV_FORMAT, NDJSON_FORMAT)
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_PAGE_SIZE = 10000
+# Rows fetched from the server-side cursor at once
+STREAM_CHUNK_SIZE = 1000
+
+# Options of fields given on the command line (option destination: field name)
+FIELD_OPTIONS = (
+    "first_name",
+    "last_name",
+    "start_date",
+    "teacher_id",
+    "group_id",
+    "group_name",
+    "student_id",
+    "subject_id",
+    "subject_title",
+    "task_number",
+    "grade",
+    "created_at",
+)
+
+
+def record_from_args(args: argparse.Namespace) -> dict | None:
+    """Record given by command line options, None if no fields are given."""
+    record = {name: getattr(args, name) for name in ("id", *FIELD_OPTIONS)}
+    record = {name: value for name, value in record.items() if value is not None}
+
+    if args.name is not None:
+        if args.model in ("Teacher", "Student"):
+            first_name, _, last_name = args.name.strip().partition(" ")
+            record.update(first_name=first_name, last_name=last_name)
+        else:
+            record["title" if args.model == "Subject" else "name"] = args.name
+    return record or None
+
+
+def iter_input_records(stream: IO[str], fmt: str) -> Iterator[dict]:
+    """Read raw records from NDJSON lines or CSV rows."""
+    if fmt == CSV_FORMAT:
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_parsed_records(
+    spec: ModelSpec, raw_records: Iterable[dict], for_create: bool
+) -> Iterator[dict]:
+    """Parse raw records, failing with the number of an invalid record."""
+    for number, raw in enumerate(raw_records, start=1):
+        try:
+            yield parse_record(spec, raw, for_create=for_create)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid record #{number}: {e}") from None
+
+
+def write_records(spec: ModelSpec, action: str, records: Iterable[dict], batch_size: int) -> int:
+    """Apply the action to records in batches, each in its own transaction."""
+    total = 0
+    for batch in chunked(records, batch_size):
+        with session_scope() as session:
+            if action == CREATE_ACTION:
+                total += create_records(session, spec, batch)
+            elif action == UPDATE_ACTION:
+                total += update_records(session, spec, batch)
+            else:
+                total += remove_records(session, spec, [record["id"] for record in batch])
+    return total
+
+
+def print_cache_stats() -> None:
+    """Print hits and misses of lookup caches used to resolve natural keys."""
+    for name, stats in cache_stats().items():
+        if stats.hits or stats.misses:
+            print(
+                f"    {name} cache: {stats.hits} hits, {stats.misses} misses "
+                f"({stats.hit_ratio:.0%})"
+            )
+
+
+def format_value(value):
+    if isinstance(value, (uuid.UUID, datetime.date)):
+        return value.isoformat() if isinstance(value, datetime.date) else str(value)
+    return value
+
+
+def list_rows(
+    spec: ModelSpec,
+    stream: IO[str],
+    fmt: str,
+    after: uuid.UUID | None,
+    limit: int | None,
+    page_size: int,
+) -> int:
+    """Write live rows ordered by id to the stream, return number of listed rows."""
+    columns = list_columns(spec)
+    writer = csv.writer(stream) if fmt == CSV_FORMAT else None
+    if writer:
+        writer.writerow(columns)
+
+    listed = 0
+    while limit is None or listed < limit:
+        size = page_size if limit is None else min(page_size, limit - listed)
+        page_rows = 0
+        with session_scope(loader_profile=REPORTING_PROFILE) as session:
+            for row in iter_page(session, spec, after, size, STREAM_CHUNK_SIZE):
+                values = [format_value(value) for value in row]
+                if writer:
+                    writer.writerow(values)
+                else:
+                    stream.write(json.dumps(dict(zip(columns, values))) + "\n")
+                after = row.id
+                page_rows += 1
+        listed += page_rows
+        if page_rows < size:
+            break
+    return listed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CRUD operations on models.")
+    parser.add_argument("-a", "--action", choices=ACTIONS, required=True)
+    parser.add_argument("-m", "--model", choices=list(MODEL_SPECS), required=True)
+    parser.add_argument("--id", help="Id of the row.")
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="Full name of a teacher or student, name of a group or title of a subject.",
+    )
+    for name in FIELD_OPTIONS:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name)
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default=CSV_FORMAT,
+        help="Format of records read from stdin and listed to stdout.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of records written in one transaction.",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="Number of rows listed in one transaction.",
+    )
+    parser.add_argument("--after", help="List rows following the given id.")
+    parser.add_argument("--limit", type=int, help="Maximum number of listed rows.")
+    args = parser.parse_args()
+
+    if args.batch_size < 1 or args.page_size < 1:
+        parser.error("--batch-size and --page-size must be positive numbers")
+    if args.limit is not None and args.limit < 0:
+        parser.error("--limit must not be negative")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    report_at_exit()
+    spec = MODEL_SPECS[args.model]
+
+    try:
+        if args.action == LIST_ACTION:
+            after = to_uuid("after", args.after) if args.after else None
+            listed = list_rows(
+                spec, sys.stdout, args.format, after, args.limit, args.page_size
+            )
+            print(f"[INFO] Listed {listed} rows of {args.model}", file=sys.stderr)
+            return
+
+        record = record_from_args(args)
+        if record is None and sys.stdin.isatty():
+            sys.exit(f"❌ No fields given, pass them as options or {args.format} records on stdin")
+        raw_records = [record] if record else iter_input_records(sys.stdin, args.format)
+        records = iter_parsed_records(
+            spec, raw_records, for_create=args.action == CREATE_ACTION
+        )
+        if record:
+            # Parsed eagerly to print the id of the created row
+            records = list(records)
+
+        started = time.perf_counter()
+        total = write_records(spec, args.action, records, args.batch_size)
+        elapsed = time.perf_counter() - started
+        print(f"✅ {args.action.capitalize()}: {total} rows of {args.model} in {elapsed:.2f}s")
+        if record and args.action == CREATE_ACTION:
+            print(f"    id: {records[0]['id']}")
+        print_cache_stats()
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+    except SQLAlchemyError as e:
+        sys.exit(f"❌ Failed to {args.action} {args.model}: {e}")
+
+
+if __name__ == "__main__":
+    main()
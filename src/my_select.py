@@ -0,0 +1,338 @@
+"""
+Analytics queries over the academic database.
+
+Each `select_N()` function runs a single aggregated SQL statement (one round trip)
+and returns lightweight row tuples instead of ORM entities. Relationships such as
+`Student.grades` are never loaded, all aggregation is done by the database
+(sessions of reports use the `raise` loader profile, see `database.loading`).
+
+Averages (top-N students, per group, per teacher and overall) are read from the
+`student_subject_stats` summary, kept in sync with grades by database triggers,
+instead of rescanning all grades. Soft-deleted rows are excluded by the session
+(see `database.soft_delete`), the summary holds only not deleted grades, and its
+rows of soft-deleted students are skipped by `exclude_deleted`.
+
+With the optional [REPORT_CACHE] section, results of queries are cached by
+query name and parameters until grades (or other tables) change, see
+`database.report_cache`.
+
+Queries:
+    select_1   Top students with the highest average grade across all subjects.
+    select_2   Student with the highest average grade in a specific subject.
+    select_3   Average grade per group for a specific subject.
+    select_4   Overall average grade across all grades.
+    select_5   Subjects taught by a specific teacher.
+    select_6   Students in a specific group.
+    select_7   Grades of students in a specific group for a specific subject.
+    select_8   Average grade a specific teacher gives across their subjects.
+    select_9   Subjects taken by a specific student.
+    select_10  Subjects a specific teacher teaches to a specific student.
+    select_11  Grades of students in a specific group for a specific subject
+               at the last lesson.
+
+Example usage:
+    poetry run python ./src/my_select.py
+"""
+
+import uuid
+from typing import Callable
+
+from sqlalchemy import Numeric, Row, cast, func, select
+from sqlalchemy.orm import Session
+
+from database.models import (
+    Grade,
+    Group,
+    GroupSubjectLastLesson as LastLesson,
+    PersonalData,
+    Student,
+    StudentSubjectStats as Stats,
+    Subject,
+    Teacher,
+    group_subject_association_table as group_subject,
+)
+from database.instrumentation import report_at_exit
+from database.loading import REPORTING_PROFILE
+from database.report_cache import cached_report, get_report_cache
+from database.session import session_scope
+from database.soft_delete import exclude_deleted
+
+AVERAGE_GRADE_PRECISION = 2
+
+full_name = (PersonalData.first_name + " " + PersonalData.last_name).label("full_name")
+
+
+def stats_average():
+    """Average grade aggregate over summary rows (total of sums / total of counts)."""
+    return cast(func.sum(Stats.grades_sum), Numeric) / func.sum(Stats.grades_count)
+
+
+def average_grade():
+    """Rounded average grade aggregate over summary rows."""
+    return func.round(stats_average(), AVERAGE_GRADE_PRECISION).label("average_grade")
+
+
+def top_students_by_average(session: Session, limit: int, *criteria) -> list[Row]:
+    """
+    Students with the highest average grade among summary rows matching the criteria.
+
+    Summary rows are aggregated per student first, then soft-deleted students
+    are skipped, so personal data is joined only to the top `limit` rows.
+    """
+    averages = (
+        select(
+            Stats.student_id,
+            stats_average().label("average"),
+        )
+        .where(*criteria)
+        .group_by(Stats.student_id)
+        .subquery()
+    )
+    top_averages = (
+        select(averages)
+        .where(exclude_deleted(Student, averages.c.student_id))
+        .order_by(averages.c.average.desc(), averages.c.student_id)
+        .limit(limit)
+        .subquery()
+    )
+    stmt = (
+        select(
+            Student.id,
+            full_name,
+            func.round(top_averages.c.average, AVERAGE_GRADE_PRECISION).label(
+                "average_grade"
+            ),
+        )
+        .join(top_averages, top_averages.c.student_id == Student.id)
+        .join(PersonalData, PersonalData.id == Student.personal_data_id)
+        .order_by(top_averages.c.average.desc(), Student.id)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_1(session: Session, limit: int = 5) -> list[Row]:
+    """Top students with the highest average grade across all subjects."""
+    return top_students_by_average(session, limit)
+
+
+@cached_report
+def select_2(session: Session, subject_id: uuid.UUID) -> Row | None:
+    """Student with the highest average grade in a specific subject."""
+    rows = top_students_by_average(session, 1, Stats.subject_id == subject_id)
+    return rows[0] if rows else None
+
+
+@cached_report
+def select_3(session: Session, subject_id: uuid.UUID) -> list[Row]:
+    """Average grade per group for a specific subject."""
+    stmt = (
+        select(Group.id, Group.name, average_grade())
+        .join(Stats, Stats.group_id == Group.id)
+        .where(Stats.subject_id == subject_id, exclude_deleted(Student, Stats.student_id))
+        .group_by(Group.id, Group.name)
+        .order_by(Group.name)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_4(session: Session) -> Row:
+    """Overall average grade across all grades."""
+    stmt = select(
+        average_grade(),
+        func.coalesce(func.sum(Stats.grades_count), 0).label("grades_count"),
+    ).where(exclude_deleted(Student, Stats.student_id))
+    return session.execute(stmt).one()
+
+
+@cached_report
+def select_5(session: Session, teacher_id: uuid.UUID) -> list[Row]:
+    """Subjects taught by a specific teacher."""
+    stmt = (
+        select(Subject.id, Subject.title)
+        .where(Subject.teacher_id == teacher_id)
+        .order_by(Subject.title)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_6(session: Session, group_id: uuid.UUID) -> list[Row]:
+    """Students in a specific group."""
+    stmt = (
+        select(Student.id, full_name)
+        .join(PersonalData, PersonalData.id == Student.personal_data_id)
+        .where(Student.group_id == group_id)
+        .order_by(PersonalData.last_name, PersonalData.first_name)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_7(session: Session, group_id: uuid.UUID, subject_id: uuid.UUID) -> list[Row]:
+    """Grades of students in a specific group for a specific subject."""
+    stmt = (
+        select(Student.id, full_name, Grade.task_number, Grade.grade, Grade.created_at)
+        .join(Grade, Grade.student_id == Student.id)
+        .join(PersonalData, PersonalData.id == Student.personal_data_id)
+        .where(Grade.group_id == group_id, Grade.subject_id == subject_id)
+        .order_by(PersonalData.last_name, PersonalData.first_name, Grade.task_number)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_8(session: Session, teacher_id: uuid.UUID) -> Row | None:
+    """Average grade a specific teacher gives across their subjects."""
+    stmt = (
+        select(Teacher.id, full_name, average_grade())
+        .join(PersonalData, PersonalData.id == Teacher.personal_data_id)
+        .join(Subject, Subject.teacher_id == Teacher.id)
+        .join(Stats, Stats.subject_id == Subject.id)
+        .where(Teacher.id == teacher_id, exclude_deleted(Student, Stats.student_id))
+        .group_by(Teacher.id, PersonalData.first_name, PersonalData.last_name)
+    )
+    return session.execute(stmt).first()
+
+
+@cached_report
+def select_9(session: Session, student_id: uuid.UUID) -> list[Row]:
+    """Subjects taken by a specific student (subjects of the student's group)."""
+    stmt = (
+        select(Subject.id, Subject.title)
+        .join(group_subject, group_subject.c.subject_id == Subject.id)
+        .join(Student, Student.group_id == group_subject.c.group_id)
+        .where(Student.id == student_id)
+        .order_by(Subject.title)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_10(
+    session: Session, student_id: uuid.UUID, teacher_id: uuid.UUID
+) -> list[Row]:
+    """Subjects a specific teacher teaches to a specific student."""
+    stmt = (
+        select(Subject.id, Subject.title)
+        .join(group_subject, group_subject.c.subject_id == Subject.id)
+        .join(Student, Student.group_id == group_subject.c.group_id)
+        .where(Student.id == student_id, Subject.teacher_id == teacher_id)
+        .order_by(Subject.title)
+    )
+    return session.execute(stmt).all()
+
+
+@cached_report
+def select_11(session: Session, group_id: uuid.UUID, subject_id: uuid.UUID) -> list[Row]:
+    """Grades of students in a specific group for a specific subject at the last lesson."""
+    # The last lesson is the highest task number graded in the group and subject,
+    # read from the pointer kept by triggers (a primary key lookup, whatever the
+    # number of grades). Grades of the task are found by the task number index
+    # of every partition up to the latest grade, later partitions are pruned
+    # at run time.
+    last_lesson = LastLesson.group_id == group_id, LastLesson.subject_id == subject_id
+    last_task_number = (
+        select(LastLesson.last_task_number).where(*last_lesson).scalar_subquery()
+    )
+    last_graded_at = select(LastLesson.last_graded_at).where(*last_lesson).scalar_subquery()
+    stmt = (
+        select(Student.id, full_name, Grade.task_number, Grade.grade, Grade.created_at)
+        .join(Grade, Grade.student_id == Student.id)
+        .join(PersonalData, PersonalData.id == Student.personal_data_id)
+        .where(
+            Grade.group_id == group_id,
+            Grade.subject_id == subject_id,
+            Grade.task_number == last_task_number,
+            Grade.created_at <= last_graded_at,
+        )
+        .order_by(PersonalData.last_name, PersonalData.first_name)
+    )
+    return session.execute(stmt).all()
+
+
+def sample_query_params(session: Session) -> dict[str, uuid.UUID] | None:
+    """
+    Pick existing ids to use as query parameters.
+
+    Ids are taken from a single grade, so that every query has some data:
+    the student belongs to the group, which studies the subject taught by the teacher.
+    """
+    stmt = (
+        select(
+            Grade.student_id,
+            Grade.group_id,
+            Grade.subject_id,
+            Subject.teacher_id,
+        )
+        .join(Subject, Subject.id == Grade.subject_id)
+        .limit(1)
+    )
+    row = session.execute(stmt).first()
+    if row is None:
+        return None
+    return {
+        "student_id": row.student_id,
+        "group_id": row.group_id,
+        "subject_id": row.subject_id,
+        "teacher_id": row.teacher_id,
+    }
+
+
+def query_calls(params: dict[str, uuid.UUID]) -> dict[str, Callable[[Session], object]]:
+    """Return all queries bound to the given parameters, by query name."""
+    return {
+        "select_1": lambda session: select_1(session),
+        "select_2": lambda session: select_2(session, params["subject_id"]),
+        "select_3": lambda session: select_3(session, params["subject_id"]),
+        "select_4": lambda session: select_4(session),
+        "select_5": lambda session: select_5(session, params["teacher_id"]),
+        "select_6": lambda session: select_6(session, params["group_id"]),
+        "select_7": lambda session: select_7(
+            session, params["group_id"], params["subject_id"]
+        ),
+        "select_8": lambda session: select_8(session, params["teacher_id"]),
+        "select_9": lambda session: select_9(session, params["student_id"]),
+        "select_10": lambda session: select_10(
+            session, params["student_id"], params["teacher_id"]
+        ),
+        "select_11": lambda session: select_11(
+            session, params["group_id"], params["subject_id"]
+        ),
+    }
+
+
+def run_all_queries(session: Session, params: dict[str, uuid.UUID]) -> dict[str, object]:
+    """Run all queries with the given parameters and return their results by name."""
+    return {name: call(session) for name, call in query_calls(params).items()}
+
+
+def main() -> None:
+    report_at_exit()
+    with session_scope(loader_profile=REPORTING_PROFILE) as session:
+        params = sample_query_params(session)
+        if params is None:
+            print("❌ No data found. Please seed the database first.")
+            return
+
+        print("[INFO] Query parameters:")
+        for name, value in params.items():
+            print(f"    {name}: {value}")
+
+        for name, result in run_all_queries(session, params).items():
+            print(f"\n📝 {name}: {globals()[name].__doc__}")
+            rows = result if isinstance(result, list) else [result]
+            for row in rows[:10]:
+                print(f"    {tuple(row) if row is not None else None}")
+            if len(rows) > 10:
+                print(f"    ... {len(rows) - 10} more rows")
+
+    cache = get_report_cache()
+    if cache is not None:
+        stats = cache.stats()
+        print(f"\n[INFO] Report cache: {stats.hits} hits, {stats.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Script to export all tables to files and import them back with PostgreSQL COPY.
+
+`export` writes every table (personal data, groups, teachers, students, subjects,
+group-subject associations and grades) into its own CSV or binary COPY file in
+the given directory, plus `manifest.json`. `import` loads them in foreign key
+order in a single transaction and rebuilds the grades summary.
+See `database.backup` for details.
+
+Arguments:
+    export <directory>          Export tables into the directory.
+        --format <format>       COPY format: csv (default) or binary.
+        --compress              Compress files with gzip.
+    import <directory>          Import tables exported into the directory.
+        --truncate              Empty all tables before importing.
+
+Example usage:
+    poetry run python ./src/scripts/backup_data.py export ./backup --format binary
+    poetry run python ./src/scripts/backup_data.py import ./backup --truncate
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from database.backup import COPY_FORMATS, CSV_FORMAT, export_tables, import_tables
+from database.session import session_scope
+
+
+def print_tables(tables, directory: Path) -> None:
+    for table in tables:
+        size = (directory / table.file).stat().st_size
+        print(f"    {table.name + ':':<27}{table.rows:>12,} rows {size / 2**20:>10.1f} MB")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export and import all tables with COPY.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Export tables into a directory.")
+    export.add_argument("directory", type=Path)
+    export.add_argument("--format", choices=COPY_FORMATS, default=CSV_FORMAT)
+    export.add_argument("--compress", action="store_true", help="Compress files with gzip.")
+
+    import_ = commands.add_parser("import", help="Import tables from a directory.")
+    import_.add_argument("directory", type=Path)
+    import_.add_argument(
+        "--truncate", action="store_true", help="Empty all tables before importing."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    started = time.perf_counter()
+
+    try:
+        with session_scope() as session:
+            if args.command == "export":
+                tables = export_tables(session, args.directory, args.format, args.compress)
+            else:
+                tables = import_tables(session, args.directory, args.truncate)
+    except ValueError as e:
+        sys.exit(f"❌ Invalid export in {args.directory}: {e}")
+    except SQLAlchemyError as e:
+        sys.exit(f"❌ Failed to {args.command} tables: {e}")
+
+    elapsed = time.perf_counter() - started
+    action = "Exported to" if args.command == "export" else "Imported from"
+    print(f"✅ {action} {args.directory} in {elapsed:.2f}s:")
+    print_tables(tables, args.directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Script to check that analytics queries are served by the expected indexes.
+
+Runs every query of `my_select.py`, captures SQL statements it sends to the
+database, and asks PostgreSQL for their plans with `EXPLAIN (FORMAT JSON)`.
+Each query must use its expected index (see `EXPECTED_INDEXES`), queries of
+`SUMMARY_ONLY_QUERIES` must read the summary without scanning grades, and all
+must send a single statement (`QUERY_STATEMENT_BUDGET`), otherwise the script
+exits with a non-zero status, so it can be used as a check in CI.
+
+On a small dataset the planner prefers sequential scans of tiny tables,
+so seed a large dataset first (e.g. `seed.py --mode copy --students 100000`)
+or run with `--force-index-scans`.
+
+Arguments:
+    --force-index-scans   Discourage sequential scans (SET enable_seqscan = off).
+    --verbose             Print plan nodes of every statement.
+
+Example usage:
+    poetry run python ./src/scripts/check_query_plans.py
+    poetry run python ./src/scripts/check_query_plans.py --force-index-scans
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from database.instrumentation import report_at_exit
+from database.loading import REPORTING_PROFILE
+from database.models import Grade, StudentSubjectStats
+from database.partitions import PARTITION_NAME_PATTERN
+from database.report_cache import configure_report_cache
+from database.session import session_scope
+from database.statement_budget import StatementBudgetExceeded, statement_budget
+from my_select import query_calls, sample_query_params
+
+# Index each query is expected to use, queries not listed here are not checked.
+# Queries over small reference tables (subjects, teachers) are served by
+# sequential scans at any data size, so they are not listed.
+EXPECTED_INDEXES = {
+    "select_2": "ix_student_subject_stats_subject_id_group_id",
+    "select_3": "ix_student_subject_stats_subject_id_group_id",
+    "select_6": "ix_students_group_id",
+    "select_7": "ix_grades_subject_id_group_id_task_number_live",
+    "select_8": "ix_student_subject_stats_subject_id_group_id",
+    "select_11": "ix_grades_subject_id_group_id_task_number_live",
+}
+
+# Queries aggregating the whole summary, read by any index or by a sequential scan
+# depending on its size: they are checked to never scan grades instead
+SUMMARY_ONLY_QUERIES = ("select_1",)
+
+# Every query is a single round trip to the database
+QUERY_STATEMENT_BUDGET = 1
+
+
+def parent_index_names(session: Session) -> dict[str, str]:
+    """Map names of partition indexes to names of indexes of partitioned tables."""
+    rows = session.execute(
+        text(
+            """
+            SELECT child.relname, parent.relname
+            FROM pg_inherits
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+            WHERE parent.relkind = 'I'
+            """
+        )
+    )
+    return {child: parent for child, parent in rows}
+
+
+def explain(session: Session, statement: str, parameters) -> dict:
+    """Return JSON plan of the statement (not executed)."""
+    result = session.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    return result.scalar_one()[0]["Plan"]
+
+
+def iter_plan_nodes(plan: dict) -> Iterator[dict]:
+    """Yield all nodes of a plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def scanned_tables(nodes: list[dict]) -> set[str]:
+    """Names of tables scanned by plan nodes, partitions of grades as grades."""
+    return {
+        Grade.__tablename__
+        if PARTITION_NAME_PATTERN.match(node["Relation Name"])
+        else node["Relation Name"]
+        for node in nodes
+        if "Relation Name" in node
+    }
+
+
+def describe_node(node: dict) -> str:
+    description = node["Node Type"]
+    if "Index Name" in node:
+        description += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        description += f" on {node['Relation Name']}"
+    return description
+
+
+def check_query_plans(session: Session, verbose: bool = False) -> list[str]:
+    """Explain all queries, return names of queries not using expected index or budget."""
+    # Plans of queries are checked, not of cached results
+    configure_report_cache(None)
+    params = sample_query_params(session)
+    if params is None:
+        raise RuntimeError("No data found. Please seed the database first.")
+
+    parent_indexes = parent_index_names(session)
+    failed = []
+    for name, call in query_calls(params).items():
+        over_budget = None
+        try:
+            with statement_budget(session, QUERY_STATEMENT_BUDGET) as captured:
+                call(session)
+        except StatementBudgetExceeded as e:
+            over_budget = e
+
+        nodes = [
+            node
+            for statement, parameters in captured
+            for node in iter_plan_nodes(explain(session, statement, parameters))
+        ]
+        # Scans of partitions are reported as scans of the partitioned table index
+        used_indexes = {
+            parent_indexes.get(node["Index Name"], node["Index Name"])
+            for node in nodes
+            if "Index Name" in node
+        }
+
+        expected = EXPECTED_INDEXES.get(name)
+        mismatch = None
+        if name in SUMMARY_ONLY_QUERIES:
+            tables = scanned_tables(nodes)
+            if StudentSubjectStats.__tablename__ not in tables or Grade.__tablename__ in tables:
+                mismatch = (
+                    f"{StudentSubjectStats.__tablename__} scanned "
+                    f"instead of {Grade.__tablename__}"
+                )
+        elif expected and expected not in used_indexes:
+            mismatch = expected
+
+        if over_budget or mismatch:
+            status = "❌"
+            failed.append(name)
+        elif expected is None and name not in SUMMARY_ONLY_QUERIES:
+            status = "➖"
+        else:
+            status = "✅"
+
+        print(f"{status} {name}: {', '.join(sorted(used_indexes)) or 'no indexes'}")
+        if mismatch:
+            print(f"    expected: {mismatch}")
+        if over_budget:
+            print(f"    {over_budget}")
+        if verbose:
+            for node in nodes:
+                print(f"    {describe_node(node)}")
+    return failed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Check that analytics queries use the expected indexes."
+    )
+    parser.add_argument(
+        "--force-index-scans",
+        action="store_true",
+        help="Discourage sequential scans, useful on small datasets.",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print plan nodes of every statement."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    report_at_exit()
+
+    try:
+        with session_scope(loader_profile=REPORTING_PROFILE) as session:
+            if args.force_index_scans:
+                session.execute(text("SET LOCAL enable_seqscan = off"))
+            failed = check_query_plans(session, verbose=args.verbose)
+    except (SQLAlchemyError, RuntimeError) as e:
+        sys.exit(f"❌ Failed to check query plans: {e}")
+
+    if failed:
+        sys.exit(f"❌ Queries failing the check: {', '.join(failed)}")
+    print("✅ All checked queries use expected indexes and single statements.")
+
+
+if __name__ == "__main__":
+    main()
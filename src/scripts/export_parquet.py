@@ -0,0 +1,89 @@
+"""
+Script to export denormalised grade facts into partitioned Parquet files.
+
+Facts of live grades (student, group, subject, teacher, task number, grade and
+creation time) are streamed from the database in chunks and written into
+`<directory>/created_month=YYYY-MM/part-NNNNN.parquet` files.
+See `database.parquet_export` for details.
+
+Requires the optional PyArrow dependency (`poetry install --extras analytics`).
+
+Arguments:
+    directory               Output directory (must be empty or not exist).
+    --chunk-size <n>        Rows fetched and written at once (default: 10000).
+    --rows-per-file <n>     Maximum rows of a Parquet file (default: 1000000).
+    --compression <codec>   Parquet compression: zstd (default), snappy, gzip or none.
+
+Example usage:
+    poetry run python ./src/scripts/export_parquet.py ./exports/grades
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from database.loading import REPORTING_PROFILE
+from database.parquet_export import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_COMPRESSION,
+    DEFAULT_ROWS_PER_FILE,
+    export_grade_facts,
+)
+from database.session import session_scope
+
+COMPRESSIONS = ("zstd", "snappy", "gzip", "none")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export grade facts into Parquet files.")
+    parser.add_argument("directory", type=Path)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of rows fetched and written at once.",
+    )
+    parser.add_argument(
+        "--rows-per-file",
+        type=int,
+        default=DEFAULT_ROWS_PER_FILE,
+        help="Maximum number of rows of a Parquet file.",
+    )
+    parser.add_argument("--compression", choices=COMPRESSIONS, default=DEFAULT_COMPRESSION)
+    args = parser.parse_args()
+
+    if args.chunk_size < 1 or args.rows_per_file < 1:
+        parser.error("--chunk-size and --rows-per-file must be positive numbers")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    try:
+        with session_scope(loader_profile=REPORTING_PROFILE) as session:
+            stats = export_grade_facts(
+                session,
+                args.directory,
+                chunk_size=args.chunk_size,
+                rows_per_file=args.rows_per_file,
+                compression=args.compression,
+            )
+    except (RuntimeError, ValueError) as e:
+        sys.exit(f"❌ {e}")
+    except SQLAlchemyError as e:
+        sys.exit(f"❌ Failed to export grade facts: {e}")
+
+    print(f"✅ Exported {stats.rows:,} grade facts to {args.directory} in {stats.seconds:.2f}s:")
+    print(f"    Files:       {stats.files:>12,}")
+    print(f"    Size:        {stats.bytes / 2**20:>12.1f} MB")
+    print(f"    Throughput:  {stats.rows_per_second:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
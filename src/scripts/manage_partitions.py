@@ -0,0 +1,167 @@
+"""
+Script to maintain monthly partitions of the grades table.
+
+Commands:
+    create      Create missing partitions up to `--months-ahead` months ahead
+                of the current month. Run it regularly (e.g. daily by cron):
+                writes of grades create missing partitions on demand too, but
+                creating a partition locks grades until the write commits.
+    list        List attached partitions with their bounds and estimated rows.
+    archive     Detach partitions of grades created more than `--older-than-months`
+                months ago and move them to the `archive` schema (or drop them
+                with `--drop`). Partitions are detached concurrently, so queries
+                on grades are not blocked. Partitions detached by an earlier
+                run which failed to archive them are archived first.
+
+Arguments:
+    --months-ahead <n>        Months of partitions created ahead (default: 3).
+    --older-than-months <n>   Age of partitions to archive in months (default: 12).
+    --drop                    Drop detached partitions instead of archiving them.
+    --dry-run                 Only list partitions to archive.
+
+Example usage:
+    poetry run python ./src/scripts/manage_partitions.py create --months-ahead 6
+    poetry run python ./src/scripts/manage_partitions.py archive --older-than-months 6
+"""
+
+import argparse
+import datetime
+import sys
+from pathlib import Path
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from database.connection import get_engine
+from database.partitions import (
+    ARCHIVE_SCHEMA,
+    DEFAULT_MONTHS_AHEAD,
+    add_months,
+    archive_detached_partition,
+    create_grades_partitions,
+    detach_grades_partition,
+    list_detached_partitions,
+    list_grades_partitions,
+    partitions_before,
+)
+from database.session import session_scope
+
+DEFAULT_RETENTION_MONTHS = 12
+
+
+def create_partitions(months_ahead: int) -> None:
+    with session_scope() as session:
+        created = create_grades_partitions(session, months_ahead=months_ahead)
+    for name in created:
+        print(f"[INFO] Created partition {name}")
+    print(f"✅ {len(created)} partitions created.")
+
+
+def list_partitions() -> None:
+    with session_scope() as session:
+        partitions = list_grades_partitions(session)
+
+    print(f"📝 Partitions of grades: {len(partitions)}")
+    for partition in partitions:
+        pending = " (detach pending)" if partition.detach_pending else ""
+        print(
+            f"    {partition.name:<18}{partition.start:%Y-%m-%d} .. {partition.end:%Y-%m-%d}"
+            f"{partition.estimated_rows:>12,} rows{pending}"
+        )
+
+
+def archive_partitions(older_than_months: int, drop: bool, dry_run: bool) -> None:
+    this_month = datetime.datetime.now(datetime.timezone.utc).date().replace(day=1)
+    cutoff_month = add_months(this_month, -older_than_months)
+    cutoff = datetime.datetime.combine(
+        cutoff_month, datetime.time(), tzinfo=datetime.timezone.utc
+    )
+
+    with session_scope() as session:
+        detached = list_detached_partitions(session)
+        partitions = partitions_before(list_grades_partitions(session), cutoff)
+
+    if detached:
+        print(f"[INFO] Partitions detached, but not archived by an earlier run: {len(detached)}")
+    print(f"[INFO] Partitions of grades created before {cutoff_month}: {len(partitions)}")
+    if dry_run:
+        for name in [*detached, *(partition.name for partition in partitions)]:
+            print(f"    {name}")
+        return
+
+    destination = "dropped" if drop else f"moved to {ARCHIVE_SCHEMA} schema"
+    # Grades of these partitions are still counted by summaries
+    for name in detached:
+        with session_scope() as session:
+            archive_detached_partition(session, name, drop=drop)
+        print(f"[INFO] Finished archiving of partition {name}, {destination}")
+
+    for partition in partitions:
+        # Every partition is detached and archived in its own short transaction.
+        # If archiving fails, the detached partition is archived by the next run.
+        with get_engine().connect() as connection:
+            detach_grades_partition(
+                connection.execution_options(isolation_level="AUTOCOMMIT"), partition
+            )
+        with session_scope() as session:
+            archive_detached_partition(session, partition.name, drop=drop)
+        print(f"[INFO] Detached partition {partition.name}, {destination}")
+    print(f"✅ {len(detached) + len(partitions)} partitions archived.")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Maintain partitions of grades.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="Create missing future partitions.")
+    create.add_argument(
+        "--months-ahead",
+        type=int,
+        default=DEFAULT_MONTHS_AHEAD,
+        help="Months of partitions created ahead of the current month.",
+    )
+
+    commands.add_parser("list", help="List partitions.")
+
+    archive = commands.add_parser("archive", help="Detach and archive old partitions.")
+    archive.add_argument(
+        "--older-than-months",
+        type=int,
+        default=DEFAULT_RETENTION_MONTHS,
+        help="Age of partitions to archive in months.",
+    )
+    archive.add_argument(
+        "--drop",
+        action="store_true",
+        help="Drop detached partitions instead of moving them to the archive schema.",
+    )
+    archive.add_argument(
+        "--dry-run", action="store_true", help="Only list partitions to archive."
+    )
+    args = parser.parse_args()
+
+    if getattr(args, "months_ahead", 0) < 0:
+        parser.error("--months-ahead must not be negative")
+    if getattr(args, "older_than_months", 1) < 1:
+        parser.error("--older-than-months must be a positive number")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    try:
+        if args.command == "create":
+            create_partitions(args.months_ahead)
+        elif args.command == "list":
+            list_partitions()
+        else:
+            archive_partitions(args.older_than_months, args.drop, args.dry_run)
+    except SQLAlchemyError as e:
+        sys.exit(f"❌ Failed to maintain partitions: {e}")
+
+
+if __name__ == "__main__":
+    main()
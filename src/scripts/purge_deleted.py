@@ -0,0 +1,126 @@
+"""
+Script to hard-delete old soft-deleted rows (tombstones).
+
+Rows soft-deleted (`is_deleted = true`) more than `--older-than-days` days ago are
+deleted in batches, table by table in foreign key order. Every batch is committed
+in its own transaction, so locks are held briefly and the job may be interrupted
+and restarted at any time. Rows still referenced by live rows (e.g. personal data
+of a student, teacher of a subject) are kept.
+
+Arguments:
+    --older-than-days <n>   Retention period of tombstones in days (default: 30).
+    --batch-size <n>        Number of rows deleted in one transaction (default: 1000).
+    --dry-run               Only count tombstones to purge, nothing is deleted
+                            (rows released by purging other tables are not counted).
+
+Example usage:
+    poetry run python ./src/scripts/purge_deleted.py --older-than-days 90
+"""
+
+import argparse
+import datetime
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from database.session import session_scope
+from database.soft_delete import (
+    INCLUDE_DELETED_OPTION,
+    PURGE_ORDER,
+    purge_criteria,
+    purge_deleted_batch,
+)
+
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_BATCH_SIZE = 1000
+
+
+def count_tombstones(cutoff: datetime.datetime) -> dict[str, int]:
+    """Count tombstones to purge by table name."""
+    counts = {}
+    with session_scope() as session:
+        for model in PURGE_ORDER:
+            stmt = select(func.count()).select_from(model).where(
+                and_(*purge_criteria(model, cutoff))
+            )
+            counts[model.__tablename__] = session.execute(
+                stmt, execution_options={INCLUDE_DELETED_OPTION: True}
+            ).scalar_one()
+    return counts
+
+
+def purge_deleted(cutoff: datetime.datetime, batch_size: int) -> dict[str, int]:
+    """Hard-delete tombstones of all tables in batches, return deleted rows by table name."""
+    purged = {}
+    for model in PURGE_ORDER:
+        table_name = model.__tablename__
+        purged[table_name] = 0
+        while True:
+            with session_scope() as session:
+                deleted = purge_deleted_batch(session, model, cutoff, batch_size)
+            purged[table_name] += deleted
+            if deleted:
+                print(f"[INFO] {table_name}: purged {purged[table_name]} rows")
+            if deleted < batch_size:
+                break
+    return purged
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Hard-delete old soft-deleted rows.")
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=DEFAULT_RETENTION_DAYS,
+        help="Retention period of soft-deleted rows in days.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of rows deleted in one transaction.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count rows to purge, without deleting them.",
+    )
+    args = parser.parse_args()
+
+    if args.older_than_days < 0:
+        parser.error("--older-than-days must not be negative")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be a positive number")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        days=args.older_than_days
+    )
+    print(f"[INFO] Purging rows soft-deleted before {cutoff.isoformat(timespec='seconds')}")
+
+    try:
+        if args.dry_run:
+            counts = count_tombstones(cutoff)
+            print("📝 Rows to purge:")
+        else:
+            started = time.perf_counter()
+            counts = purge_deleted(cutoff, args.batch_size)
+            print(f"✅ Purge completed in {time.perf_counter() - started:.2f}s:")
+    except SQLAlchemyError as e:
+        sys.exit(f"❌ Failed to purge soft-deleted rows: {e}")
+
+    for table_name, count in counts.items():
+        print(f"    {table_name + ':':<16}{count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Script to re-key existing grades with time-ordered UUIDv7 keys.
+
+Grades inserted with random UUIDv4 keys get UUIDv7 keys of their `created_at`
+(`uuid_v7_at()`, migration v8), so the primary key index is ordered by time
+like for new grades. Grade keys are not referenced by other tables, so keys of
+other models are kept (both versions work side by side).
+
+Grades are re-keyed in batches in primary key order, each batch in its own
+transaction, so the job may be interrupted and restarted at any time.
+Summary stats are not changed, although the update triggers recompute them
+for students of each batch. Rebuild the indexes afterwards with `--reindex`
+(REINDEX CONCURRENTLY, not blocking writes) to get them densely packed.
+
+Arguments:
+    --batch-size <n>    Number of grades scanned in one transaction (default: 5000).
+    --reindex           Rebuild indexes of grades after re-keying.
+    --dry-run           Only count grades with UUIDv4 keys.
+
+Example usage:
+    poetry run python ./src/scripts/rekey_grades.py --reindex
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+# Add src directory to sys.path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from database.connection import get_engine
+from database.session import session_scope
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Version is the 13th hex digit of a UUID (PostgreSQL 16 has no uuid_extract_version)
+IS_UUID_V4 = "substr(grades.id::text, 15, 1) = '4'"
+
+count_query = text(f"SELECT count(*) FROM grades WHERE {IS_UUID_V4}")
+
+# Scans the next batch of grades by primary key, returns the last scanned key
+# and the number of re-keyed grades. Re-keyed grades may be scanned once more
+# later, they are skipped as their key isn't UUIDv4 anymore.
+rekey_batch_query = text(
+    f"""
+    WITH batch AS (
+        SELECT id, created_at FROM grades
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+    ),
+    rekeyed AS (
+        UPDATE grades SET id = uuid_v7_at(grades.created_at)
+        FROM batch
+        WHERE grades.id = batch.id AND grades.created_at = batch.created_at AND {IS_UUID_V4}
+        RETURNING 1
+    )
+    SELECT
+        (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id,
+        (SELECT count(*) FROM rekeyed) AS rekeyed
+    """
+)
+
+
+def rekey_grades(batch_size: int) -> int:
+    """Re-key grades with UUIDv4 keys in batches, return number of re-keyed grades."""
+    after = uuid.UUID(int=0)
+    total = 0
+    while True:
+        with session_scope() as session:
+            last_id, rekeyed = session.execute(
+                rekey_batch_query, {"after": after, "batch_size": batch_size}
+            ).one()
+        if last_id is None:
+            return total
+        after = last_id
+        total += rekeyed
+        if rekeyed:
+            print(f"[INFO] Re-keyed {total:,} grades")
+
+
+def reindex_grades() -> None:
+    """Rebuild indexes of grades and their partitions without blocking writes."""
+    # REINDEX CONCURRENTLY can't run inside a transaction block
+    with get_engine().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("REINDEX TABLE CONCURRENTLY grades"))
+        connection.execute(text("ANALYZE grades"))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Re-key grades with UUIDv7 keys.")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of grades scanned in one transaction.",
+    )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Rebuild indexes of grades after re-keying.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count grades to re-key.",
+    )
+    args = parser.parse_args()
+
+    if args.batch_size < 1:
+        parser.error("--batch-size must be a positive number")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    try:
+        if args.dry_run:
+            with session_scope() as session:
+                count = session.execute(count_query).scalar_one()
+            print(f"📝 Grades to re-key: {count:,}")
+            return
+
+        started = time.perf_counter()
+        total = rekey_grades(args.batch_size)
+        print(f"✅ Re-keyed {total:,} grades in {time.perf_counter() - started:.2f}s")
+        if args.reindex:
+            started = time.perf_counter()
+            reindex_grades()
+            print(f"✅ Indexes of grades rebuilt in {time.perf_counter() - started:.2f}s")
+    except SQLAlchemyError as e:
+        sys.exit(f"❌ Failed to re-key grades: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,29 +8,86 @@ with grades generated based on configurable rules and realistic randomness.
 Arguments:
     --dry-run       Simulates data generation without saving anything (no database writes).
     --seed <int>    Optional seed value for deterministic output (useful for testing or consistency).
+    --mode <mode>   Write mode: "orm" (default, ORM objects), "bulk" (multi-row inserts)
+                    or "copy" (PostgreSQL COPY). Bulk modes generate UUIDs on the client.
+    --students <n>  Exact number of students to generate (default: random 30-50).
+    --groups <n>    Exact number of groups to generate (default: 3).
+    --chunk-size <n>
+                    Number of rows generated, written and committed at once in bulk modes.
+    --workers <n>   Number of processes seeding groups in parallel in bulk modes.
+    --numpy         Generate grades with NumPy in bulk modes (optional dependency).
 
 Example usage:
     poetry run python app.py --dry-run --seed 42
+    poetry run python ./src/scripts/seed.py --mode copy --students 100000 --groups 300
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import sys
+import time
 from pathlib import Path
 import random
+import uuid
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple
 
 from faker import Faker
 from sqlalchemy.exc import SQLAlchemyError
 
+# Used for type hints only; NumPy is an optional dependency imported on demand
+if TYPE_CHECKING:
+    import numpy as np
+
 # Add src directory to sys.path for imports
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from database.bulk import COPY_METHOD, INSERT_METHOD, WriteStats, chunked
+from database.connection import get_engine, get_pool_status
+from database.ids import new_uuid
+from database.instrumentation import report_at_exit
+from database.partitions import create_grades_partitions
 from database.session import session_scope
-from database.models import Grade, Group, PersonalData, Student, Subject, Teacher
+from database.models import (
+    Grade,
+    Group,
+    PersonalData,
+    Student,
+    Subject,
+    Teacher,
+    group_subject_association_table,
+)
+from utils.constants import MAX_PERSON_NAME_LEN, MIN_NAME_LEN
+from utils.validators import validate_positive_number_column, validate_text_column
 
 faker_locales: list[str] = ["cs_CZ", "de_DE", "pl_PL", "uk_UA"]
 
 fake = Faker()
 
+ORM_MODE = "orm"
+BULK_MODE = "bulk"
+COPY_MODE = "copy"
+SEED_MODES = (ORM_MODE, BULK_MODE, COPY_MODE)
+
+# Bulk write method used for each of the bulk seed modes
+BULK_WRITE_METHODS = {BULK_MODE: INSERT_METHOD, COPY_MODE: COPY_METHOD}
+
+# Number of rows generated, written and committed at once in bulk modes
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Columns of bulk written rows. The is_deleted column has only client side
+# default, so it is always written explicitly.
+PERSONAL_DATA_COLUMNS = ("id", "first_name", "last_name", "is_deleted")
+STUDENT_COLUMNS = ("id", "group_id", "personal_data_id", "is_deleted")
+GRADE_COLUMNS = (
+    "id",
+    "student_id",
+    "group_id",
+    "subject_id",
+    "task_number",
+    "grade",
+    "is_deleted",
+)
+
 
 def assign_students_to_groups(students: list[Student], groups: list[Group]) -> None:
     """Assign students randomly to the given groups."""
@@ -101,6 +158,24 @@ def assign_teachers_to_subjects(
             random.choice(subjects).teacher = teacher
 
 
+def iter_task_scores(
+    subjects: list,
+    max_grades_per_student: int,
+    grade_min: int = 60,
+    grade_max: int = 100,
+    rng: random.Random | None = None,
+) -> Iterator[tuple]:
+    """Yield (subject, task_number, grade_score) tuples for a single student."""
+    # Module level random is used by default to keep seeded output unchanged
+    rng = rng or random
+    tasks_per_group = max_grades_per_student // len(subjects)
+    for subject in subjects:
+        for task_number in range(rng.randint(0, tasks_per_group)):
+            grade_score = rng.randint(grade_min, grade_max)
+            # task_number + 1 to start with task no. 1
+            yield subject, task_number + 1, grade_score
+
+
 def generate_grades(
     students: list[Student],
     max_grades_per_student: int,
@@ -113,21 +188,143 @@ def generate_grades(
         group = student.group
         if not group or not group.subjects:
             continue
-        tasks_per_group = max_grades_per_student // len(group.subjects)
-        for subject in group.subjects:
-            for task_number in range(random.randint(0, tasks_per_group)):
-                grade_score = random.randint(grade_min, grade_max)
-                grade = Grade(
-                    task_number=task_number + 1,  # to start with task no. 1
-                    grade=grade_score,
-                    student=student,
-                    group=group,
-                    subject=subject,
-                )
-                grades.append(grade)
+        for subject, task_number, grade_score in iter_task_scores(
+            group.subjects, max_grades_per_student, grade_min, grade_max
+        ):
+            grade = Grade(
+                task_number=task_number,
+                grade=grade_score,
+                student=student,
+                group=group,
+                subject=subject,
+            )
+            grades.append(grade)
     return grades
 
 
+def iter_grade_rows(
+    student_rows: Iterable[tuple],
+    group_subject_ids: dict[uuid.UUID, list[uuid.UUID]],
+    max_grades_per_student: int,
+    grade_min: int = 60,
+    grade_max: int = 100,
+    rng: random.Random | None = None,
+) -> Iterator[tuple]:
+    """
+    Yield grade rows (id, student_id, group_id, subject_id, task_number, grade)
+    for the given student rows (id, group_id, ...) one by one.
+    """
+    for student_id, group_id, *_ in student_rows:
+        subject_ids = group_subject_ids.get(group_id)
+        if not subject_ids:
+            continue
+        for subject_id, task_number, grade_score in iter_task_scores(
+            subject_ids, max_grades_per_student, grade_min, grade_max, rng=rng
+        ):
+            yield new_uuid(), student_id, group_id, subject_id, task_number, grade_score
+
+
+def import_numpy():
+    """Import optional NumPy dependency on demand, as it is slow to import."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise RuntimeError(
+            "NumPy is required for vectorised grades generation. "
+            "Install it with 'poetry install --extras perf'."
+        ) from e
+    return numpy
+
+
+def generate_group_grade_arrays(
+    number_of_students: int,
+    number_of_subjects: int,
+    max_grades_per_student: int,
+    grade_min: int = 60,
+    grade_max: int = 100,
+    rng: "np.random.Generator | None" = None,
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Generate grades for all students of a group at once using NumPy.
+
+    Follows the same rules as `iter_task_scores`: for each subject a student gets
+    from 0 to `max_grades_per_student // number_of_subjects` tasks numbered from 1,
+    each scored with a grade in [grade_min, grade_max].
+
+    Returns:
+        tuple: Arrays of student indexes, subject indexes, task numbers and grades.
+    """
+    np = import_numpy()
+    rng = rng or np.random.default_rng()
+    tasks_per_group = max_grades_per_student // number_of_subjects
+
+    # Number of tasks for each (student, subject) pair, flattened row by row
+    tasks = rng.integers(
+        0, tasks_per_group, size=(number_of_students, number_of_subjects), endpoint=True
+    ).ravel()
+    pairs = np.repeat(np.arange(tasks.size), tasks)
+
+    # Task numbers restart from 1 for every (student, subject) pair
+    first_task_offsets = np.cumsum(tasks) - tasks
+    task_numbers = np.arange(pairs.size) - first_task_offsets[pairs] + 1
+
+    grades = rng.integers(grade_min, grade_max, size=pairs.size, endpoint=True)
+
+    return (
+        pairs // number_of_subjects,
+        pairs % number_of_subjects,
+        task_numbers,
+        grades,
+    )
+
+
+def iter_grade_rows_numpy(
+    student_rows: Iterable[tuple],
+    group_subject_ids: dict[uuid.UUID, list[uuid.UUID]],
+    max_grades_per_student: int,
+    grade_min: int = 60,
+    grade_max: int = 100,
+    rng: "np.random.Generator | None" = None,
+) -> Iterator[tuple]:
+    """
+    Vectorised alternative of `iter_grade_rows` yielding the same grade rows
+    (id, student_id, group_id, subject_id, task_number, grade).
+
+    Scores and task numbers are generated with a single NumPy call per group.
+    """
+    np = import_numpy()
+    students_by_group: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for student_id, group_id, *_ in student_rows:
+        students_by_group.setdefault(group_id, []).append(student_id)
+
+    for group_id, student_ids in students_by_group.items():
+        subject_ids = group_subject_ids.get(group_id)
+        if not subject_ids:
+            continue
+
+        student_indexes, subject_indexes, task_numbers, grades = (
+            generate_group_grade_arrays(
+                len(student_ids),
+                len(subject_ids),
+                max_grades_per_student,
+                grade_min,
+                grade_max,
+                rng=rng,
+            )
+        )
+        student_column = np.asarray(student_ids, dtype=object)[student_indexes]
+        subject_column = np.asarray(subject_ids, dtype=object)[subject_indexes]
+
+        # Plain Python values, as database drivers can't adapt NumPy scalars
+        for student_id, subject_id, task_number, grade_score in zip(
+            student_column.tolist(),
+            subject_column.tolist(),
+            task_numbers.tolist(),
+            grades.tolist(),
+        ):
+            yield new_uuid(), student_id, group_id, subject_id, task_number, grade_score
+
+
 def generate_groups(min_: int = 1, max_: int = 1) -> list[Group]:
     """Generate a list of Group instances within the specified range."""
     if max_ < min_:
@@ -148,14 +345,13 @@ def generate_groups(min_: int = 1, max_: int = 1) -> list[Group]:
     return groups
 
 
-def generate_personal_data(n: int = 1) -> list[PersonalData]:
-    """Generate a list of PersonalData with localized and gender-specific names."""
+def generate_person_names(n: int = 1) -> Iterator[tuple[str, str]]:
+    """Yield (first_name, last_name) pairs with localized and gender-specific names."""
     if n < 1:
         raise ValueError("Number of entities should be a positive integer number")
 
     faker_locales_cache = {locale: Faker(locale) for locale in faker_locales}
 
-    personal_data_list = []
     for _ in range(n):
         # Randomly choose one of locales
         locale = random.choice(faker_locales)
@@ -170,10 +366,38 @@ def generate_personal_data(n: int = 1) -> list[PersonalData]:
             first_name = faker_localized.first_name_female()
             last_name = faker_localized.last_name_female()
 
-        personal_data_item = PersonalData(first_name=first_name, last_name=last_name)
-        personal_data_list.append(personal_data_item)
+        yield first_name, last_name
+
+
+def generate_personal_data(n: int = 1) -> list[PersonalData]:
+    """Generate a list of PersonalData with localized and gender-specific names."""
+    return [
+        PersonalData(first_name=first_name, last_name=last_name)
+        for first_name, last_name in generate_person_names(n)
+    ]
+
+
+def iter_student_rows(group_id: uuid.UUID, n: int = 1) -> Iterator[tuple]:
+    """
+    Yield student rows (id, group_id, personal_data_id, first_name, last_name)
+    for students of the given group.
+    """
+    for first_name, last_name in generate_person_names(n):
+        yield new_uuid(), group_id, new_uuid(), first_name, last_name
+
+
+def split_students_between_groups(
+    number_of_students: int,
+    number_of_groups: int,
+) -> list[int]:
+    """Randomly assign students to groups and return number of students per group."""
+    if number_of_groups < 1:
+        raise ValueError("Groups list should contain at least one group")
 
-    return personal_data_list
+    students_per_group = [0] * number_of_groups
+    for _ in range(number_of_students):
+        students_per_group[random.randrange(number_of_groups)] += 1
+    return students_per_group
 
 
 def generate_students(min_: int = 1, max_: int = 1) -> list[Student]:
@@ -273,7 +497,12 @@ def print_generated_data_stats(
     print(f"       avg grades per student: {average_grades}")
 
 
-def seed_db(dry_run: bool = False) -> None:
+def seed_db(
+    dry_run: bool = False,
+    students_min: int = 30,
+    students_max: int = 50,
+    groups_number: int = 3,
+) -> None:
     """
     Populate the database with sample data.
 
@@ -285,8 +514,8 @@ def seed_db(dry_run: bool = False) -> None:
 
     # Generate entities
 
-    groups = generate_groups(min_=3, max_=3)
-    students = generate_students(min_=30, max_=50)
+    groups = generate_groups(min_=groups_number, max_=groups_number)
+    students = generate_students(min_=students_min, max_=students_max)
     assign_students_to_groups(students=students, groups=groups)
 
     teachers = generate_teachers(min_=3, max_=5)
@@ -307,6 +536,8 @@ def seed_db(dry_run: bool = False) -> None:
         try:
             print("[INFO] Writing generated data to database...")
             with session_scope() as session:
+                # Grades are created now, their partition must exist
+                create_grades_partitions(session)
                 session.add_all(teachers)
                 session.add_all(subjects)
                 session.add_all(groups)
@@ -320,6 +551,327 @@ def seed_db(dry_run: bool = False) -> None:
             print("✅ Database seeding completed successfully.")
 
 
+def write_reference_data(
+    teachers: list[Teacher],
+    subjects: list[Subject],
+    groups: list[Group],
+    method: str,
+    stats: WriteStats,
+) -> None:
+    """
+    Write teachers, subjects, groups and their associations in a single transaction.
+
+    Parent tables are written before child tables to satisfy foreign keys.
+    Partition of grades created now is ensured to exist before grades are seeded.
+    """
+    with session_scope() as session:
+        create_grades_partitions(session)
+        connection = session.connection()
+        stats.timed_write(
+            connection,
+            PersonalData.__table__,
+            PERSONAL_DATA_COLUMNS,
+            [
+                (pd.id, pd.first_name, pd.last_name, False)
+                for pd in (teacher.personal_data for teacher in teachers)
+            ],
+            method=method,
+        )
+        stats.timed_write(
+            connection,
+            Teacher.__table__,
+            ("id", "personal_data_id", "is_deleted"),
+            [(t.id, t.personal_data.id, False) for t in teachers],
+            method=method,
+        )
+        stats.timed_write(
+            connection,
+            Subject.__table__,
+            ("id", "title", "teacher_id", "is_deleted"),
+            [(s.id, s.title, s.teacher.id, False) for s in subjects],
+            method=method,
+        )
+        stats.timed_write(
+            connection,
+            Group.__table__,
+            ("id", "name", "start_date", "is_deleted"),
+            [(g.id, g.name, g.start_date, False) for g in groups],
+            method=method,
+        )
+        stats.timed_write(
+            connection,
+            group_subject_association_table,
+            ("group_id", "subject_id"),
+            [(g.id, s.id) for g in groups for s in g.subjects],
+            method=method,
+        )
+
+
+def write_students_chunk(
+    student_rows: list[tuple], method: str, stats: WriteStats
+) -> None:
+    """Write a chunk of students with their personal data and commit it."""
+    # Rows bypass ORM validators of personal data, names are validated by columns
+    _, _, personal_data_ids, first_names, last_names = zip(*student_rows)
+    first_names = validate_text_column(
+        "first_name", first_names, min_len=MIN_NAME_LEN, max_len=MAX_PERSON_NAME_LEN
+    )
+    last_names = validate_text_column(
+        "last_name", last_names, min_len=MIN_NAME_LEN, max_len=MAX_PERSON_NAME_LEN
+    )
+    with session_scope() as session:
+        connection = session.connection()
+        stats.timed_write(
+            connection,
+            PersonalData.__table__,
+            PERSONAL_DATA_COLUMNS,
+            [
+                (pd_id, first, last, False)
+                for pd_id, first, last in zip(personal_data_ids, first_names, last_names)
+            ],
+            method=method,
+        )
+        stats.timed_write(
+            connection,
+            Student.__table__,
+            STUDENT_COLUMNS,
+            [(id_, group_id, pd_id, False) for id_, group_id, pd_id, *_ in student_rows],
+            method=method,
+        )
+
+
+def write_grades_chunk(grade_rows: list[tuple], method: str, stats: WriteStats) -> None:
+    """Write a chunk of grades and commit it."""
+    # Rows bypass ORM validators of grades, values are validated by columns
+    *_, task_numbers, grade_scores = zip(*grade_rows)
+    validate_positive_number_column("task_number", task_numbers)
+    validate_positive_number_column("grade", grade_scores)
+    with session_scope() as session:
+        stats.timed_write(
+            session.connection(),
+            Grade.__table__,
+            GRADE_COLUMNS,
+            [(*row, False) for row in grade_rows],
+            method=method,
+        )
+
+
+class GroupShard(NamedTuple):
+    """Unit of parallel bulk seeding: students and grades of a single group."""
+
+    group_id: uuid.UUID
+    subject_ids: list[uuid.UUID]
+    number_of_students: int
+    seed: int
+    method: str
+    chunk_size: int
+    dry_run: bool
+    use_numpy: bool = False
+
+
+def init_seed_worker() -> None:
+    """Drop database connections inherited from the parent process."""
+    # Pooled connections must not be shared between processes,
+    # so each worker opens its own ones.
+    get_engine().dispose(close=False)
+
+
+def seed_group_shard(shard: GroupShard) -> tuple[int, int, WriteStats]:
+    """
+    Generate and write students, personal data and grades of a single group.
+
+    Random generators are reseeded with the seed derived for the group, so the
+    output does not depend on the order of shards or number of workers.
+
+    Returns:
+        tuple: Number of generated students, grades and write statistics.
+    """
+    random.seed(shard.seed)
+    Faker.seed(shard.seed)
+    # Grades use their own generator, so output does not depend on chunk size
+    grades_seed = random.getrandbits(64)
+    if shard.use_numpy:
+        grades_rng = import_numpy().random.default_rng(grades_seed)
+        grade_rows_generator = iter_grade_rows_numpy
+    else:
+        grades_rng = random.Random(grades_seed)
+        grade_rows_generator = iter_grade_rows
+
+    stats = WriteStats()
+    students_count = 0
+    grades_count = 0
+
+    def write_grades_of(student_rows: list[tuple]) -> int:
+        written = 0
+        grade_chunks = chunked(
+            grade_rows_generator(
+                student_rows,
+                {shard.group_id: shard.subject_ids},
+                max_grades_per_student=20,
+                grade_min=60,
+                grade_max=100,
+                rng=grades_rng,
+            ),
+            shard.chunk_size,
+        )
+        for grade_rows in grade_chunks:
+            if not shard.dry_run:
+                write_grades_chunk(grade_rows, shard.method, stats)
+            written += len(grade_rows)
+        return written
+
+    # NumPy draws arrays for all given students at once, so grades are generated
+    # once all students of the group are known: drawing them per chunk of students
+    # would make the output depend on the chunk size
+    group_student_rows: list[tuple] = []
+
+    student_chunks = chunked(
+        iter_student_rows(shard.group_id, shard.number_of_students), shard.chunk_size
+    )
+    for student_rows in student_chunks:
+        if not shard.dry_run:
+            write_students_chunk(student_rows, shard.method, stats)
+        students_count += len(student_rows)
+
+        if shard.use_numpy:
+            # Only (id, group_id) of students are needed for grades
+            group_student_rows.extend(row[:2] for row in student_rows)
+        else:
+            grades_count += write_grades_of(student_rows)
+
+    if group_student_rows:
+        grades_count += write_grades_of(group_student_rows)
+
+    return students_count, grades_count, stats
+
+
+def seed_db_bulk(
+    dry_run: bool = False,
+    mode: str = BULK_MODE,
+    students_min: int = 30,
+    students_max: int = 50,
+    groups_number: int = 3,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    use_numpy: bool = False,
+) -> None:
+    """
+    Populate the database with sample data using bulk writes.
+
+    Unlike `seed_db`, students and grades are generated as plain row tuples
+    with client side generated UUIDs, so no ORM objects and no `RETURNING id`
+    round trips are needed. Rows are streamed through a generator pipeline:
+    each chunk of `chunk_size` rows is written and committed separately, so
+    memory usage does not grow with the size of the dataset.
+
+    Teachers, subjects and groups are written first. Students and grades are
+    then seeded group by group, optionally by a pool of `workers` processes,
+    each with its own database connection and a seed derived per group.
+
+    With `use_numpy` grades are generated by NumPy once per group
+    (different, but still deterministic output for the same seed).
+
+    Note: a failure in the middle of seeding leaves already committed chunks
+    in the database.
+    """
+    print("[INFO] Seeding database with data in bulk mode...")
+
+    # Generate reference entities
+
+    groups = generate_groups(min_=groups_number, max_=groups_number)
+    teachers = generate_teachers(min_=3, max_=5)
+    subjects = generate_subjects(number_of_subjects=8)
+    assign_teachers_to_subjects(teachers=teachers, subjects=subjects)
+
+    assign_subjects_to_groups(
+        groups, subjects, subjects_per_group_min=5, subjects_per_group_max=8
+    )
+
+    # Small reference entities keep using ORM objects, but with client side keys
+    for entity in [*teachers, *subjects, *groups]:
+        entity.id = new_uuid()
+    for teacher in teachers:
+        teacher.personal_data.id = new_uuid()
+
+    number_of_students = random.randint(students_min, students_max)
+    students_per_group = split_students_between_groups(number_of_students, len(groups))
+
+    method = BULK_WRITE_METHODS[mode]
+    shards = [
+        GroupShard(
+            group_id=group.id,
+            subject_ids=[subject.id for subject in group.subjects],
+            number_of_students=group_students,
+            seed=random.getrandbits(64),
+            method=method,
+            chunk_size=chunk_size,
+            dry_run=dry_run,
+            use_numpy=use_numpy,
+        )
+        for group, group_students in zip(groups, students_per_group)
+    ]
+
+    print("📝 Summary of generated reference data to seed:")
+    print(f"    Generated subjects:        {len(subjects)}")
+    print(f"    Generated teachers:        {len(teachers)}")
+    print(f"    Generated groups:          {len(groups)}")
+
+    stats = WriteStats()
+    students_count = 0
+    grades_count = 0
+    started = time.perf_counter()
+
+    try:
+        if not dry_run:
+            print("[INFO] Writing generated data to database...")
+            write_reference_data(teachers, subjects, groups, method, stats)
+
+        if workers > 1:
+            print(f"[INFO] Seeding {len(shards)} groups using {workers} workers...")
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=init_seed_worker
+            ) as executor:
+                results = list(executor.map(seed_group_shard, shards))
+        else:
+            results = [seed_group_shard(shard) for shard in shards]
+
+        for shard_students, shard_grades, shard_stats in results:
+            students_count += shard_students
+            grades_count += shard_grades
+            stats.merge(shard_stats)
+    except SQLAlchemyError as e:
+        print(f"❌ An error occurred while seeding the database: {e}")
+        return
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return
+
+    elapsed = time.perf_counter() - started
+
+    average_grades = round(grades_count / students_count, 2) if students_count else 0.0
+    print("📝 Summary of generated data:")
+    print(f"    Generated students:        {students_count}")
+    print(f"    Students per group:        {students_per_group}")
+    print(f"    Generated grades:          {grades_count}")
+    print(f"       avg grades per student: {average_grades}")
+
+    if not dry_run:
+        stats.print_report()
+        total_rows = sum(stats.rows(table) for table in stats.tables())
+        print(
+            f"    {'total (wall clock):':<27}{total_rows:>12,} rows in {elapsed:8.2f}s "
+            f"({total_rows / elapsed:,.0f} rows/s)"
+        )
+        pool_status = get_pool_status()
+        print(
+            f"🔌 Connection pool of the main process: "
+            f"{pool_status['checkouts']} checkouts, "
+            f"avg wait {pool_status['checkout_wait_avg_ms']} ms, "
+            f"max wait {pool_status['checkout_wait_max_ms']} ms"
+        )
+        print("✅ Database seeding completed successfully.")
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Seed database with generated data.")
 
@@ -338,11 +890,75 @@ def parse_args():
         help="Set a seed for the random number generator for reproducibility.",
     )
 
-    return parser.parse_args()
+    # --mode option (e.g. --mode copy)
+    parser.add_argument(
+        "--mode",
+        choices=SEED_MODES,
+        default=ORM_MODE,
+        help=(
+            "Write mode: 'orm' adds ORM objects through the session, "
+            "'bulk' uses multi-row inserts and 'copy' uses PostgreSQL COPY."
+        ),
+    )
+
+    # --students option (e.g. --students 100000)
+    parser.add_argument(
+        "--students",
+        type=int,
+        default=None,
+        help="Exact number of students to generate (default: random number 30-50).",
+    )
+
+    # --groups option (e.g. --groups 300)
+    parser.add_argument(
+        "--groups",
+        type=int,
+        default=3,
+        help="Number of groups to generate (default: 3).",
+    )
+
+    # --chunk-size option (e.g. --chunk-size 50000)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=(
+            "Number of rows generated, written and committed at once in bulk modes "
+            f"(default: {DEFAULT_CHUNK_SIZE})."
+        ),
+    )
+
+    # --workers option (e.g. --workers 4)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes seeding students and grades of groups in parallel "
+            "in bulk modes (default: 1)."
+        ),
+    )
+
+    # --numpy flag (no arguments, just True if present)
+    parser.add_argument(
+        "--numpy",
+        action="store_true",
+        help="Generate grades with NumPy in bulk modes (requires 'perf' extras).",
+    )
+
+    args = parser.parse_args()
+    if args.numpy:
+        try:
+            import_numpy()
+        except RuntimeError as e:
+            parser.error(str(e))
+
+    return args
 
 
 def main() -> None:
     args = parse_args()
+    report_at_exit()
 
     # Apply seed if provided
     if args.seed is not None:
@@ -361,7 +977,28 @@ def main() -> None:
     if args.dry_run:
         print("[INFO] Running in dry-run mode. No changes will be saved.")
 
-    seed_db(dry_run=args.dry_run)
+    students_min, students_max = (
+        (30, 50) if args.students is None else (args.students, args.students)
+    )
+
+    if args.mode == ORM_MODE:
+        seed_db(
+            dry_run=args.dry_run,
+            students_min=students_min,
+            students_max=students_max,
+            groups_number=args.groups,
+        )
+    else:
+        seed_db_bulk(
+            dry_run=args.dry_run,
+            mode=args.mode,
+            students_min=students_min,
+            students_max=students_max,
+            groups_number=args.groups,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            use_numpy=args.numpy,
+        )
 
 
 if __name__ == "__main__":
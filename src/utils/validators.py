@@ -3,9 +3,16 @@ Validation utility functions for model various field types.
 
 These validators are intended for use with SQLAlchemy's @validates decorators
 to enforce domain-level validation rules across models.
+
+Column validators check whole columns of bulk written rows (lists, tuples or
+NumPy arrays) at once with the same rules and error messages, so bulk loaders
+bypassing ORM objects validate a chunk in one pass. Valid columns are checked
+by a few C-level passes (min/max of lengths or values), failing columns are
+validated value by value to report the first invalid one.
 """
 
 import datetime
+from typing import Sequence
 
 
 def validate_text_field(
@@ -59,3 +66,41 @@ def validate_positive_number(key: str, value: int | str) -> int:
         raise ValueError(f"Field '{key}' must be a positive integer, got {value}")
 
     return value
+
+
+def validate_text_column(
+    key: str, values: Sequence[str], min_len: int = 0, max_len: int = 0
+) -> list[str]:
+    """Validate text fields of a column, return their normalized (stripped) values."""
+    if max_len < min_len:
+        raise ValueError(f"Invalid configuration for '{key}': max_len < min_len")
+
+    if None not in values:
+        stripped = [value.strip() for value in values]
+        lengths = list(map(len, stripped))
+        if not lengths or (min(lengths) >= max(min_len, 1) and max(lengths) <= max_len):
+            return stripped
+
+    # Raise the error of the first invalid value
+    return [validate_text_field(key, value, min_len, max_len) for value in values]
+
+
+def validate_positive_number_column(key: str, values: Sequence[int | str]) -> Sequence[int]:
+    """
+    Validate that all values of a column are positive integers.
+
+    Integer NumPy arrays are checked by a vectorised comparison and returned as is.
+    Columns of numeric strings are converted to lists of integers.
+    """
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and dtype.kind in "iu":
+        invalid = values <= 0
+        if invalid.any():
+            # Raise the error of the first invalid value
+            validate_positive_number(key, int(values[invalid.argmax()]))
+        return values
+
+    if set(map(type, values)) <= {int} and (not values or min(values) > 0):
+        return values
+
+    return [validate_positive_number(key, value) for value in values]